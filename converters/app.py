@@ -1,16 +1,22 @@
 """Test."""
 from __future__ import annotations
 
+import argparse
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 import json
 import logging
 import os
 import sys
 
+from converters.helpers.enhanced_json_encoder import EnhancedJSONEncoder
+from converters.helpers.gap_report import GapReport, analyze_dump, initialize_worker
 from converters.mappers.countries import TuyaCountries
 from converters.mappers.devices import TuyaDevices
 from converters.mappers.ha import HAMapper
 from converters.mappers.units import TuyaUnits
+from custom_components.tuya_ce.helpers.catalog import CATALOG_VALUES, encode_catalog
+from custom_components.tuya_ce.helpers.const import CATALOG_CONFIG
 
 DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
 
@@ -50,6 +56,50 @@ class App:
 
         _LOGGER.info(json.dumps(result))
 
+    async def gap_analysis_directory(self, directory: str, output: str, report: str, workers: int | None):
+        """Perform gap analysis for all diagnostic dumps of a directory, Returns None."""
+        file_paths = sorted(
+            os.path.join(directory, file_name)
+            for file_name in os.listdir(directory)
+            if file_name.endswith(".json")
+        )
+
+        _LOGGER.info(f"Analyzing {len(file_paths)} diagnostic dumps, Workers: {workers or os.cpu_count()}")
+
+        mapper = HAMapper()
+        await mapper.load_configurations()
+
+        gap_report = GapReport(mapper)
+
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker) as executor, \
+                open(output, "w") as output_file:
+            tasks = [
+                loop.run_in_executor(executor, analyze_dump, file_path)
+                for file_path in file_paths
+            ]
+
+            for task in asyncio.as_completed(tasks):
+                results = await task
+
+                for result in results:
+                    gap_report.add(result)
+
+                    output_file.write(f"{json.dumps(result, cls=EnhancedJSONEncoder)}\n")
+
+        report_data = gap_report.to_dict()
+
+        with open(report, "w") as report_file:
+            report_file.write(json.dumps(report_data, cls=EnhancedJSONEncoder, indent=4))
+
+        _LOGGER.info(
+            f"Gap analysis completed, "
+            f"Devices: {report_data.get('devices')}, "
+            f"Missing categories: {len(report_data.get('categories'))}, "
+            f"Missing keys: {len(report_data.get('keys'))}"
+        )
+
     async def update_configuration_files(self):
         """Update configuration files, Returns None."""
         _LOGGER.info("Update configuration files")
@@ -63,23 +113,69 @@ class App:
         for mapper in mappers:
             mapper.save()
 
+        configurations = {mapper.name: json.loads(mapper.to_json(None)) for mapper in mappers}
+
+        self.save_catalog(configurations)
+
+    @staticmethod
+    def save_catalog(configurations: dict):
+        """Save all configuration files as a compact catalog, Returns None."""
+        catalog = encode_catalog(configurations)
+        data = json.dumps(catalog, separators=(",", ":"))
+
+        with open(f"../config/{CATALOG_CONFIG}.json", "w") as outfile:
+            outfile.write(data)
+
+        _LOGGER.info(f"Catalog saved, Values: {len(catalog.get(CATALOG_VALUES))}, Size: {len(data)}")
+
     async def terminate(self):
         """Do termination of API, Returns None."""
         _LOGGER.info("Terminate")
 
 
-instance = App()
-loop = asyncio.new_event_loop()
+def _get_arguments():
+    parser = argparse.ArgumentParser(description="Tuya CE configuration tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("update", help="Update configuration files")
+
+    gap_analysis_parser = subparsers.add_parser(
+        "gap-analysis", help="Perform gap analysis of a single diagnostic dump from the input directory"
+    )
+    gap_analysis_parser.add_argument("file_name")
+
+    gap_report_parser = subparsers.add_parser(
+        "gap-report", help="Perform gap analysis of all diagnostic dumps in a directory"
+    )
+    gap_report_parser.add_argument("directory")
+    gap_report_parser.add_argument("--output", default="gaps.jsonl", help="Per device results (JSONL)")
+    gap_report_parser.add_argument("--report", default="gaps_report.json", help="Merged and ranked gaps")
+    gap_report_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _get_arguments()
+
+    instance = App()
+    loop = asyncio.new_event_loop()
 
-try:
-    # loop.run_until_complete(instance.update_configuration_files())
+    try:
+        if args.command == "update":
+            loop.run_until_complete(instance.update_configuration_files())
 
-    loop.run_until_complete(instance.gap_analysis("t22.json"))
+        elif args.command == "gap-analysis":
+            loop.run_until_complete(instance.gap_analysis(args.file_name))
 
+        elif args.command == "gap-report":
+            loop.run_until_complete(
+                instance.gap_analysis_directory(args.directory, args.output, args.report, args.workers)
+            )
 
-except KeyboardInterrupt:
-    _LOGGER.info("Aborted")
-    loop.run_until_complete(instance.terminate())
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
+        loop.run_until_complete(instance.terminate())
 
-except Exception as rex:
-    _LOGGER.error(f"Error: {rex}")
+    except Exception as rex:
+        _LOGGER.error(f"Error: {rex}")
@@ -0,0 +1,147 @@
+"""Gap analysis of diagnostic dumps."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+
+from converters.mappers.ha import HAMapper
+
+_LOGGER = logging.getLogger(__name__)
+
+_mapper: HAMapper | None = None
+
+
+def initialize_worker():
+    """Load the configuration files once per worker process."""
+    global _mapper
+
+    _mapper = HAMapper()
+
+    asyncio.run(_mapper.load_configurations())
+
+
+def analyze_dump(file_path: str) -> list[dict]:
+    """Perform gap analysis for all devices of a diagnostic dump, Returns result per device."""
+    results = []
+
+    try:
+        with open(file_path) as file:
+            json_data = json.load(file)
+
+        data = json_data.get("data", {})
+
+        # Device diagnostics hold a single device, config entry diagnostics hold all of them
+        diagnostic_devices = data.get("devices", [data] if "category" in data else [])
+
+        for diagnostic_device in diagnostic_devices:
+            device_result = _mapper.perform_device_gap_analysis(diagnostic_device)
+
+            results.append({
+                "file": file_path,
+                "name": diagnostic_device.get("name"),
+                "category": diagnostic_device.get("category"),
+                "product_id": diagnostic_device.get("product_id"),
+                "product_name": diagnostic_device.get("product_name"),
+                "gaps": device_result.get("gaps"),
+                "unsupported_devices": device_result.get("unsupported_devices"),
+            })
+
+    except Exception as ex:
+        exc_type, exc_obj, tb = sys.exc_info()
+        line_number = tb.tb_lineno
+
+        _LOGGER.error(f"Failed to analyze {file_path}, Error: {ex}, Line: {line_number}")
+
+    return results
+
+
+class GapReport:
+    """Merge gap analysis results into a deduplicated, ranked report."""
+
+    def __init__(self, mapper: HAMapper):
+        self._mapper = mapper
+        self._categories: dict[str, dict] = {}
+        self._keys: dict[tuple[str, str, str], dict] = {}
+        self._devices = 0
+
+    def add(self, result: dict):
+        self._devices += 1
+
+        category = result.get("category")
+        product_name = result.get("product_name")
+
+        for unsupported_category in result.get("unsupported_devices", {}):
+            self._add_category(unsupported_category, product_name, True)
+
+        for category_key, category_data in result.get("gaps", {}).items():
+            if category_key not in self._mapper.devices:
+                self._add_category(category_key, product_name, False)
+
+            for domain_key, domain_data in category_data.items():
+                for key, key_data in domain_data.items():
+                    item_key = (category_key, domain_key, key)
+
+                    item = self._keys.get(item_key)
+
+                    if item is None:
+                        item = {
+                            "category": category_key,
+                            "domain": domain_key,
+                            "key": key,
+                            "count": 0,
+                            "products": set(),
+                            "data": key_data,
+                        }
+
+                        self._keys[item_key] = item
+
+                    item["count"] += 1
+                    item["products"].add(product_name or category)
+
+    def to_dict(self) -> dict:
+        categories = [
+            {**category_data, "products": sorted(category_data["products"])}
+            for category_data in sorted(
+                self._categories.values(), key=lambda c: (-c["count"], c["category"])
+            )
+        ]
+
+        keys = [
+            {
+                **key_data,
+                "products": sorted(key_data["products"]),
+                "matches": self._mapper.get_components(key_data["key"]),
+            }
+            for key_data in sorted(
+                self._keys.values(),
+                key=lambda k: (-k["count"], k["category"], k["domain"], k["key"])
+            )
+        ]
+
+        result = {
+            "devices": self._devices,
+            "categories": categories,
+            "keys": keys,
+        }
+
+        return result
+
+    def _add_category(self, category: str, product_name: str | None, unsupported: bool):
+        item = self._categories.get(category)
+
+        if item is None:
+            item = {
+                "category": category,
+                "unsupported": unsupported,
+                "count": 0,
+                "products": set(),
+            }
+
+            self._categories[category] = item
+
+        item["count"] += 1
+
+        if product_name is not None:
+            item["products"].add(product_name)
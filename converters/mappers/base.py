@@ -14,12 +14,21 @@ class TuyaBaseConverter:
         self._data = data_provider()
         self._name = name
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     def all(self) -> list | dict:
         return self._data
 
+    def to_json(self, indent: int | None = 4) -> str:
+        data = json.dumps(self._data, cls=EnhancedJSONEncoder, indent=indent)
+
+        return data
+
     def save(self):
-        data = json.dumps(self._data, cls=EnhancedJSONEncoder, indent=4)
+        data = self.to_json()
 
         with open(f"../config/{self._name}.json", "w") as outfile:
             outfile.write(data)
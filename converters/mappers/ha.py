@@ -7,6 +7,7 @@ import os
 import sys
 
 from custom_components.tuya_ce.helpers.const import *
+from custom_components.tuya_ce.helpers.util import get_components_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,6 +15,7 @@ _LOGGER = logging.getLogger(__name__)
 class HAMapper:
     def __init__(self):
         self._data = {}
+        self._components_index = {}
 
         self._complex_platforms = [
             Platform.ALARM_CONTROL_PANEL,
@@ -62,11 +64,19 @@ class HAMapper:
         for config_file in TUYA_CONFIGURATIONS:
             self._data[config_file] = self._get_data(config_file)
 
+        self._components_index = get_components_index(
+            self.devices, lambda p: p in self._complex_platforms
+        )
+
     def perform_device_gap_analysis(self, diagnostic_device_data: dict):
         unsupported_devices = self._get_device_unsupported_categories(diagnostic_device_data)
         _LOGGER.info(f"Unsupported devices: {json.dumps(unsupported_devices)}")
 
-        devices = self._get_device(diagnostic_device_data)
+        category = diagnostic_device_data.get("category")
+        category_data = self._get_device(diagnostic_device_data)
+
+        # Gaps are identified per category, same as for the integration's diagnostics
+        devices = {category: category_data} if len(category_data.keys()) > 0 else {}
         _LOGGER.info(f"Devices: {json.dumps(devices)}")
 
         gaps = self._get_gaps(devices)
@@ -256,22 +266,11 @@ class HAMapper:
 
             _LOGGER.error(f"Failed to perform gap analysis, Error: {ex}, Line: {line_number}")
 
-    def _get_components(self, key: str):
-        components = {}
-        for category_key in self.devices:
-            category_data = self.devices.get(category_key, {})
-            for domain_key in category_data:
-                if domain_key not in self._complex_platforms:
-                    continue
-
-                domain_data = category_data.get(domain_key)
-
-                for domain_item in domain_data:
-                    if domain_item.get("key") == key:
-                        if domain_key not in components:
-                            components[domain_key] = []
+    def get_components(self, key: str):
+        return self._get_components(key)
 
-                        components[domain_key].append(domain_item)
+    def _get_components(self, key: str):
+        components = self._components_index.get(key, {})
 
         return components
 
@@ -284,7 +283,6 @@ class HAMapper:
 
     @staticmethod
     def _get_relevant_domains(domain):
-        domains = TUYA_RELATED_DOMAINS.get(domain, [])
-        domains.append(domain)
+        domains = [*TUYA_RELATED_DOMAINS.get(domain, []), domain]
 
         return domains
@@ -2,15 +2,10 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import requests
-from tuya_iot import (
-    AuthType,
-    TuyaDeviceManager,
-    TuyaHomeManager,
-    TuyaOpenAPI,
-    TuyaOpenMQ,
-)
+from tuya_iot import AuthType, TuyaHomeManager
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -21,25 +16,35 @@ from homeassistant.helpers.entity_registry import RegistryEntry
 from .helpers.const import (
     CONF_ACCESS_ID,
     CONF_ACCESS_SECRET,
+    CONF_AGGREGATES,
     CONF_APP_TYPE,
     CONF_AUTH_TYPE,
     CONF_COUNTRY_CODE,
     CONF_ENDPOINT,
+    CONF_ENERGY_INTEGRATION,
+    CONF_MIGRATION_VERSION,
     CONF_PASSWORD,
     CONF_PROJECT_TYPE,
+    CONF_STATUS_HISTORY,
     CONF_USERNAME,
     DEVICE_CONFIG_MANAGER,
     DOMAIN,
+    MIGRATION_VERSION,
+    MQ_DECODE_WORKERS,
+    MQ_DECODE_WORKERS_MIN_DEVICES,
     PLATFORMS,
     SERVICE_UPDATE_REMOTE_CONFIGURATION,
+    STATUS_HISTORY_SIZE,
     TUYA_DISCOVERY_NEW,
     TUYA_HA_SIGNAL_UPDATE_ENTITY,
 )
 from .helpers.tuya_legacy_mapping import TUYA_LEGACY_CATEGORIES, TUYA_LEGACY_MAPPING
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
-from .managers.tuya_device_listener import DeviceListener
 from .models.ha_tuya_data import HomeAssistantTuyaData
 
+if TYPE_CHECKING:
+    from tuya_iot import TuyaDeviceManager
+
 _LOGGER = logging.getLogger(__package__)
 
 
@@ -47,6 +52,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Async setup hass config entry."""
     _LOGGER.debug("Setup platform")
 
+    # Imported once an entry is set up, the MQ client pulls in its crypto, MQTT and JSON libraries
+    from .managers.tuya_api_pool import TuyaApiPool
+    from .managers.tuya_device_listener import DeviceListener
+    from .managers.tuya_device_manager import DeviceManager
+    from .managers.tuya_mq import TuyaMQ
+    from .managers.tuya_specification_loader import TuyaSpecificationLoader
+
     hass.data.setdefault(DOMAIN, {})
 
     _LOGGER.debug("Loading configuration manager")
@@ -61,7 +73,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.config_entries.async_update_entry(entry, data=data)
 
     auth_type = AuthType(entry.data[CONF_AUTH_TYPE])
-    api = TuyaOpenAPI(
+    api_pool = TuyaApiPool.get_instance(hass)
+    api = api_pool.create_api(
+        entry.entry_id,
         endpoint=entry.data[CONF_ENDPOINT],
         access_id=entry.data[CONF_ACCESS_ID],
         access_secret=entry.data[CONF_ACCESS_SECRET],
@@ -84,32 +98,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 entry.data[CONF_APP_TYPE],
             )
     except requests.exceptions.RequestException as err:
+        api_pool.release(entry.entry_id)
+
         raise ConfigEntryNotReady(err) from err
 
     if response.get("success", False) is False:
+        api_pool.release(entry.entry_id)
+
         raise ConfigEntryNotReady(response)
 
-    tuya_mq = TuyaOpenMQ(api)
+    tuya_mq = TuyaMQ(api)
     tuya_mq.start()
 
     device_ids: set[str] = set()
-    device_manager = TuyaDeviceManager(api, tuya_mq)
+    device_manager = DeviceManager(api, tuya_mq)
+
+    if entry.options.get(CONF_STATUS_HISTORY, False):
+        device_manager.enable_status_history(STATUS_HISTORY_SIZE)
+
+    # Specifications are shared by the devices of a product
+    specification_loader = TuyaSpecificationLoader(hass, entry.entry_id)
+    await specification_loader.async_load()
+
+    device_manager.specification_loader = specification_loader
+
     home_manager = TuyaHomeManager(api, tuya_mq, device_manager)
     listener = DeviceListener(hass, device_manager, device_ids)
     device_manager.add_device_listener(listener)
 
-    hass.data[DOMAIN][entry.entry_id] = HomeAssistantTuyaData(
-        device_listener=listener,
-        device_manager=device_manager,
-        home_manager=home_manager,
-    )
-
     # Get devices & clean up device entities
     await hass.async_add_executor_job(home_manager.update_device_cache)
-    await cleanup_device_registry(hass, device_manager)
 
-    # Migrate old unique_ids to the new format
-    async_migrate_entities_unique_ids(hass, entry, device_manager)
+    energy_manager = None
+
+    # Power DPs of all devices are integrated together, once per state write window
+    if entry.options.get(CONF_ENERGY_INTEGRATION, False):
+        from .managers.tuya_energy_manager import TuyaEnergyManager
+
+        energy_manager = TuyaEnergyManager(hass, entry.entry_id, device_manager)
+
+        await energy_manager.async_load()
+
+        entry.async_on_unload(listener.async_add_batch_listener(energy_manager.async_update_devices))
+
+    # Decode MQ messages of large deployments on a worker pool
+    if len(device_manager.device_map) >= MQ_DECODE_WORKERS_MIN_DEVICES:
+        tuya_mq.start_decode_workers(MQ_DECODE_WORKERS)
+
+    await cleanup_device_registry(hass, entry, device_manager)
+
+    # Migrate old unique_ids to the new format, once per config entry
+    if entry.data.get(CONF_MIGRATION_VERSION, 0) < MIGRATION_VERSION:
+        async_migrate_entities_unique_ids(hass, entry, device_manager)
+
+        data = {**entry.data, CONF_MIGRATION_VERSION: MIGRATION_VERSION}
+        hass.config_entries.async_update_entry(entry, data=data)
 
     # Register known device IDs
     device_registry = dr.async_get(hass)
@@ -123,19 +166,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         device_ids.add(device.id)
 
+    aggregate_manager = None
+
+    # Aggregates grouped by area require the device registry entries
+    if aggregates := entry.options.get(CONF_AGGREGATES):
+        from .managers.tuya_aggregate_manager import TuyaAggregateManager
+
+        aggregate_manager = TuyaAggregateManager(hass, entry.entry_id, device_manager, aggregates)
+        aggregate_manager.async_load(listener)
+
+    hass.data[DOMAIN][entry.entry_id] = HomeAssistantTuyaData(
+        device_listener=listener,
+        device_manager=device_manager,
+        home_manager=home_manager,
+        energy_manager=energy_manager,
+        aggregate_manager=aggregate_manager,
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def cleanup_device_registry(
-    hass: HomeAssistant, device_manager: TuyaDeviceManager
+    hass: HomeAssistant, entry: ConfigEntry, device_manager: TuyaDeviceManager
 ) -> None:
     """Remove deleted device registry entry if there are no remaining entities."""
     device_registry = dr.async_get(hass)
-    for dev_id, device_entry in list(device_registry.devices.items()):
+    device_entries = dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+
+    for device_entry in device_entries:
         for item in device_entry.identifiers:
-            if DOMAIN == item[0] and item[1] not in device_manager.device_map:
-                device_registry.async_remove_device(dev_id)
+            # The virtual device of the config entry holds the counter sensors
+            if DOMAIN == item[0] and item[1] not in device_manager.device_map and item[1] != entry.entry_id:
+                device_registry.async_remove_device(device_entry.id)
                 break
 
 
@@ -175,9 +245,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unloading the Tuya platforms."""
     unload = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload:
+        from .managers.tuya_api_pool import TuyaApiPool
+
+        TuyaConfigurationManager.get_instance(hass).async_unload_entry(entry)
+        TuyaApiPool.get_instance(hass).release(entry.entry_id)
+
         hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
         hass_data.device_manager.mq.stop()
         hass_data.device_manager.remove_device_listener(hass_data.device_listener)
+        hass_data.device_listener.async_cancel_pending_devices()
+
+        if hass_data.energy_manager is not None:
+            await hass_data.energy_manager.async_unload()
+
+        if hass_data.aggregate_manager is not None:
+            hass_data.aggregate_manager.async_unload()
 
         hass.data[DOMAIN].pop(entry.entry_id)
         if not hass.data[DOMAIN]:
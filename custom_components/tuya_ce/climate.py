@@ -24,10 +24,20 @@ from homeassistant.const import TEMP_CELSIUS, TEMP_FAHRENHEIT, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .helpers.const import TUYA_HVAC_TO_HA
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
 from .models.base import IntegerTypeData, TuyaEntity
 
+TUYA_HVAC_TO_HA = {
+    "auto": HVACMode.HEAT_COOL,
+    "cold": HVACMode.COOL,
+    "freeze": HVACMode.COOL,
+    "heat": HVACMode.HEAT,
+    "hot": HVACMode.HEAT,
+    "manual": HVACMode.HEAT_COOL,
+    "wet": HVACMode.DRY,
+    "wind": HVACMode.FAN_ONLY,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
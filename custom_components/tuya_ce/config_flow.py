@@ -1,32 +1,48 @@
 """Config flow for Tuya."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from typing import Any
 
 from tuya_iot import AuthType, TuyaOpenAPI
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
 
 from .helpers.const import (
+    AGGREGATE_CATEGORIES,
+    AGGREGATE_CODE,
+    AGGREGATE_FUNCTION,
+    AGGREGATE_FUNCTION_SUM,
+    AGGREGATE_FUNCTIONS,
+    AGGREGATE_GROUP_BY_AREA,
+    AGGREGATE_NAME,
+    AGGREGATE_VALUE,
+    APP_TYPES,
     CONF_ACCESS_ID,
     CONF_ACCESS_SECRET,
+    CONF_ADD_AGGREGATE,
+    CONF_AGGREGATES,
     CONF_APP_TYPE,
     CONF_AUTH_TYPE,
+    CONF_COUNTER_SENSORS,
     CONF_COUNTRY_CODE,
     CONF_ENDPOINT,
+    CONF_ENERGY_INTEGRATION,
     CONF_PASSWORD,
+    CONF_STATUS_HISTORY,
     CONF_USERNAME,
     DEVICE_CONFIG_MANAGER,
     DOMAIN,
-    SMART_LIFE_APP,
     TUYA_RESPONSE_CODE,
     TUYA_RESPONSE_MSG,
     TUYA_RESPONSE_PLATFORM_URL,
     TUYA_RESPONSE_RESULT,
     TUYA_RESPONSE_SUCCESS,
-    TUYA_SMART_APP,
 )
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
 
@@ -38,6 +54,11 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         self._tuya_device_configuration_manager: TuyaConfigurationManager | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> TuyaOptionsFlow:
+        return TuyaOptionsFlow(config_entry)
+
     async def load_tuya_device_configuration_manager(self):
         if DOMAIN not in self.hass.data:
             _LOGGER.debug("Step user")
@@ -54,8 +75,8 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return countries
 
-    def _try_login(self, user_input: dict[str, Any]) -> tuple[dict[Any, Any], dict[str, Any]]:
-        """Try login."""
+    async def _try_login(self, user_input: dict[str, Any]) -> tuple[dict[Any, Any], dict[str, Any]]:
+        """Try login, starting with the app type that succeeded last time for the endpoint."""
         country = [
             country
             for country in self.countries
@@ -72,13 +93,68 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_COUNTRY_CODE: country.get("country_code"),
         }
 
-        for app_type in ("", TUYA_SMART_APP, SMART_LIFE_APP):
-            data[CONF_APP_TYPE] = app_type
-            if data[CONF_APP_TYPE] == "":
-                data[CONF_AUTH_TYPE] = AuthType.CUSTOM
-            else:
-                data[CONF_AUTH_TYPE] = AuthType.SMART_HOME
+        manager = self._tuya_device_configuration_manager
+        endpoint = data[CONF_ENDPOINT]
+
+        app_types = list(APP_TYPES)
+        app_type = await manager.async_get_login_app_type(endpoint)
+
+        result = None
+
+        if app_type in app_types:
+            app_types.remove(app_type)
+
+            result = await self.hass.async_add_executor_job(self._login, data, app_type)
+
+        if result is None or not result[0].get(TUYA_RESPONSE_SUCCESS, False):
+            result = await self._async_login_any(data, app_types)
+
+        response, data = result
+
+        if response.get(TUYA_RESPONSE_SUCCESS, False):
+            await manager.async_set_login_app_type(endpoint, data[CONF_APP_TYPE])
+
+        return result
+
+    async def _async_login_any(self,
+                               data: dict[str, Any],
+                               app_types: list[str]) -> tuple[dict[Any, Any], dict[str, Any]]:
+        """Login with all app types concurrently, Returns the first success or the failure of the last app type."""
+        futures = {
+            self.hass.async_add_executor_job(self._login, data, app_type): app_type
+            for app_type in app_types
+        }
+
+        results = {}
+        pending = set(futures)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+
+                if result[0].get(TUYA_RESPONSE_SUCCESS, False):
+                    # Requests already sent cannot be aborted, their results are ignored
+                    for pending_future in pending:
+                        pending_future.cancel()
 
+                    return result
+
+                results[futures[future]] = result
+
+        return results[app_types[-1]]
+
+    @staticmethod
+    def _login(data: dict[str, Any], app_type: str) -> tuple[dict[Any, Any], dict[str, Any]]:
+        """Login using a single app type."""
+        data = {
+            **data,
+            CONF_APP_TYPE: app_type,
+            CONF_AUTH_TYPE: AuthType.CUSTOM if app_type == "" else AuthType.SMART_HOME,
+        }
+
+        try:
             api = TuyaOpenAPI(
                 endpoint=data[CONF_ENDPOINT],
                 access_id=data[CONF_ACCESS_ID],
@@ -94,10 +170,15 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 schema=data[CONF_APP_TYPE],
             )
 
-            _LOGGER.debug("Response %s", response)
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
 
-            if response.get(TUYA_RESPONSE_SUCCESS, False):
-                break
+            _LOGGER.error(f"Failed to login, App type: {app_type}, Error: {ex}, Line: {line_number}")
+
+            response = {TUYA_RESPONSE_SUCCESS: False, TUYA_RESPONSE_MSG: str(ex)}
+
+        _LOGGER.debug("Response %s", response)
 
         return response, data
 
@@ -109,9 +190,7 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         placeholders = {}
 
         if user_input is not None:
-            response, data = await self.hass.async_add_executor_job(
-                self._try_login, user_input
-            )
+            response, data = await self._try_login(user_input)
 
             if response.get(TUYA_RESPONSE_SUCCESS, False):
                 if endpoint := response.get(TUYA_RESPONSE_RESULT, {}).get(
@@ -163,3 +242,100 @@ class TuyaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders=placeholders,
         )
+
+
+class TuyaOptionsFlow(config_entries.OptionsFlow):
+    """Tuya Options Flow."""
+    def __init__(self, config_entry: config_entries.ConfigEntry):
+        self.config_entry = config_entry
+
+        self._options: dict[str, Any] = dict(config_entry.options)
+
+    @property
+    def aggregates(self) -> list[dict[str, Any]]:
+        return self._options.get(CONF_AGGREGATES, [])
+
+    async def async_step_init(self, user_input=None):
+        """Step init."""
+        aggregate_names = [aggregate[AGGREGATE_NAME] for aggregate in self.aggregates]
+
+        if user_input is not None:
+            selected_names = user_input.pop(CONF_AGGREGATES, aggregate_names)
+            add_aggregate = user_input.pop(CONF_ADD_AGGREGATE, False)
+
+            self._options.update(user_input)
+            self._options[CONF_AGGREGATES] = [
+                aggregate
+                for aggregate in self.aggregates
+                if aggregate[AGGREGATE_NAME] in selected_names
+            ]
+
+            if add_aggregate:
+                return await self.async_step_aggregate()
+
+            return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_STATUS_HISTORY,
+                        default=self._options.get(CONF_STATUS_HISTORY, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ENERGY_INTEGRATION,
+                        default=self._options.get(CONF_ENERGY_INTEGRATION, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COUNTER_SENSORS,
+                        default=self._options.get(CONF_COUNTER_SENSORS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_AGGREGATES,
+                        default=aggregate_names,
+                    ): cv.multi_select(aggregate_names),
+                    vol.Optional(CONF_ADD_AGGREGATE, default=False): bool,
+                }
+            ),
+        )
+
+    async def async_step_aggregate(self, user_input=None):
+        """Step aggregate, adds a fleet aggregate."""
+        errors = {}
+
+        if user_input is not None:
+            aggregate_names = [aggregate[AGGREGATE_NAME] for aggregate in self.aggregates]
+            categories = [
+                category.strip()
+                for category in user_input[AGGREGATE_CATEGORIES].split(",")
+                if category.strip()
+            ]
+
+            if user_input[AGGREGATE_NAME] in aggregate_names:
+                errors["base"] = "aggregate_exists"
+
+            elif not categories:
+                errors["base"] = "invalid_categories"
+
+            else:
+                aggregate = {**user_input, AGGREGATE_CATEGORIES: categories}
+
+                self._options[CONF_AGGREGATES] = [*self.aggregates, aggregate]
+
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="aggregate",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(AGGREGATE_NAME): str,
+                    vol.Required(AGGREGATE_CATEGORIES): str,
+                    vol.Required(AGGREGATE_CODE): str,
+                    vol.Required(AGGREGATE_FUNCTION, default=AGGREGATE_FUNCTION_SUM): vol.In(AGGREGATE_FUNCTIONS),
+                    vol.Optional(AGGREGATE_VALUE, default=""): str,
+                    vol.Optional(AGGREGATE_GROUP_BY_AREA, default=False): bool,
+                }
+            ),
+            errors=errors,
+        )
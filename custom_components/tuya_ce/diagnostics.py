@@ -1,7 +1,9 @@
 """Diagnostics support for Tuya."""
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from contextlib import suppress
+from dataclasses import asdict
 import json
 import logging
 from typing import Any, cast
@@ -22,8 +24,11 @@ from .helpers.const import (
     CONF_AUTH_TYPE,
     CONF_COUNTRY_CODE,
     CONF_ENDPOINT,
+    DIAGNOSTICS_BATCH_SIZE,
     DOMAIN,
 )
+from .managers.tuya_api_pool import TuyaApiPool
+from .managers.tuya_device_manager import DeviceManager
 from .models.ha_tuya_data import HomeAssistantTuyaData
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +42,7 @@ async def async_get_config_entry_diagnostics(
 
     tuya_manager = await TuyaConfigurationManager.load(hass)
 
-    return _async_get_diagnostics(hass, tuya_manager, entry)
+    return await _async_get_diagnostics(hass, tuya_manager, entry)
 
 
 async def async_get_device_diagnostics(
@@ -46,11 +51,10 @@ async def async_get_device_diagnostics(
     """Return diagnostics for a device entry."""
     tuya_manager = await TuyaConfigurationManager.load(hass)
 
-    return _async_get_diagnostics(hass, tuya_manager, entry, device)
+    return await _async_get_diagnostics(hass, tuya_manager, entry, device)
 
 
-@callback
-def _async_get_diagnostics(
+async def _async_get_diagnostics(
     hass: HomeAssistant,
     tuya_manager: TuyaConfigurationManager,
     entry: ConfigEntry,
@@ -73,34 +77,112 @@ def _async_get_diagnostics(
         "mqtt_connected": mqtt_connected,
         "disabled_by": entry.disabled_by,
         "disabled_polling": entry.pref_disable_polling,
+        "api_pool": TuyaApiPool.get_instance(hass).get_diagnostics(),
     }
 
+    gap_analysis_devices: dict = {}
+    unsupported_devices: dict = {}
+    gaps: dict = {}
+
+    if device and next(iter(device.identifiers))[1] == entry.entry_id:
+        _LOGGER.debug("Getting diagnostic information for the integration device")
+
+        # Virtual device of the config entry, holding its counter and aggregate sensors
+        data["counters"] = asdict(hass_data.device_manager.counters)
+
+        return data
+
     if device:
         tuya_device_id = next(iter(device.identifiers))[1]
 
         _LOGGER.debug(f"Getting diagnostic information for device #{tuya_device_id}")
 
-        data |= _async_device_as_dict(
-            hass, hass_data.device_manager.device_map[tuya_device_id]
-        )
+        devices = [hass_data.device_manager.device_map[tuya_device_id]]
+
+        async for device_data in async_iter_devices_as_dict(
+            hass, tuya_manager, devices, gap_analysis_devices, unsupported_devices, gaps, hass_data.device_manager
+        ):
+            data |= device_data
     else:
         _LOGGER.debug("Getting diagnostic information for all devices")
 
+        devices = list(hass_data.device_manager.device_map.values())
+
         data.update(
             devices=[
-                _async_device_as_dict(hass, device)
-                for device in hass_data.device_manager.device_map.values()
+                device_data
+                async for device_data in async_iter_devices_as_dict(
+                    hass, tuya_manager, devices, gap_analysis_devices, unsupported_devices, gaps, hass_data.device_manager
+                )
             ]
         )
 
-    _LOGGER.debug(f"Starting gap analysis, Data: {data}")
-    tuya_manager.perform_gap_analysis(data)
+    _LOGGER.debug(f"Starting gap analysis of {len(devices)} devices")
+
+    await hass.async_add_executor_job(
+        tuya_manager.set_gap_analysis, data, gap_analysis_devices, unsupported_devices, gaps
+    )
+
+    tuya_manager.async_save_gap_analysis_cache()
 
     return data
 
 
-@callback
-def _async_device_as_dict(hass: HomeAssistant, device: TuyaDevice) -> dict[str, Any]:
+async def async_iter_devices_as_dict(
+    hass: HomeAssistant,
+    tuya_manager: TuyaConfigurationManager,
+    devices: list[TuyaDevice],
+    gap_analysis_devices: dict,
+    unsupported_devices: dict,
+    gaps: dict,
+    device_manager: DeviceManager | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield Tuya devices as dictionaries, analyzing gaps of each device on the way.
+
+    Devices are processed in batches, the Tuya data is parsed and analyzed in the
+    executor while the Home Assistant representation is gathered in the event loop.
+    """
+    for index in range(0, len(devices), DIAGNOSTICS_BATCH_SIZE):
+        batch = devices[index:index + DIAGNOSTICS_BATCH_SIZE]
+
+        batch_data = await hass.async_add_executor_job(
+            _devices_as_dict, tuya_manager, batch, gap_analysis_devices, unsupported_devices, gaps
+        )
+
+        for device, device_data in zip(batch, batch_data):
+            if home_assistant_data := _async_home_assistant_as_dict(hass, device):
+                device_data["home_assistant"] = home_assistant_data
+
+            if device_manager is not None and device_manager.is_status_history_enabled:
+                device_data["status_history"] = {
+                    code: status_history.items()
+                    for code, status_history in device_manager.get_device_status_history(device.id).items()
+                }
+
+            yield device_data
+
+
+def _devices_as_dict(
+    tuya_manager: TuyaConfigurationManager,
+    devices: list[TuyaDevice],
+    gap_analysis_devices: dict,
+    unsupported_devices: dict,
+    gaps: dict,
+) -> list[dict[str, Any]]:
+    """Represent Tuya devices as dictionaries and add them to the gap analysis."""
+    result = []
+
+    for device in devices:
+        device_data = _device_as_dict(device)
+
+        tuya_manager.analyze_device(device_data, gap_analysis_devices, unsupported_devices, gaps)
+
+        result.append(device_data)
+
+    return result
+
+
+def _device_as_dict(device: TuyaDevice) -> dict[str, Any]:
     """Represent a Tuya device as a dictionary."""
 
     # Base device information, without sensitive information.
@@ -155,12 +237,20 @@ def _async_device_as_dict(hass: HomeAssistant, device: TuyaDevice) -> dict[str,
             "value": value,
         }
 
+    return data
+
+
+@callback
+def _async_home_assistant_as_dict(hass: HomeAssistant, device: TuyaDevice) -> dict[str, Any] | None:
+    """Represent the Home Assistant entry of a Tuya device as a dictionary, None when not registered."""
+    data: dict[str, Any] | None = None
+
     # Gather information how this Tuya device is represented in Home Assistant
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
     hass_device = device_registry.async_get_device(identifiers={(DOMAIN, device.id)})
     if hass_device:
-        data["home_assistant"] = {
+        data = {
             "name": hass_device.name,
             "name_by_user": hass_device.name_by_user,
             "disabled": hass_device.disabled,
@@ -190,7 +280,7 @@ def _async_device_as_dict(hass: HomeAssistant, device: TuyaDevice) -> dict[str,
                 # The context doesn't provide useful information in this case.
                 state_dict.pop("context", None)
 
-            data["home_assistant"]["entities"].append(
+            data["entities"].append(
                 {
                     "disabled": entity_entry.disabled,
                     "disabled_by": entity_entry.disabled_by,
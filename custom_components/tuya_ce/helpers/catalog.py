@@ -0,0 +1,103 @@
+"""Compact catalog, all configuration files as a single flat table of distinct values.
+
+The catalog is a quarter of the size of the configuration files and equal values
+are decoded once and shared, halving the memory of the loaded configuration.
+It is still parsed as a whole, parsing and decoding take slightly longer than
+parsing the configuration files (tests/catalog_load_benchmark.py).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sys
+
+from .util import get_hash
+
+_LOGGER = logging.getLogger(__name__)
+
+CATALOG_FORMAT_VERSION = 1
+
+CATALOG_VERSION = "version"
+CATALOG_VALUES = "values"
+CATALOG_CONFIGURATIONS = "configurations"
+CATALOG_HASHES = "hashes"
+
+
+def encode_catalog(configurations: dict[str, dict | list]) -> dict:
+    """Flatten configurations into distinct values, containers reference their items by index."""
+    values: list = []
+    value_indexes: dict[str, int] = {}
+
+    def add_value(value) -> int:
+        if isinstance(value, dict):
+            value = {key: add_value(value[key]) for key in value}
+
+        elif isinstance(value, list):
+            value = [add_value(item) for item in value]
+
+        value_key = json.dumps(value)
+        value_index = value_indexes.get(value_key)
+
+        if value_index is None:
+            value_index = len(values)
+            value_indexes[value_key] = value_index
+
+            values.append(value)
+
+        return value_index
+
+    result = {
+        CATALOG_VERSION: CATALOG_FORMAT_VERSION,
+        CATALOG_CONFIGURATIONS: {name: add_value(data) for name, data in configurations.items()},
+        CATALOG_HASHES: {name: get_hash(data) for name, data in configurations.items()},
+        CATALOG_VALUES: values,
+    }
+
+    return result
+
+
+def decode_catalog(data: dict | None) -> dict[str, dict | list] | None:
+    """Restore configurations of a catalog, equal values share a single instance and must not be changed."""
+    result = None
+
+    try:
+        if data is not None:
+            version = data.get(CATALOG_VERSION)
+
+            if version == CATALOG_FORMAT_VERSION:
+                resolved = []
+                append = resolved.append
+
+                # Items are always stored before the containers referencing them,
+                # keys are already shared by the JSON parser and values are distinct
+                for value in data[CATALOG_VALUES]:
+                    value_type = type(value)
+
+                    if value_type is dict:
+                        value = {key: resolved[index] for key, index in value.items()}
+
+                    elif value_type is list:
+                        value = [resolved[index] for index in value]
+
+                    append(value)
+
+                result = {name: resolved[index] for name, index in data[CATALOG_CONFIGURATIONS].items()}
+
+            else:
+                _LOGGER.warning(f"Catalog version {version} is not supported, Expected: {CATALOG_FORMAT_VERSION}")
+
+    except Exception as ex:
+        exc_type, exc_obj, tb = sys.exc_info()
+        line_number = tb.tb_lineno
+
+        _LOGGER.error(f"Failed to decode catalog, Error: {ex}, Line: {line_number}")
+
+    return result
+
+
+def get_catalog_hashes(data: dict | None) -> dict[str, str]:
+    """Return the hashes of the configurations the catalog was encoded from."""
+    if data is None:
+        return {}
+
+    return data.get(CATALOG_HASHES) or {}
@@ -1,38 +1,104 @@
 """Constants for the Tuya integration."""
 from __future__ import annotations
 
-from homeassistant.components.climate import HVACMode
-from homeassistant.components.tuya.alarm_control_panel import Mode
-from homeassistant.components.vacuum import (
-    STATE_CLEANING,
-    STATE_DOCKED,
-    STATE_RETURNING,
-)
-from homeassistant.const import (
-    STATE_ALARM_ARMED_AWAY,
-    STATE_ALARM_ARMED_HOME,
-    STATE_ALARM_DISARMED,
-    STATE_ALARM_TRIGGERED,
-    STATE_IDLE,
-    STATE_PAUSED,
-    Platform,
-)
+from datetime import timedelta
 
-DOMAIN = "tuya_ce"
+from homeassistant.const import Platform
 
-HA_NAME = "homeassistant"
-SERVICE_RELOAD = "reload_config_entry"
+DOMAIN = "tuya_ce"
 
 DEVICE_CONFIG_MANAGER = "device_config_manager"
+API_POOL = "api_pool"
+
+# Connections kept per endpoint, shared by all config entries using it
+API_POOL_MAXSIZE = 10
+
+# MQ messages are decoded on a worker pool for accounts with at least that many devices
+MQ_DECODE_WORKERS_MIN_DEVICES = 100
+MQ_DECODE_WORKERS = 4
+
+# Seconds to collect device updates before writing the state of their entities together
+STATE_WRITE_WINDOW = 0.05
+
+# Virtual device of a config entry holding the hot path counter sensors, created when the option is enabled
+CONF_COUNTER_SENSORS = "counter_sensors"
+INTEGRATION_DEVICE_NAME = "Tuya CE integration"
+COUNTERS_UPDATE_INTERVAL = timedelta(minutes=1)
+UNKNOWN_CATEGORY = "unknown"
+
+# Recent values kept per numeric DP when the status history option is enabled
+CONF_STATUS_HISTORY = "status_history"
+STATUS_HISTORY_SIZE = 120
+STATUS_HISTORY_UPDATE_INTERVAL = timedelta(minutes=1)
+
+STATUS_HISTORY_DERIVATIVE = "derivative"
+STATUS_HISTORY_RATE_OF_CHANGE = "rate_of_change"
+
+STATUS_HISTORY_NAMES = {
+    STATUS_HISTORY_DERIVATIVE: "derivative",
+    STATUS_HISTORY_RATE_OF_CHANGE: "rate of change",
+}
+
+# Power DPs integrated into energy when the energy integration option is enabled
+CONF_ENERGY_INTEGRATION = "energy_integration"
+ENERGY_POWER_DPCODES = ("cur_power",)
+ENERGY_INTEGRATION_INTERVAL = timedelta(minutes=1)
+ENERGY_CHECKPOINTS = "energy_checkpoints"
+ENERGY_CHECKPOINT_SAVE_DELAY = 60
+TUYA_HA_SIGNAL_UPDATE_ENERGY = "tuya_ce_energy_update"
+
+# Fleet aggregates maintained incrementally, defined in the options flow
+CONF_AGGREGATES = "aggregates"
+CONF_ADD_AGGREGATE = "add_aggregate"
+AGGREGATE_NAME = "name"
+AGGREGATE_CATEGORIES = "categories"
+AGGREGATE_CODE = "code"
+AGGREGATE_FUNCTION = "function"
+AGGREGATE_VALUE = "value"
+AGGREGATE_GROUP_BY_AREA = "group_by_area"
+
+AGGREGATE_FUNCTION_SUM = "sum"
+AGGREGATE_FUNCTION_COUNT = "count"
+AGGREGATE_FUNCTION_AVERAGE = "average"
+
+AGGREGATE_FUNCTIONS = [
+    AGGREGATE_FUNCTION_SUM,
+    AGGREGATE_FUNCTION_COUNT,
+    AGGREGATE_FUNCTION_AVERAGE,
+]
+
+TUYA_HA_SIGNAL_UPDATE_AGGREGATE = "tuya_ce_aggregate_update"
 
 STORAGE_VERSION = 1
 SERVICE_UPDATE_REMOTE_CONFIGURATION = "update_remote_configuration"
+SERVICE_MEMORY_SNAPSHOT = "memory_snapshot"
+SERVICE_START_CPU_PROFILER = "start_cpu_profiler"
+SERVICE_STOP_CPU_PROFILER = "stop_cpu_profiler"
+
+ATTR_DURATION = "duration"
+ATTR_INTERVAL = "interval"
+ATTR_STOP_TRACING = "stop_tracing"
+ATTR_MIN = "min"
+ATTR_MAX = "max"
+ATTR_AVERAGE = "average"
+ATTR_DEVICES = "devices"
+
+MEMORY_SNAPSHOT_DEFAULT_DURATION = 60
+MEMORY_SNAPSHOT_MAX_DURATION = 3600
+MEMORY_SNAPSHOT_TOP_ENTRIES = 50
+# Frames kept per allocation, blocks allocated by libraries are attributed to the integration frame calling them
+MEMORY_SNAPSHOT_TRACEBACK_FRAMES = 25
+
+# Milliseconds between samples of the CPU profiler
+CPU_PROFILER_DEFAULT_INTERVAL = 5
+CPU_PROFILER_MAX_INTERVAL = 1000
 
 BASE_URL = "https://raw.githubusercontent.com/elad-bar/ha-tuya-ce/main/config/"
 
 DEVICES_CONFIG = "devices"
 COUNTRIES_CONFIG = "countries"
 UNITS_CONFIG = "units"
+CATALOG_CONFIG = "catalog"
 
 TUYA_CONFIGURATIONS = [
     DEVICES_CONFIG,
@@ -40,6 +106,12 @@ TUYA_CONFIGURATIONS = [
     UNITS_CONFIG
 ]
 
+# Platforms resolving their unit of measurement from the units configuration
+UNITS_PLATFORMS = [
+    Platform.NUMBER,
+    Platform.SENSOR
+]
+
 CONF_AUTH_TYPE = "auth_type"
 CONF_PROJECT_TYPE = "tuya_project_type"
 CONF_ENDPOINT = "endpoint"
@@ -49,6 +121,10 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_COUNTRY_CODE = "country_code"
 CONF_APP_TYPE = "tuya_app_type"
+CONF_MIGRATION_VERSION = "migration_version"
+
+# Increase when a migration of the entity registry is added
+MIGRATION_VERSION = 1
 
 TUYA_DISCOVERY_NEW = "tuya_discovery_new"
 TUYA_HA_SIGNAL_UPDATE_ENTITY = "tuya_entry_update"
@@ -62,6 +138,8 @@ TUYA_RESPONSE_PLATFORM_URL = "platform_url"
 TUYA_SMART_APP = "tuyaSmart"
 SMART_LIFE_APP = "smartlife"
 
+APP_TYPES = ["", TUYA_SMART_APP, SMART_LIFE_APP]
+
 ELECTRIC_RESISTANCE_OHM = "Ω"
 
 PLATFORMS = [
@@ -83,44 +161,6 @@ PLATFORMS = [
     Platform.VACUUM,
 ]
 
-TUYA_MODE_RETURN_HOME = "chargego"
-TUYA_STATUS_TO_HA = {
-    "charge_done": STATE_DOCKED,
-    "chargecompleted": STATE_DOCKED,
-    "chargego": STATE_DOCKED,
-    "charging": STATE_DOCKED,
-    "cleaning": STATE_CLEANING,
-    "docking": STATE_RETURNING,
-    "goto_charge": STATE_RETURNING,
-    "goto_pos": STATE_CLEANING,
-    "mop_clean": STATE_CLEANING,
-    "part_clean": STATE_CLEANING,
-    "paused": STATE_PAUSED,
-    "pick_zone_clean": STATE_CLEANING,
-    "pos_arrived": STATE_CLEANING,
-    "pos_unarrive": STATE_CLEANING,
-    "random": STATE_CLEANING,
-    "sleep": STATE_IDLE,
-    "smart_clean": STATE_CLEANING,
-    "smart": STATE_CLEANING,
-    "spot_clean": STATE_CLEANING,
-    "standby": STATE_IDLE,
-    "wall_clean": STATE_CLEANING,
-    "wall_follow": STATE_CLEANING,
-    "zone_clean": STATE_CLEANING,
-}
-
-TUYA_HVAC_TO_HA = {
-    "auto": HVACMode.HEAT_COOL,
-    "cold": HVACMode.COOL,
-    "freeze": HVACMode.COOL,
-    "heat": HVACMode.HEAT,
-    "hot": HVACMode.HEAT,
-    "manual": HVACMode.HEAT_COOL,
-    "wet": HVACMode.DRY,
-    "wind": HVACMode.FAN_ONLY,
-}
-
 TUYA_SPECIAL_MAPPING = {
     "infrared_ac": {
         "F": "wind",
@@ -158,12 +198,24 @@ ACCESS_MODES = {
 
 TUYA_UNSUPPORTED_CATEGORIES_DATA_KEYS = ["name", "model", "product_name"]
 
-STATE_MAPPING: dict[str, str] = {
-    Mode.DISARMED: STATE_ALARM_DISARMED,
-    Mode.ARM: STATE_ALARM_ARMED_AWAY,
-    Mode.HOME: STATE_ALARM_ARMED_HOME,
-    Mode.SOS: STATE_ALARM_TRIGGERED,
-}
+DIAGNOSTICS_BATCH_SIZE = 50
+
+GAP_ANALYSIS_CACHE = "gap_analysis"
+GAP_ANALYSIS_CACHE_SAVE_DELAY = 10
+
+LOGIN_APP_TYPES = "login_app_types"
+
+# Device specifications are fetched once per product, concurrently and paced, and cached on disk
+DEVICE_SPECIFICATIONS = "device_specifications"
+SPECIFICATIONS_CACHE_TTL = timedelta(days=1)
+SPECIFICATIONS_SAVE_DELAY = 10
+SPECIFICATIONS_WORKERS = 4
+SPECIFICATIONS_REQUESTS_PER_SECOND = 10
+
+# Type data probed per product schema, profiles unused for longer than the max age are dropped
+CAPABILITY_PROFILES = "capability_profiles"
+CAPABILITY_PROFILES_SAVE_DELAY = 10
+CAPABILITY_PROFILE_MAX_AGE = timedelta(days=30)
 
 WEATHER_CONDITION = "tuya_ce__weather_condition"
 
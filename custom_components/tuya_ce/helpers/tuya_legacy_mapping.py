@@ -1,6 +1,5 @@
-from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
-from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.components.tuya import DPCode
+from homeassistant.const import Platform
 
 """
 Old lights where in `tuya.{device_id}` format, now the DPCode is added.
@@ -25,10 +24,10 @@ In all other cases, the unique ID is not changed.
 """
 
 TUYA_LEGACY_MAPPING = {
-    LIGHT_DOMAIN: {
+    Platform.LIGHT: {
         "": DPCode.SWITCH_LED
     },
-    SWITCH_DOMAIN: {
+    Platform.SWITCH: {
         "": DPCode.SWITCH,
         "_1": DPCode.SWITCH_1,
         "_2": DPCode.SWITCH_2,
@@ -47,20 +46,20 @@ TUYA_LEGACY_MAPPING = {
 
 
 TUYA_LEGACY_CATEGORIES = {
-    "dc": LIGHT_DOMAIN,
-    "dd": LIGHT_DOMAIN,
-    "dj": LIGHT_DOMAIN,
-    "fs": LIGHT_DOMAIN,
-    "fwl": LIGHT_DOMAIN,
-    "jsq": LIGHT_DOMAIN,
-    "xdd": LIGHT_DOMAIN,
-    # "xxj": LIGHT_DOMAIN,
-    "bh": SWITCH_DOMAIN,
-    "cwysj": SWITCH_DOMAIN,
-    "cz": SWITCH_DOMAIN,
-    "dlq": SWITCH_DOMAIN,
-    "kg": SWITCH_DOMAIN,
-    "kj": SWITCH_DOMAIN,
-    "pc": SWITCH_DOMAIN,
-    "xxj": SWITCH_DOMAIN
+    "dc": Platform.LIGHT,
+    "dd": Platform.LIGHT,
+    "dj": Platform.LIGHT,
+    "fs": Platform.LIGHT,
+    "fwl": Platform.LIGHT,
+    "jsq": Platform.LIGHT,
+    "xdd": Platform.LIGHT,
+    # "xxj": Platform.LIGHT,
+    "bh": Platform.SWITCH,
+    "cwysj": Platform.SWITCH,
+    "cz": Platform.SWITCH,
+    "dlq": Platform.SWITCH,
+    "kg": Platform.SWITCH,
+    "kj": Platform.SWITCH,
+    "pc": Platform.SWITCH,
+    "xxj": Platform.SWITCH
 }
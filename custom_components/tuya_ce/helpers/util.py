@@ -1,6 +1,16 @@
 """Utility methods for the Tuya integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+import hashlib
+import json
+import re
+import sys
+from urllib.parse import urlsplit
+
+# Path segments of identifiers (devices, users, homes), alphanumeric with at least one digit
+API_PATH_ID_SEGMENT = re.compile(r"^(?=[^/]*\d)[0-9A-Za-z]{6,}$")
+
 
 def remap_value(
     value: float | int,
@@ -14,3 +24,92 @@ def remap_value(
     if reverse:
         value = from_max - value + from_min
     return ((value - from_min) / (from_max - from_min)) * (to_max - to_min) + to_min
+
+
+def get_remap_coefficients(
+    from_min: float | int = 0,
+    from_max: float | int = 255,
+    to_min: float | int = 0,
+    to_max: float | int = 255,
+) -> tuple[float, float]:
+    """Return the factor and offset that remap a value from its current range, to a new range."""
+    if from_max == from_min:
+        return 0.0, float(to_min)
+
+    factor = (to_max - to_min) / (from_max - from_min)
+    offset = to_min - from_min * factor
+
+    return factor, offset
+
+
+def get_components_index(
+    devices: dict,
+    is_relevant_platform: Callable[[str], bool],
+) -> dict[str, dict[str, list[dict]]]:
+    """Return the catalog items of the relevant platforms grouped by DP key and platform."""
+    components_index: dict[str, dict[str, list[dict]]] = {}
+
+    for category_data in devices.values():
+        for platform, platform_data in category_data.items():
+            if not is_relevant_platform(platform) or not isinstance(platform_data, list):
+                continue
+
+            for platform_item in platform_data:
+                key = platform_item.get("key")
+                components = components_index.setdefault(key, {})
+                components.setdefault(platform, []).append(platform_item)
+
+    return components_index
+
+
+def get_hash(data) -> str:
+    """Return a stable hash of JSON serializable data."""
+    content = json.dumps(data, sort_keys=True, default=str)
+
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_api_path(url: str) -> str:
+    """Return the path of an API request, identifiers replaced so calls of the same endpoint are grouped."""
+    segments = [
+        "{id}" if API_PATH_ID_SEGMENT.match(segment) else segment
+        for segment in urlsplit(url).path.split("/")
+    ]
+
+    return "/".join(segments)
+
+
+def get_deep_size(data, seen: set[int] | None = None) -> int:
+    """Return the size of an object and everything it references, objects in seen are counted once."""
+    if seen is None:
+        seen = set()
+
+    size = 0
+    pending = [data]
+
+    while pending:
+        item = pending.pop()
+        item_id = id(item)
+
+        if item_id in seen or isinstance(item, type):
+            continue
+
+        seen.add(item_id)
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            # Copying the items is atomic, the data may be updated by other threads
+            for key, value in list(item.items()):
+                pending.append(key)
+                pending.append(value)
+
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(list(item))
+
+        elif hasattr(item, "__dict__"):
+            pending.append(item.__dict__)
+
+        elif hasattr(item, "__slots__"):
+            pending.extend(getattr(item, slot) for slot in item.__slots__ if hasattr(item, slot))
+
+    return size
@@ -99,11 +99,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
 
             # Fetch color data type information
             if function_data := json.loads(values):
-                self._color_data_type = ColorTypeData(
-                    h_type=IntegerTypeData(dpcode, **function_data["h"]),
-                    s_type=IntegerTypeData(dpcode, **function_data["s"]),
-                    v_type=IntegerTypeData(dpcode, **function_data["v"]),
-                )
+                self._color_data_type = ColorTypeData.from_function_data(dpcode, function_data)
             else:
                 # If no type is found, use a default one
                 self._color_data_type = self.entity_description.default_color_type
@@ -176,25 +172,7 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
             commands += [
                 {
                     "code": self._color_data_dpcode,
-                    "value": json.dumps(
-                        {
-                            "h": round(
-                                self._color_data_type.h_type.remap_value_from(
-                                    color[0], 0, 360
-                                )
-                            ),
-                            "s": round(
-                                self._color_data_type.s_type.remap_value_from(
-                                    color[1], 0, 100
-                                )
-                            ),
-                            "v": round(
-                                self._color_data_type.v_type.remap_value_from(
-                                    brightness
-                                )
-                            ),
-                        }
-                    ),
+                    "value": self._color_data_type.to_json(color, brightness),
                 },
             ]
 
@@ -340,12 +318,4 @@ class TuyaLightEntity(TuyaEntity, LightEntity):
         if not (status_data := self.device.status[self._color_data_dpcode]):
             return None
 
-        if not (status := json.loads(status_data)):
-            return None
-
-        return ColorData(
-            type_data=self._color_data_type,
-            h_value=status["h"],
-            s_value=status["s"],
-            v_value=status["v"],
-        )
+        return ColorData.from_json(self._color_data_type, status_data)
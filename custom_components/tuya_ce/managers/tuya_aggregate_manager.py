@@ -0,0 +1,228 @@
+"""Fleet aggregates of the devices of a config entry."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+import sys
+from typing import TYPE_CHECKING, Any
+
+from tuya_iot import TuyaDevice, TuyaDeviceManager
+
+from homeassistant.components.tuya.const import DPType
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar, device_registry as dr
+from homeassistant.helpers.area_registry import AreaEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import slugify
+
+from ..helpers.const import (
+    AGGREGATE_CATEGORIES,
+    AGGREGATE_CODE,
+    AGGREGATE_FUNCTION,
+    AGGREGATE_FUNCTION_COUNT,
+    AGGREGATE_GROUP_BY_AREA,
+    AGGREGATE_NAME,
+    AGGREGATE_VALUE,
+    DOMAIN,
+    TUYA_HA_SIGNAL_UPDATE_AGGREGATE,
+)
+from ..models.fleet_aggregate import TuyaFleetAggregate
+
+if TYPE_CHECKING:
+    from .tuya_device_listener import DeviceListener
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaAggregateManager:
+    """Keeps the fleet aggregates of a config entry, updating only the contributions of updated devices."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        device_manager: TuyaDeviceManager,
+        definitions: list[dict[str, Any]],
+    ):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._device_manager = device_manager
+        self._definitions = definitions
+
+        self._aggregates: dict[str, TuyaFleetAggregate] = {}
+        self._device_members: dict[str, list[tuple[TuyaFleetAggregate, str, Callable[[Any], float | None]]]] = {}
+        self._remove_batch_listener: Callable[[], None] | None = None
+
+    @property
+    def aggregates(self) -> list[TuyaFleetAggregate]:
+        return list(self._aggregates.values())
+
+    def get_signal(self, aggregate: TuyaFleetAggregate) -> str:
+        return f"{TUYA_HA_SIGNAL_UPDATE_AGGREGATE}_{self._entry_id}_{aggregate.key}"
+
+    @callback
+    def async_load(self, device_listener: DeviceListener):
+        """Assign the devices to the aggregates of the definitions, iterating the fleet only once."""
+        device_registry = dr.async_get(self._hass)
+        area_registry = ar.async_get(self._hass)
+
+        for definition in self._definitions:
+            categories = set(definition.get(AGGREGATE_CATEGORIES, []))
+            code = definition[AGGREGATE_CODE]
+
+            for device in self._device_manager.device_map.values():
+                if device.category not in categories or code not in device.status:
+                    continue
+
+                area = None
+
+                if definition.get(AGGREGATE_GROUP_BY_AREA, False):
+                    area = self._get_area(device_registry, area_registry, device)
+
+                    # Devices without an area are not part of any group
+                    if area is None:
+                        continue
+
+                member = self._get_member(device, definition)
+
+                if member is None:
+                    continue
+
+                value_fn, unit = member
+
+                aggregate = self._get_aggregate(definition, area, unit)
+
+                # Values of different units cannot be added up, the unit of the first device is kept
+                if aggregate.function != AGGREGATE_FUNCTION_COUNT and aggregate.unit != unit:
+                    _LOGGER.warning(
+                        f"Ignoring device of a different unit in fleet aggregate, "
+                        f"Aggregate: {aggregate.name}, "
+                        f"Device: {device.id}, "
+                        f"Unit: {unit}, "
+                        f"Expected: {aggregate.unit}"
+                    )
+
+                    continue
+
+                self._device_members.setdefault(device.id, []).append((aggregate, code, value_fn))
+
+        self.async_update_devices(set(self._device_members))
+
+        self._remove_batch_listener = device_listener.async_add_batch_listener(self.async_update_devices)
+
+        _LOGGER.debug(
+            f"Fleet aggregates loaded, "
+            f"Aggregates: {len(self._aggregates)}, "
+            f"Devices: {len(self._device_members)}"
+        )
+
+    @callback
+    def async_unload(self):
+        """Stop following the device updates and drop the aggregates and their devices."""
+        if self._remove_batch_listener is not None:
+            self._remove_batch_listener()
+
+            self._remove_batch_listener = None
+
+        self._device_members.clear()
+        self._aggregates.clear()
+
+    @callback
+    def async_update_devices(self, device_ids: set[str]):
+        """Replace the contributions of the updated devices, called once per state write window."""
+        device_map = self._device_manager.device_map
+        changed_aggregates: dict[str, TuyaFleetAggregate] = {}
+
+        for device_id in device_ids:
+            members = self._device_members.get(device_id)
+
+            if members is None:
+                continue
+
+            device = device_map.get(device_id)
+
+            for aggregate, code, value_fn in members:
+                value = None
+
+                # Offline devices do not contribute
+                if device is not None and device.online:
+                    raw_value = device.status.get(code)
+
+                    if raw_value is not None:
+                        value = value_fn(raw_value)
+
+                if aggregate.update(device_id, value):
+                    changed_aggregates[aggregate.key] = aggregate
+
+        for aggregate in changed_aggregates.values():
+            async_dispatcher_send(self._hass, self.get_signal(aggregate))
+
+    def _get_aggregate(self, definition: dict[str, Any], area: AreaEntry | None, unit: str | None) -> TuyaFleetAggregate:
+        name = definition[AGGREGATE_NAME]
+        key = slugify(name)
+
+        if area is not None:
+            key = f"{key}_{area.id}"
+            name = f"{name} {area.name}"
+
+        aggregate = self._aggregates.get(key)
+
+        if aggregate is None:
+            aggregate = TuyaFleetAggregate(key, name, definition[AGGREGATE_FUNCTION], unit)
+
+            self._aggregates[key] = aggregate
+
+        return aggregate
+
+    @staticmethod
+    def _get_area(
+        device_registry: dr.DeviceRegistry, area_registry: ar.AreaRegistry, device: TuyaDevice
+    ) -> AreaEntry | None:
+        device_entry = device_registry.async_get_device(identifiers={(DOMAIN, device.id)})
+
+        if device_entry is None or device_entry.area_id is None:
+            return None
+
+        return area_registry.async_get_area(device_entry.area_id)
+
+    @staticmethod
+    def _get_member(
+        device: TuyaDevice, definition: dict[str, Any]
+    ) -> tuple[Callable[[Any], float | None], str | None] | None:
+        """Return the function converting a raw value into the contribution of the device, and its unit."""
+        code = definition[AGGREGATE_CODE]
+
+        if definition[AGGREGATE_FUNCTION] == AGGREGATE_FUNCTION_COUNT:
+            expected_value = str(definition.get(AGGREGATE_VALUE) or True).lower()
+
+            return lambda value: 1.0 if str(value).lower() == expected_value else None, None
+
+        status_range = device.status_range.get(code)
+
+        if status_range is None or status_range.type != DPType.INTEGER:
+            _LOGGER.debug(f"Ignoring non integer DP of fleet aggregate, Device: {device.id}, DP: {code}")
+
+            return None
+
+        try:
+            values = json.loads(status_range.values)
+            divider = 10 ** float(values.get("scale", 0))
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to parse DP of fleet aggregate, Device: {device.id}, DP: {code}, Error: {ex}, Line: {line_number}"
+            )
+
+            return None
+
+        def _get_scaled_value(value: Any) -> float | None:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return None
+
+            return value / divider
+
+        return _get_scaled_value, values.get("unit")
@@ -0,0 +1,88 @@
+"""Shared HTTP transport of Tuya API clients."""
+from __future__ import annotations
+
+import logging
+
+from requests.adapters import HTTPAdapter
+from tuya_iot import AuthType, TuyaOpenAPI
+
+from ..helpers.const import API_POOL, API_POOL_MAXSIZE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaApiPool:
+    """Connection pools shared by endpoint, sessions and tokens stay per config entry."""
+
+    def __init__(self):
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._entries: dict[str, str] = {}
+
+    @staticmethod
+    def get_instance(hass) -> TuyaApiPool:
+        integration_data = hass.data.setdefault(DOMAIN, {})
+
+        if API_POOL not in integration_data:
+            integration_data[API_POOL] = TuyaApiPool()
+
+        instance = integration_data[API_POOL]
+
+        return instance
+
+    def create_api(self,
+                   entry_id: str,
+                   endpoint: str,
+                   access_id: str,
+                   access_secret: str,
+                   auth_type: AuthType) -> TuyaOpenAPI:
+
+        api = TuyaOpenAPI(
+            endpoint=endpoint,
+            access_id=access_id,
+            access_secret=access_secret,
+            auth_type=auth_type,
+        )
+
+        adapter = self._adapters.get(endpoint)
+
+        if adapter is None:
+            _LOGGER.debug(f"Creating connection pool, Endpoint: {endpoint}")
+
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=API_POOL_MAXSIZE)
+
+            self._adapters[endpoint] = adapter
+
+        # Only the transport is shared, cookies and headers remain in the session of the entry
+        api.session.mount(endpoint, adapter)
+
+        self._entries[entry_id] = endpoint
+
+        return api
+
+    def release(self, entry_id: str):
+        endpoint = self._entries.pop(entry_id, None)
+
+        if endpoint is not None and endpoint not in self._entries.values():
+            _LOGGER.debug(f"Closing connection pool, Endpoint: {endpoint}")
+
+            adapter = self._adapters.pop(endpoint)
+            adapter.close()
+
+    def get_diagnostics(self) -> dict:
+        result = {}
+
+        for endpoint, adapter in self._adapters.items():
+            connection_pools = [
+                adapter.poolmanager.pools[key]
+                for key in adapter.poolmanager.pools.keys()
+            ]
+
+            result[endpoint] = {
+                "entries": list(self._entries.values()).count(endpoint),
+                "connections": sum(pool.num_connections for pool in connection_pools),
+                "idle_connections": sum(pool.pool.qsize() for pool in connection_pools if pool.pool is not None),
+                "requests": sum(pool.num_requests for pool in connection_pools),
+                "max_size": API_POOL_MAXSIZE,
+            }
+
+        return result
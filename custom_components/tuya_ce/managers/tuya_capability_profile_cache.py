@@ -0,0 +1,147 @@
+"""Persisted capability profiles of Tuya product schemas."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from json import JSONEncoder
+import logging
+import sys
+from typing import Any
+
+from tuya_iot import TuyaDevice
+
+from homeassistant.components.tuya.const import DPCode, DPType
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from ..helpers.const import (
+    CAPABILITY_PROFILE_MAX_AGE,
+    CAPABILITY_PROFILES,
+    CAPABILITY_PROFILES_SAVE_DELAY,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+from ..helpers.util import get_hash
+from ..models.base import EnumTypeData, IntegerTypeData
+from ..models.capability_profile import MISSING, TuyaCapabilityProfile
+
+_LOGGER = logging.getLogger(__name__)
+
+TYPE_DATA_CLASSES = {
+    DPType.INTEGER: IntegerTypeData,
+    DPType.ENUM: EnumTypeData,
+}
+
+
+class TuyaCapabilityProfileCache:
+    """Capability profiles by product schema hash, a changed device specification gets a new profile."""
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}/{CAPABILITY_PROFILES}.json", encoder=JSONEncoder)
+        self._profiles: dict[str, TuyaCapabilityProfile] = {}
+
+    @property
+    def profiles(self) -> list[TuyaCapabilityProfile]:
+        return list(self._profiles.values())
+
+    async def async_load(self):
+        data = await self._store.async_load() or {}
+        oldest_date = (dt_util.utcnow() - CAPABILITY_PROFILE_MAX_AGE).date().isoformat()
+
+        for schema_hash, profile_data in data.items():
+            last_used = profile_data.get("last_used", "")
+
+            if last_used < oldest_date:
+                continue
+
+            self._profiles[schema_hash] = self._create_profile(
+                schema_hash, last_used, profile_data.get("type_data", {})
+            )
+
+        _LOGGER.debug(
+            f"Capability profiles loaded, "
+            f"Profiles: {len(self._profiles)}, "
+            f"Expired: {len(data) - len(self._profiles)}"
+        )
+
+    def get_profile(self, device: TuyaDevice) -> TuyaCapabilityProfile:
+        """Return the profile of the device specifications, created empty for an unknown schema."""
+        schema_hash = self._get_schema_hash(device)
+        today = dt_util.utcnow().date().isoformat()
+
+        profile = self._profiles.get(schema_hash)
+
+        if profile is None:
+            profile = self._create_profile(schema_hash, today, {})
+
+            self._profiles[schema_hash] = profile
+
+        elif profile.last_used != today:
+            profile.last_used = today
+
+            self._schedule_save()
+
+        return profile
+
+    @callback
+    def async_schedule_save(self):
+        self._store.async_delay_save(self._get_data, CAPABILITY_PROFILES_SAVE_DELAY)
+
+    def _schedule_save(self):
+        # Probes run in the event loop and in the executor (e.g. commands of entities)
+        self._hass.add_job(self.async_schedule_save)
+
+    def _create_profile(self, schema_hash: str, last_used: str, data: dict) -> TuyaCapabilityProfile:
+        return TuyaCapabilityProfile(
+            schema_hash, last_used, data, self._serialize, self._deserialize, self._schedule_save
+        )
+
+    def _get_data(self) -> dict:
+        return {
+            profile.schema_hash: {"last_used": profile.last_used, "type_data": profile.data}
+            for profile in list(self._profiles.values())
+        }
+
+    @staticmethod
+    def _get_schema_hash(device: TuyaDevice) -> str:
+        """Return the hash of the specifications probed by entities, functions and status ranges."""
+        specifications = {
+            key: {
+                code: [item.type, item.values]
+                for code, item in getattr(device, key).items()
+            }
+            for key in ("function", "status_range")
+        }
+
+        return get_hash(specifications)
+
+    @staticmethod
+    def _serialize(type_data: Any) -> dict | None:
+        for dptype, type_data_class in TYPE_DATA_CLASSES.items():
+            if isinstance(type_data, type_data_class):
+                return {"dptype": dptype, **asdict(type_data)}
+
+        return None
+
+    @staticmethod
+    def _deserialize(data: dict | None) -> Any:
+        if data is None:
+            return None
+
+        try:
+            fields = dict(data)
+            type_data_class = TYPE_DATA_CLASSES[DPType(fields.pop("dptype"))]
+
+            fields["dpcode"] = DPCode(fields["dpcode"])
+
+            return type_data_class(**fields)
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to load capability profile entry, Data: {data}, Error: {ex}, Line: {line_number}")
+
+        # Invalid entries are probed again
+        return MISSING
@@ -1,23 +1,57 @@
 from __future__ import annotations
 
+import copy
 import json
 from json import JSONEncoder
 import logging
 import sys
+import threading
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.storage import Store
 
+from ..helpers.catalog import decode_catalog, get_catalog_hashes
 from ..helpers.const import *
+from ..helpers.util import get_components_index, get_hash
+from ..models.device_context import TuyaDeviceContext
+from ..models.unit_of_measurement import UnitOfMeasurementIndex
+from .tuya_capability_profile_cache import TuyaCapabilityProfileCache
 from .tuya_platform_manager import TuyaPlatformManager
 
+if TYPE_CHECKING:
+    from .tuya_cpu_profiler import TuyaCpuProfiler
+    from .tuya_memory_profiler import TuyaMemoryProfiler
+
 _LOGGER = logging.getLogger(__name__)
 
+MEMORY_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=MEMORY_SNAPSHOT_DEFAULT_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MEMORY_SNAPSHOT_MAX_DURATION)
+        ),
+        vol.Optional(ATTR_STOP_TRACING, default=False): cv.boolean,
+    }
+)
+
+START_CPU_PROFILER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_INTERVAL, default=CPU_PROFILER_DEFAULT_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=CPU_PROFILER_MAX_INTERVAL)
+        ),
+    }
+)
+
 
 class TuyaConfigurationManager:
     _stores: dict[str, Store] | None
+    _gap_analysis_cache: dict | None
 
     def __init__(self, hass):
         self._hass = hass
@@ -26,6 +60,24 @@ class TuyaConfigurationManager:
         self._domain_handlers = None
         self._platform_manager = TuyaPlatformManager()
         self._stores = self._get_stores()
+        self._units_index = UnitOfMeasurementIndex(None)
+        self._components_index = {}
+        self._catalog_version = None
+        self._gap_analysis_store = Store(
+            self._hass, STORAGE_VERSION, f"{DOMAIN}/{GAP_ANALYSIS_CACHE}.json", encoder=JSONEncoder
+        )
+        self._gap_analysis_cache = None
+        self._gap_analysis_lock = threading.Lock()
+        self._login_app_types_store = Store(
+            self._hass, STORAGE_VERSION, f"{DOMAIN}/{LOGIN_APP_TYPES}.json", encoder=JSONEncoder
+        )
+        self._login_app_types: dict[str, str] | None = None
+        self._platform_setups: dict[str, dict[str, tuple[AddEntitiesCallback, Any]]] = {}
+        self._entities: dict[tuple[str, str, str], list] = {}
+        self._device_contexts: dict[str, TuyaDeviceContext] = {}
+        self._capability_profiles = TuyaCapabilityProfileCache(hass)
+        self._memory_profiler: TuyaMemoryProfiler | None = None
+        self._cpu_profiler: TuyaCpuProfiler | None = None
 
     @property
     def integration_data(self):
@@ -39,9 +91,44 @@ class TuyaConfigurationManager:
     def units(self) -> dict:
         return self._data.get(UNITS_CONFIG, {})
 
+    @property
+    def units_index(self) -> UnitOfMeasurementIndex:
+        return self._units_index
+
+    @property
+    def configuration_data(self) -> dict:
+        return self._data
+
+    @property
+    def entities(self) -> list:
+        return [entity for entities in self._entities.values() for entity in entities]
+
+    @property
+    def device_contexts(self) -> list[TuyaDeviceContext]:
+        return list(self._device_contexts.values())
+
+    @property
+    def memory_profiler(self) -> TuyaMemoryProfiler:
+        if self._memory_profiler is None:
+            # Profilers are imported on first use of their services
+            from .tuya_memory_profiler import TuyaMemoryProfiler
+
+            self._memory_profiler = TuyaMemoryProfiler(self._hass, self)
+
+        return self._memory_profiler
+
+    @property
+    def cpu_profiler(self) -> TuyaCpuProfiler:
+        if self._cpu_profiler is None:
+            from .tuya_cpu_profiler import TuyaCpuProfiler
+
+            self._cpu_profiler = TuyaCpuProfiler(self._hass)
+
+        return self._cpu_profiler
+
     @property
     def devices(self) -> dict:
-        return self._data.get(DEVICES_CONFIG, dict)
+        return self._data.get(DEVICES_CONFIG) or {}
 
     @staticmethod
     def get_instance(hass):
@@ -52,7 +139,7 @@ class TuyaConfigurationManager:
 
     def _get_stores(self):
         stores = {}
-        for config_file in TUYA_CONFIGURATIONS:
+        for config_file in [*TUYA_CONFIGURATIONS, CATALOG_CONFIG]:
             path = f"{DOMAIN}/{config_file}.json"
 
             store = Store(self._hass, STORAGE_VERSION, path, encoder=JSONEncoder)
@@ -62,25 +149,133 @@ class TuyaConfigurationManager:
         return stores
 
     async def load_configurations(self, force_remote_config: bool = False):
+        previous_data = dict(self._data)
+
+        # Prefer the compact catalog, configuration files are used when it is not available
+        catalog_data = await self._load_configuration(CATALOG_CONFIG, force_remote_config, is_optional=True)
+        catalog = decode_catalog(catalog_data) or {}
+        catalog_hashes = get_catalog_hashes(catalog_data)
+        is_catalog_stale = False
+
         for config_file in TUYA_CONFIGURATIONS:
-            store = self._stores.get(config_file)
-            data = await store.async_load()
+            data = catalog.get(config_file)
 
-            if data is None or force_remote_config:
-                data = await self._get_configuration(config_file)
+            if data is None:
+                data = await self._load_configuration(config_file, force_remote_config)
 
-                await store.async_save(data)
+            elif force_remote_config:
+                file_data = await self._load_configuration(config_file, force_remote_config)
 
-                if force_remote_config:
-                    await self._hass.services.async_call(HA_NAME, SERVICE_RELOAD, data)
+                # Updated configuration files are preferred over a catalog not generated from them
+                if file_data is not None and get_hash(file_data) != catalog_hashes.get(config_file):
+                    data = file_data
+                    is_catalog_stale = True
 
             self._data[config_file] = data
 
-    async def _get_configuration(self, config_file: str) -> dict | None:
+            if config_file == UNITS_CONFIG:
+                self._units_index = UnitOfMeasurementIndex(data)
+
+            elif config_file == DEVICES_CONFIG:
+                self._components_index = get_components_index(
+                    data or {}, lambda p: p not in self._platform_manager.simple_platforms
+                )
+
+                self._catalog_version = get_hash(data)
+
+        if is_catalog_stale:
+            _LOGGER.debug("Catalog is older than the configuration files, removing it")
+
+            await self._stores[CATALOG_CONFIG].async_remove()
+
+        await self._load_gap_analysis_cache()
+
+        if force_remote_config:
+            await self._async_apply_configuration_changes(previous_data)
+
+    async def _load_configuration(self,
+                                  config_file: str,
+                                  force_remote_config: bool,
+                                  is_optional: bool = False) -> dict | None:
+        store = self._stores.get(config_file)
+        data = await store.async_load()
+
+        if data is None or force_remote_config:
+            remote_data = await self._get_configuration(config_file, is_optional)
+
+            # Keep the stored configuration when the remote one is not available
+            if remote_data is not None:
+                data = remote_data
+
+                await store.async_save(data)
+
+        return data
+
+    async def _load_gap_analysis_cache(self):
+        data = self._gap_analysis_cache
+
+        if data is None:
+            data = await self._gap_analysis_store.async_load()
+
+        # Gaps of earlier versions were cached per category
+        if data is None or data.get("catalog_version") != self._catalog_version or "categories" in data:
+            _LOGGER.debug(f"Resetting gap analysis cache, Catalog version: {self._catalog_version}")
+
+            data = self._create_gap_analysis_cache()
+
+            await self._gap_analysis_store.async_save(data)
+
+        self._gap_analysis_cache = data
+
+    async def load_capability_profiles(self):
+        await self._capability_profiles.async_load()
+
+    @callback
+    def async_save_gap_analysis_cache(self):
+        self._gap_analysis_store.async_delay_save(self._get_gap_analysis_snapshot, GAP_ANALYSIS_CACHE_SAVE_DELAY)
+
+    def _get_gap_analysis_snapshot(self) -> dict | None:
+        """Return the cache to save, schemas are added by the executor while the store writes."""
+        with self._gap_analysis_lock:
+            if self._gap_analysis_cache is None:
+                return None
+
+            return {
+                "catalog_version": self._gap_analysis_cache["catalog_version"],
+                "devices": dict(self._gap_analysis_cache["devices"]),
+            }
+
+    async def async_get_login_app_type(self, endpoint: str) -> str | None:
+        """Return the app type of the last successful login to the endpoint."""
+        login_app_types = await self._async_load_login_app_types()
+
+        return login_app_types.get(endpoint)
+
+    async def async_set_login_app_type(self, endpoint: str, app_type: str):
+        login_app_types = await self._async_load_login_app_types()
+
+        if login_app_types.get(endpoint) != app_type:
+            login_app_types[endpoint] = app_type
+
+            await self._login_app_types_store.async_save(login_app_types)
+
+    async def _async_load_login_app_types(self) -> dict[str, str]:
+        if self._login_app_types is None:
+            self._login_app_types = await self._login_app_types_store.async_load() or {}
+
+        return self._login_app_types
+
+    async def _get_configuration(self, config_file: str, is_optional: bool = False) -> dict | None:
         data = None
         try:
             url = f"{BASE_URL}/{config_file}.json"
             async with self._session.get(url, ssl=False) as response:
+                # Optional configurations (e.g. the compact catalog) may not be published yet
+                if is_optional and response.status == 404:
+                    _LOGGER.debug(f"Optional configuration {config_file} is not available, URL: {url}")
+
+                    return None
+
                 response.raise_for_status()
 
                 content = await response.text()
@@ -104,6 +299,8 @@ class TuyaConfigurationManager:
         """Set up Tuya alarm dynamically through Tuya discovery."""
         entities = []
 
+        self._platform_setups.setdefault(entry.entry_id, {})[domain] = (async_add_entities, initializer)
+
         tuya_data = self.integration_data.get(entry.entry_id)
 
         device_manager = tuya_data.device_manager
@@ -111,41 +308,85 @@ class TuyaConfigurationManager:
         device_ids = [*device_manager.device_map]
 
         for device_id in device_ids:
-            try:
-                device = device_manager.device_map[device_id]
-                category_settings = self.devices.get(device.category)
+            device = device_manager.device_map[device_id]
+
+            device_entities = self._create_entities(domain, device, device_manager, initializer)
+
+            self._entities[(entry.entry_id, domain, device_id)] = device_entities
+
+            entities.extend(device_entities)
+
+        self._add_entities(domain, async_add_entities, entities)
+
+    def get_device_context(self, device, device_manager) -> TuyaDeviceContext:
+        device_context = self._device_contexts.get(device.id)
+
+        if device_context is None or device_context.device is not device:
+            profile = self._capability_profiles.get_profile(device)
+            device_context = TuyaDeviceContext(device, device_manager, self, profile)
 
-                if category_settings is not None:
-                    platform_items = category_settings.get(domain, [])
+            self._device_contexts[device.id] = device_context
 
-                    for platform_item in platform_items:
-                        platform_details = self._platform_manager.get_platform_details(domain,
-                                                                                       device,
-                                                                                       platform_item)
+        return device_context
 
-                        if platform_details.enabled:
-                            if platform_details.simple:
-                                _LOGGER.debug(f"Running initializer, Domain: {domain}")
-                                instance = initializer(self._hass, device, device_manager)
+    @callback
+    def async_unload_entry(self, entry: ConfigEntry):
+        self._platform_setups.pop(entry.entry_id, None)
 
-                            else:
-                                _LOGGER.debug(
-                                    f"Running initializer, "
-                                    f"Domain: {domain}, "
-                                    f"Entity_description: {platform_details.entity_description}"
-                                )
+        for key in [key for key in self._entities if key[0] == entry.entry_id]:
+            self._entities.pop(key)
 
-                                instance = initializer(self._hass, device, device_manager, platform_details.entity_description)
+        tuya_data = self.integration_data.get(entry.entry_id)
+
+        if tuya_data is not None:
+            for device_id in tuya_data.device_manager.device_map:
+                self._device_contexts.pop(device_id, None)
+
+    def _create_entities(self, domain: str, device, device_manager, initializer) -> list:
+        entities = []
+
+        try:
+            category_settings = self.devices.get(device.category)
+
+            if category_settings is not None:
+                platform_items = category_settings.get(domain, [])
+
+                for platform_item in platform_items:
+                    platform_details = self._platform_manager.get_platform_details(domain,
+                                                                                   device,
+                                                                                   platform_item)
+
+                    if platform_details.enabled:
+                        if platform_details.simple:
+                            _LOGGER.debug(f"Running initializer, Domain: {domain}")
+                            instance = initializer(self._hass, device, device_manager)
+
+                        else:
+                            _LOGGER.debug(
+                                f"Running initializer, "
+                                f"Domain: {domain}, "
+                                f"Entity_description: {platform_details.entity_description}"
+                            )
 
-                            if instance is not None:
-                                entities.append(instance)
+                            instance = initializer(self._hass, device, device_manager, platform_details.entity_description)
 
-            except Exception as ex:
-                exc_type, exc_obj, tb = sys.exc_info()
-                line_number = tb.tb_lineno
+                        # Initializers may create several entities of a DP (e.g. sensors of its history)
+                        if isinstance(instance, list):
+                            entities.extend(instance)
 
-                _LOGGER.error(f"Failed to create {domain} entity, Error: {ex}, Line: {line_number}")
+                        elif instance is not None:
+                            entities.append(instance)
 
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to create {domain} entity, Error: {ex}, Line: {line_number}")
+
+        return entities
+
+    @staticmethod
+    def _add_entities(domain: str, async_add_entities: AddEntitiesCallback, entities: list):
         try:
             if len(entities) > 0:
                 async_add_entities(entities)
@@ -158,24 +399,222 @@ class TuyaConfigurationManager:
                 f"Failed to add entities for domain '{domain}', Entities: {entities}, Error: {ex}, Line: {line_number}"
             )
 
-    def perform_gap_analysis(self, diagnostic_data: dict):
-        diagnostic_devices = diagnostic_data["devices"]
+    def _get_configuration_changes(self, previous_data: dict) -> set[tuple[str | None, str]]:
+        """Return the (category, platform) pairs changed by the new configuration, category None for all."""
+        changes = set()
 
-        diagnostic_devices_str = json.dumps(diagnostic_devices)
-        diagnostic_devices_data = json.loads(diagnostic_devices_str)
+        previous_devices = previous_data.get(DEVICES_CONFIG) or {}
+        devices = self._data.get(DEVICES_CONFIG) or {}
 
-        unsupported_devices = self._get_unsupported_categories(diagnostic_devices_data)
-        _LOGGER.info(f"Unsupported devices: {json.dumps(unsupported_devices)}")
+        for category in {*previous_devices, *devices}:
+            previous_category_data = previous_devices.get(category, {})
+            category_data = devices.get(category, {})
 
-        devices = self._get_devices(diagnostic_devices_data)
-        _LOGGER.info(f"Devices: {json.dumps(devices)}")
+            for platform in {*previous_category_data, *category_data}:
+                if previous_category_data.get(platform) != category_data.get(platform):
+                    changes.add((category, platform))
+
+        if previous_data.get(UNITS_CONFIG) != self._data.get(UNITS_CONFIG):
+            for platform in UNITS_PLATFORMS:
+                changes.add((None, platform))
 
-        gaps = self._get_gaps(devices)
+        return changes
+
+    async def _async_apply_configuration_changes(self, previous_data: dict):
+        changes = self._get_configuration_changes(previous_data)
+
+        _LOGGER.info(f"Applying configuration changes, Changes: {changes}")
+
+        if len(changes) == 0:
+            return
+
+        for entry_id, platform_setups in self._platform_setups.items():
+            tuya_data = self.integration_data.get(entry_id)
+
+            if tuya_data is None:
+                continue
+
+            device_manager = tuya_data.device_manager
+
+            for device in list(device_manager.device_map.values()):
+                for domain, (async_add_entities, initializer) in platform_setups.items():
+                    is_changed = (device.category, domain) in changes or (None, domain) in changes
+
+                    if is_changed:
+                        await self._async_update_device_entities(
+                            entry_id, domain, device, device_manager, async_add_entities, initializer
+                        )
+
+    async def _async_update_device_entities(self,
+                                            entry_id: str,
+                                            domain: str,
+                                            device,
+                                            device_manager,
+                                            async_add_entities: AddEntitiesCallback,
+                                            initializer):
+
+        key = (entry_id, domain, device.id)
+
+        previous_entities = {entity.unique_id: entity for entity in self._entities.get(key, [])}
+
+        # New instances are not added, they carry the description and unit data of the new configuration
+        entities = self._create_entities(domain, device, device_manager, initializer)
+
+        current_entities = []
+        added_entities = []
+        updated_entities = 0
+
+        for entity in entities:
+            previous_entity = previous_entities.pop(entity.unique_id, None)
+
+            if previous_entity is not None and not self._is_entity_changed(previous_entity, entity):
+                current_entities.append(previous_entity)
+                continue
+
+            if previous_entity is not None and previous_entity.async_apply_configuration(entity):
+                current_entities.append(previous_entity)
+                updated_entities += 1
+                continue
+
+            # Entities not supporting an update in place are added again, using their registry entry
+            if previous_entity is not None and previous_entity.entity_id is not None:
+                await previous_entity.async_remove(force_remove=True)
+
+            added_entities.append(entity)
+            current_entities.append(entity)
+
+        _LOGGER.debug(
+            f"Updating {domain} entities of device {device.id}, "
+            f"Added: {len(added_entities)}, "
+            f"Updated: {updated_entities}, "
+            f"Removed: {len(previous_entities)}"
+        )
+
+        entity_registry = er.async_get(self._hass)
+
+        for entity in previous_entities.values():
+            if entity.entity_id is not None:
+                entity_registry.async_remove(entity.entity_id)
+
+        self._entities[key] = current_entities
+
+        self._add_entities(domain, async_add_entities, added_entities)
+
+    @staticmethod
+    def _is_entity_changed(previous_entity, entity) -> bool:
+        """Return whether the description or the unit of measurement (sensor and number) of an entity changed."""
+        if getattr(previous_entity, "entity_description", None) != getattr(entity, "entity_description", None):
+            return True
+
+        return getattr(previous_entity, "_uom", None) != getattr(entity, "_uom", None)
+
+    def analyze_device(self, diagnostic_device: dict, devices: dict, unsupported_devices: dict, gaps: dict):
+        """Add a single diagnostic device to the gap analysis, reusing the results of its product schema."""
+        category: str = diagnostic_device.get("category")
+
+        schema_key = self._get_schema_key(diagnostic_device)
+
+        with self._gap_analysis_lock:
+            device_analysis = self._get_gap_analysis_cache("devices").get(schema_key)
+
+        if device_analysis is None:
+            diagnostic_device_data = self._copy_diagnostic_device(diagnostic_device)
+
+            device_unsupported_categories = {}
+            device_categories = {}
+
+            self._add_unsupported_category(diagnostic_device_data, device_unsupported_categories)
+            self._add_device(diagnostic_device_data, device_categories)
+
+            device_domains = device_categories.get(category, {})
+
+            # Gap analysis adds the matching components to the items, keep the analyzed ones intact
+            device_gaps = self._get_category_gaps(category, copy.deepcopy(device_domains)) if device_domains else None
+
+            device_analysis = {
+                "unsupported": len(device_unsupported_categories.keys()) > 0,
+                "domains": device_domains,
+                "gaps": copy.deepcopy(device_gaps),
+            }
+
+            # Cached analyses are never changed, they are shared with the store until it is written
+            with self._gap_analysis_lock:
+                self._get_gap_analysis_cache("devices")[schema_key] = device_analysis
+
+        if device_analysis["unsupported"]:
+            unsupported_device = {}
+
+            for data_key in TUYA_UNSUPPORTED_CATEGORIES_DATA_KEYS:
+                unsupported_device[data_key] = diagnostic_device.get(data_key)
+
+            unsupported_devices.setdefault(category, []).append(unsupported_device)
+
+        self._merge_category_items(devices, category, device_analysis["domains"])
+        self._merge_category_items(gaps, category, device_analysis["gaps"])
+
+    def set_gap_analysis(self, diagnostic_data: dict, devices: dict, unsupported_devices: dict, gaps: dict):
+        """Set the results of the analyzed devices in the diagnostic data."""
+        _LOGGER.info(f"Unsupported devices: {json.dumps(unsupported_devices)}")
+        _LOGGER.info(f"Devices: {json.dumps(devices)}")
         _LOGGER.info(f"Gaps: {json.dumps(gaps)}")
 
         diagnostic_data["gaps"] = gaps
         diagnostic_data["unsupported_devices"] = unsupported_devices
 
+    @staticmethod
+    def _merge_category_items(result: dict, category: str, category_domains: dict | None):
+        """Add copies of the cached domain items of a category, the result is handed out as diagnostics."""
+        if not category_domains:
+            return
+
+        category_data = result.setdefault(category, {})
+
+        for domain, domain_items in category_domains.items():
+            category_data.setdefault(domain, {}).update(copy.deepcopy(domain_items))
+
+    def _get_gap_analysis_cache(self, section: str) -> dict:
+        if self._gap_analysis_cache is None:
+            self._gap_analysis_cache = self._create_gap_analysis_cache()
+
+        return self._gap_analysis_cache[section]
+
+    def _create_gap_analysis_cache(self) -> dict:
+        data = {
+            "catalog_version": self._catalog_version,
+            "devices": {},
+        }
+
+        return data
+
+    @staticmethod
+    def _get_schema_key(diagnostic_device: dict) -> str:
+        category = diagnostic_device.get("category")
+        product_id = diagnostic_device.get("product_id")
+
+        schema = [
+            diagnostic_device.get("function"),
+            diagnostic_device.get("status_range"),
+            sorted(diagnostic_device.get("status", {}).keys())
+        ]
+
+        key = f"{category}_{product_id}_{get_hash(schema)}"
+
+        return key
+
+    @staticmethod
+    def _copy_diagnostic_device(diagnostic_device: dict) -> dict:
+        diagnostic_device_data = {
+            data_key: diagnostic_device.get(data_key)
+            for data_key in TUYA_UNSUPPORTED_CATEGORIES_DATA_KEYS
+        }
+
+        diagnostic_device_data["category"] = diagnostic_device.get("category")
+
+        for data_key in ("function", "status_range", "status"):
+            diagnostic_device_data[data_key] = copy.deepcopy(diagnostic_device.get(data_key, {}))
+
+        return diagnostic_device_data
+
     def _match_components(self, gaps: dict):
         for category_key in gaps:
             category_data = gaps.get(category_key)
@@ -191,173 +630,148 @@ class TuyaConfigurationManager:
                     domain_data[component_key] = component
 
     def _get_components(self, key: str):
-        components = {}
-        for category_key in self.devices:
-            category_data = self.devices.get(category_key, {})
-            for domain_key in category_data:
-                if domain_key in self._platform_manager.simple_platforms:
-                    continue
-
-                domain_data = category_data.get(domain_key)
-
-                for domain_item in domain_data:
-                    if domain_item.get("key") == key:
-                        if domain_key not in components:
-                            components[domain_key] = []
-
-                        components[domain_key].append(domain_item)
+        components = self._components_index.get(key, {})
 
         return components
 
-    def _get_devices(self, diagnostic_devices: list) -> dict:
-        result = {}
+    def _add_device(self, diagnostic_device: dict, result: dict):
         try:
-            for diagnostic_device in diagnostic_devices:
-                category: str = diagnostic_device.get("category")
+            category: str = diagnostic_device.get("category")
 
-                functions: dict = diagnostic_device.get("function")
-                status_range: dict = diagnostic_device.get("status_range")
-                status: dict = diagnostic_device.get("status", {})
+            functions: dict = diagnostic_device.get("function")
+            status_range: dict = diagnostic_device.get("status_range")
+            status: dict = diagnostic_device.get("status", {})
 
-                category_data = result.get(category, {})
+            category_data = result.get(category, {})
 
-                if len(status.keys()) == 0:
-                    special_mapping = TUYA_SPECIAL_MAPPING.get(category)
+            if len(status.keys()) == 0:
+                special_mapping = TUYA_SPECIAL_MAPPING.get(category)
 
-                    if special_mapping is not None:
-                        for function in functions:
-                            special_mapping_key = special_mapping.get(function, function)
-                            status_range_item = status_range.get(special_mapping_key)
+                if special_mapping is not None:
+                    for function in functions:
+                        special_mapping_key = special_mapping.get(function, function)
+                        status_range_item = status_range.get(special_mapping_key)
 
-                            status_range_data = status_range_item
-                            if status_range_data is None:
-                                status_range_data = functions.get(function)
+                        status_range_data = status_range_item
+                        if status_range_data is None:
+                            status_range_data = functions.get(function)
 
-                            status_range[special_mapping_key] = status_range_data
-                            status[special_mapping_key] = ""
+                        status_range[special_mapping_key] = status_range_data
+                        status[special_mapping_key] = ""
 
-                for status_key in status:
-                    function_item = functions.get(status_key)
-                    status_range_item = status_range.get(status_key)
+            for status_key in status:
+                function_item = functions.get(status_key)
+                status_range_item = status_range.get(status_key)
 
-                    is_read_only = function_item is None
+                is_read_only = function_item is None
 
-                    if status_range_item is None:
-                        _LOGGER.info(f"{category}.{status_key} is not supported")
+                if status_range_item is None:
+                    _LOGGER.info(f"{category}.{status_key} is not supported")
 
-                    else:
-                        status_range_item_type = status_range_item.get("type")
+                else:
+                    status_range_item_type = status_range_item.get("type")
 
-                        key = self._get_key(is_read_only, status_range_item_type)
-                        domain = TUYA_TYPES_MAPPING.get(key, "unknown")
+                    key = self._get_key(is_read_only, status_range_item_type)
+                    domain = TUYA_TYPES_MAPPING.get(key, "unknown")
 
-                        domain_data = function_item
+                    domain_data = function_item
 
-                        if isinstance(status_range_item, dict) and len(status_range_item.keys()) > 0:
-                            domain_data = status_range_item
+                    if isinstance(status_range_item, dict) and len(status_range_item.keys()) > 0:
+                        domain_data = status_range_item
 
-                        if "type" in domain_data:
-                            type_value: str = domain_data.get("type")
-                            domain_data["type"] = type_value.capitalize()
+                    if "type" in domain_data:
+                        type_value: str = domain_data.get("type")
+                        domain_data["type"] = type_value.capitalize()
 
-                        if "value" in domain_data:
-                            value_data: str = domain_data.get("value")
-                            if isinstance(value_data, str) or (isinstance(value_data, dict) and len(value_data.keys()) == 0):
-                                domain_data.pop("value")
+                    if "value" in domain_data:
+                        value_data: str = domain_data.get("value")
+                        if isinstance(value_data, str) or (isinstance(value_data, dict) and len(value_data.keys()) == 0):
+                            domain_data.pop("value")
 
-                        category_domains = category_data.get(domain, {})
+                    category_domains = category_data.get(domain, {})
 
-                        category_domains[status_key] = domain_data
+                    category_domains[status_key] = domain_data
 
-                        category_data[domain] = category_domains
+                    category_data[domain] = category_domains
 
-                if len(category_data.keys()) > 0:
-                    result[category] = category_data
+            if len(category_data.keys()) > 0:
+                result[category] = category_data
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f"Failed to load HA data, Error: {ex}, Line: {line_number}")
 
-        return result
-
     @staticmethod
-    def _get_unsupported_categories(diagnostic_devices: dict):
-        unsupported_categories = {}
-
+    def _add_unsupported_category(diagnostic_device: dict, unsupported_categories: dict):
         try:
-            for diagnostic_device in diagnostic_devices:
-                category: str = diagnostic_device.get("category")
+            category: str = diagnostic_device.get("category")
 
-                functions: dict = diagnostic_device.get("function")
-                status_range: dict = diagnostic_device.get("status_range")
-                status: dict = diagnostic_device.get("status", {})
+            functions: dict = diagnostic_device.get("function")
+            status_range: dict = diagnostic_device.get("status_range")
+            status: dict = diagnostic_device.get("status", {})
 
-                if len(status.keys()) + len(functions.keys()) + len(status_range.keys()) == 0:
-                    if category not in unsupported_categories:
-                        unsupported_categories[category] = []
+            if len(status.keys()) + len(functions.keys()) + len(status_range.keys()) == 0:
+                if category not in unsupported_categories:
+                    unsupported_categories[category] = []
 
-                    unsupported_device = {}
+                unsupported_device = {}
 
-                    for data_key in TUYA_UNSUPPORTED_CATEGORIES_DATA_KEYS:
-                        unsupported_device[data_key] = diagnostic_device.get(data_key)
+                for data_key in TUYA_UNSUPPORTED_CATEGORIES_DATA_KEYS:
+                    unsupported_device[data_key] = diagnostic_device.get(data_key)
 
-                    _LOGGER.debug(f"Category {category} is not supported")
+                _LOGGER.debug(f"Category {category} is not supported")
 
-                    unsupported_categories[category].append(unsupported_device)
+                unsupported_categories[category].append(unsupported_device)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f"Failed to load HA data, Error: {ex}, Line: {line_number}")
 
-        return unsupported_categories
-
-    def _get_gaps(self, diagnostic_devices: dict) -> dict:
+    def _get_category_gaps(self, category_key: str, new_category: dict) -> dict | None:
         gaps = {}
         try:
-            for category_key in diagnostic_devices:
-                new_category = diagnostic_devices.get(category_key)
-                stored_categories = self.devices.get(category_key)
+            stored_categories = self.devices.get(category_key)
 
-                if stored_categories is None:
-                    gaps[category_key] = new_category
+            if stored_categories is None:
+                gaps[category_key] = new_category
 
-                    _LOGGER.debug(f"Gap identified for category {category_key}")
+                _LOGGER.debug(f"Gap identified for category {category_key}")
 
-                else:
-                    for new_device_key in new_category:
-                        new_device = new_category.get(new_device_key)
-                        stored_device = stored_categories.get(new_device_key)
+            else:
+                for new_device_key in new_category:
+                    new_device = new_category.get(new_device_key)
+                    stored_device = stored_categories.get(new_device_key)
 
-                        if stored_device is None:
-                            gaps[category_key] = {
-                                new_device_key: new_device
-                            }
+                    if stored_device is None:
+                        gaps[category_key] = {
+                            new_device_key: new_device
+                        }
 
-                            _LOGGER.debug(f"Gap identified for device {category_key}.{new_device_key}")
+                        _LOGGER.debug(f"Gap identified for device {category_key}.{new_device_key}")
 
-                        else:
-                            for new_domain_key in new_device:
-                                new_domain = new_device.get(new_domain_key)
-                                stored_domain = None
+                    else:
+                        for new_domain_key in new_device:
+                            new_domain = new_device.get(new_domain_key)
+                            stored_domain = None
 
-                                for stored_domain_item in stored_device:
-                                    key = stored_domain_item.get("key")
-                                    relevant_domains = self._get_relevant_domains(key)
+                            for stored_domain_item in stored_device:
+                                key = stored_domain_item.get("key")
+                                relevant_domains = self._get_relevant_domains(key)
 
-                                    if key in relevant_domains:
-                                        stored_domain = stored_domain_item
+                                if key in relevant_domains:
+                                    stored_domain = stored_domain_item
 
-                                if stored_domain is None:
-                                    if category_key not in gaps:
-                                        gaps[category_key] = {}
+                            if stored_domain is None:
+                                if category_key not in gaps:
+                                    gaps[category_key] = {}
 
-                                    gaps[category_key][new_device_key] = {
-                                        new_domain_key: new_domain
-                                    }
+                                gaps[category_key][new_device_key] = {
+                                    new_domain_key: new_domain
+                                }
 
-                                    _LOGGER.debug(f"Gap identified for domain {category_key}.{new_device_key}.{new_domain_key}")
+                                _LOGGER.debug(f"Gap identified for domain {category_key}.{new_device_key}.{new_domain_key}")
 
             self._match_components(gaps)
 
@@ -367,13 +781,14 @@ class TuyaConfigurationManager:
 
             _LOGGER.error(f"Failed to perform gap analysis, Error: {ex}, Line: {line_number}")
 
-        return gaps
+        return gaps.get(category_key)
 
     @staticmethod
     async def load(hass) -> TuyaConfigurationManager:
         if DEVICE_CONFIG_MANAGER not in hass.data[DOMAIN]:
             instance = TuyaConfigurationManager(hass)
             await instance.load_configurations()
+            await instance.load_capability_profiles()
 
             def _update_remote_configuration(service_call):
                 hass.async_create_task(instance.load_configurations(True))
@@ -382,6 +797,36 @@ class TuyaConfigurationManager:
                                          SERVICE_UPDATE_REMOTE_CONFIGURATION,
                                          _update_remote_configuration)
 
+            @callback
+            def _memory_snapshot(service_call):
+                hass.async_create_task(
+                    instance.memory_profiler.async_snapshot(
+                        service_call.data[ATTR_DURATION], service_call.data[ATTR_STOP_TRACING]
+                    )
+                )
+
+            hass.services.async_register(DOMAIN,
+                                         SERVICE_MEMORY_SNAPSHOT,
+                                         _memory_snapshot,
+                                         MEMORY_SNAPSHOT_SCHEMA)
+
+            @callback
+            def _start_cpu_profiler(service_call):
+                instance.cpu_profiler.start(service_call.data[ATTR_INTERVAL] / 1000)
+
+            @callback
+            def _stop_cpu_profiler(service_call):
+                hass.async_create_task(instance.cpu_profiler.async_stop())
+
+            hass.services.async_register(DOMAIN,
+                                         SERVICE_START_CPU_PROFILER,
+                                         _start_cpu_profiler,
+                                         START_CPU_PROFILER_SCHEMA)
+
+            hass.services.async_register(DOMAIN,
+                                         SERVICE_STOP_CPU_PROFILER,
+                                         _stop_cpu_profiler)
+
             hass.data[DOMAIN][DEVICE_CONFIG_MANAGER] = instance
         else:
             instance = hass.data[DOMAIN][DEVICE_CONFIG_MANAGER]
@@ -397,7 +842,6 @@ class TuyaConfigurationManager:
 
     @staticmethod
     def _get_relevant_domains(domain):
-        domains = TUYA_RELATED_DOMAINS.get(domain, [])
-        domains.append(domain)
+        domains = [*TUYA_RELATED_DOMAINS.get(domain, []), domain]
 
         return domains
@@ -0,0 +1,275 @@
+"""CPU profiling of the integration hot paths."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+import cProfile
+import functools
+import logging
+import os
+import pstats
+import sys
+import threading
+from types import FrameType
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..helpers.const import DOMAIN
+from ..models.base import TuyaEntity
+from .tuya_device_listener import DeviceListener
+
+_LOGGER = logging.getLogger(__name__)
+
+INTEGRATION_PACKAGE = __name__.rsplit(".", 2)[0]
+INTEGRATION_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TuyaCpuProfiler:
+    """Sampling and call profiles of the integration callbacks, functions are instrumented only while running."""
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._interval = 0.0
+
+        self._originals: list[tuple[type, str, Any]] = []
+        self._thread_state = threading.local()
+        self._active_threads: dict[int, int] = {}
+        self._profiles: dict[int, cProfile.Profile] = {}
+        self._samples: Counter[str] = Counter()
+
+        # All instrumented functions share the code of the wrapper, it marks where the profiled stack starts
+        self._wrapper_code = self._wrap(self._sample).__code__
+
+    @property
+    def is_running(self) -> bool:
+        return self._sampler is not None
+
+    def start(self, interval: float) -> bool:
+        """Instrument the hot paths and start sampling them every interval seconds, Returns whether started."""
+        if self.is_running:
+            _LOGGER.warning("CPU profiler is already running")
+            return False
+
+        self._interval = interval
+        self._active_threads.clear()
+        self._profiles.clear()
+        self._samples.clear()
+        self._stop_event.clear()
+
+        self._instrument(DeviceListener, "update_device")
+        self._instrument(DeviceListener, "_async_write_pending_devices")
+        self._instrument(TuyaEntity, "_async_handle_device_update")
+        self._instrument(TuyaEntity, "_send_command")
+
+        for entity_class in self._get_entity_classes():
+            for name, value in list(entity_class.__dict__.items()):
+                if isinstance(value, property) and self._is_integration_function(value.fget):
+                    self._instrument(entity_class, name)
+
+        self._sampler = threading.Thread(target=self._sample, name=f"{DOMAIN}_cpu_profiler", daemon=True)
+        self._sampler.start()
+
+        _LOGGER.info(
+            f"CPU profiler started, "
+            f"Functions: {len(self._originals)}, "
+            f"Interval: {interval * 1000:.0f} ms"
+        )
+
+        return True
+
+    async def async_stop(self) -> tuple[str, str | None] | None:
+        """Restore the hot paths and write the collected profiles to the config directory, Returns their paths."""
+        if not self.is_running:
+            _LOGGER.warning("CPU profiler is not running")
+            return None
+
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+
+        self._originals.clear()
+
+        sampler = self._sampler
+        self._sampler = None
+
+        self._stop_event.set()
+
+        await self._hass.async_add_executor_job(sampler.join)
+
+        return await self._hass.async_add_executor_job(self._write_report)
+
+    def _instrument(self, owner: type, name: str):
+        original = owner.__dict__[name]
+
+        if isinstance(original, property):
+            instrumented = property(
+                self._wrap(original.fget), original.fset, original.fdel, original.__doc__
+            )
+
+        else:
+            instrumented = self._wrap(original)
+
+        self._originals.append((owner, name, original))
+
+        setattr(owner, name, instrumented)
+
+    def _wrap(self, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def _profiled(*args, **kwargs):
+            state = self._thread_state
+            depth = getattr(state, "depth", 0)
+
+            if depth > 0 or not self.is_running:
+                state.depth = depth + 1
+
+                try:
+                    return function(*args, **kwargs)
+
+                finally:
+                    state.depth = depth
+
+            # Outermost instrumented call of the thread, nested calls are part of its profile
+            thread_id = threading.get_ident()
+            profile = self._get_profile(thread_id)
+
+            state.depth = 1
+            self._active_threads[thread_id] = 1
+
+            # Another profiler of the thread (e.g. profiler integration) keeps precedence
+            is_profiling = sys.getprofile() is None
+
+            if is_profiling:
+                profile.enable()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                if is_profiling:
+                    profile.disable()
+
+                self._active_threads.pop(thread_id, None)
+                state.depth = 0
+
+        return _profiled
+
+    def _get_profile(self, thread_id: int) -> cProfile.Profile:
+        profile = self._profiles.get(thread_id)
+
+        if profile is None:
+            with self._lock:
+                profile = self._profiles.setdefault(thread_id, cProfile.Profile())
+
+        return profile
+
+    def _sample(self):
+        while not self._stop_event.wait(self._interval):
+            frames = sys._current_frames()
+
+            for thread_id in list(self._active_threads):
+                frame = frames.get(thread_id)
+
+                if frame is not None:
+                    stack = self._get_stack(frame, self._wrapper_code)
+
+                    if stack:
+                        self._samples[stack] += 1
+
+    @staticmethod
+    def _get_stack(frame: FrameType | None, wrapper_code) -> str:
+        """Return the collapsed stack of the frame, starting at the outermost instrumented call."""
+        names = []
+        scope_length = 0
+
+        while frame is not None:
+            code = frame.f_code
+
+            if code is wrapper_code:
+                # Frames collected so far are inside an instrumented call
+                scope_length = len(names)
+
+            else:
+                file_name = os.path.relpath(code.co_filename, INTEGRATION_PATH) \
+                    if code.co_filename.startswith(INTEGRATION_PATH) else os.path.basename(code.co_filename)
+
+                names.append(f"{code.co_name} ({file_name}:{code.co_firstlineno})")
+
+            frame = frame.f_back
+
+        names = names[:scope_length]
+        names.reverse()
+
+        return ";".join(names)
+
+    def _write_report(self) -> tuple[str, str | None] | None:
+        result = None
+
+        try:
+            timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+
+            collapsed_path = self._hass.config.path(f"{DOMAIN}_cpu_{timestamp}.collapsed")
+            pstats_path = None
+
+            with open(collapsed_path, "w") as file:
+                for stack, count in self._samples.most_common():
+                    file.write(f"{stack} {count}\n")
+
+            # Profiles of threads still inside an instrumented call cannot be collected yet
+            profiles = [
+                profile
+                for thread_id, profile in self._profiles.items()
+                if thread_id not in self._active_threads
+            ]
+
+            if profiles:
+                stats = pstats.Stats(profiles[0])
+
+                for profile in profiles[1:]:
+                    stats.add(profile)
+
+                pstats_path = self._hass.config.path(f"{DOMAIN}_cpu_{timestamp}.pstats")
+                stats.dump_stats(pstats_path)
+
+            _LOGGER.info(
+                f"CPU profile saved, "
+                f"Samples: {sum(self._samples.values())}, "
+                f"Collapsed stacks: {collapsed_path}, "
+                f"Stats: {pstats_path}"
+            )
+
+            result = collapsed_path, pstats_path
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to save CPU profile, Error: {ex}, Line: {line_number}")
+
+        finally:
+            self._profiles.clear()
+            self._samples.clear()
+
+        return result
+
+    @staticmethod
+    def _get_entity_classes() -> list[type]:
+        entity_classes = []
+        pending = [TuyaEntity]
+
+        while pending:
+            entity_class = pending.pop()
+
+            if entity_class not in entity_classes:
+                entity_classes.append(entity_class)
+                pending.extend(entity_class.__subclasses__())
+
+        return entity_classes
+
+    @staticmethod
+    def _is_integration_function(function: Callable | None) -> bool:
+        return function is not None and getattr(function, "__module__", "").startswith(INTEGRATION_PACKAGE)
@@ -1,15 +1,23 @@
 """Support for Tuya Smart devices."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 import logging
 
-from tuya_iot import TuyaDevice, TuyaDeviceListener, TuyaDeviceManager, TuyaOpenMQ
+from tuya_iot import TuyaDevice, TuyaDeviceListener, TuyaDeviceManager
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_send, dispatcher_send
 
-from ..helpers.const import DOMAIN, TUYA_DISCOVERY_NEW, TUYA_HA_SIGNAL_UPDATE_ENTITY
+from ..helpers.const import (
+    DOMAIN,
+    STATE_WRITE_WINDOW,
+    TUYA_DISCOVERY_NEW,
+    TUYA_HA_SIGNAL_UPDATE_ENTITY,
+)
+from .tuya_mq import TuyaMQ
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +40,10 @@ class DeviceListener(TuyaDeviceListener):
         self.device_manager = device_manager
         self.device_ids = device_ids
 
+        self._pending_device_ids: set[str] = set()
+        self._write_handle: asyncio.TimerHandle | None = None
+        self._batch_listeners: list[Callable[[set[str]], None]] = []
+
     def update_device(self, device: TuyaDevice) -> None:
         """Update device status."""
         if device.id in self.device_ids:
@@ -42,7 +54,54 @@ class DeviceListener(TuyaDeviceListener):
             )
 
             if not self.hass.loop.is_closed():
-                dispatcher_send(self.hass, f"{TUYA_HA_SIGNAL_UPDATE_ENTITY}_{device.id}")
+                self.hass.loop.call_soon_threadsafe(self._async_add_pending_device, device.id)
+
+    @callback
+    def _async_add_pending_device(self, device_id: str) -> None:
+        """Collect updated devices, their entities are written together once the window ends."""
+        self._pending_device_ids.add(device_id)
+
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_later(STATE_WRITE_WINDOW, self._async_write_pending_devices)
+
+    @callback
+    def _async_write_pending_devices(self) -> None:
+        """Write the state of all entities of the updated devices, sharing a single context unless an entity has a recent one."""
+        device_ids = self._pending_device_ids
+
+        self._pending_device_ids = set()
+        self._write_handle = None
+
+        # State writes of Home Assistant 2023.1 take no timestamp, each entity still gets its own last updated time
+        context = Context()
+
+        self.device_manager.counters.dispatches += len(device_ids)
+
+        for batch_listener in self._batch_listeners:
+            batch_listener(device_ids)
+
+        for device_id in device_ids:
+            async_dispatcher_send(self.hass, f"{TUYA_HA_SIGNAL_UPDATE_ENTITY}_{device_id}", context)
+
+    @callback
+    def async_add_batch_listener(self, batch_listener: Callable[[set[str]], None]) -> Callable[[], None]:
+        """Call the listener with the IDs of the updated devices once per window, before their entities are written."""
+        self._batch_listeners.append(batch_listener)
+
+        @callback
+        def _remove_batch_listener() -> None:
+            self._batch_listeners.remove(batch_listener)
+
+        return _remove_batch_listener
+
+    @callback
+    def async_cancel_pending_devices(self) -> None:
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+
+            self._write_handle = None
+
+        self._pending_device_ids.clear()
 
     def add_device(self, device: TuyaDevice) -> None:
         """Add device added listener."""
@@ -53,8 +112,10 @@ class DeviceListener(TuyaDeviceListener):
         dispatcher_send(self.hass, TUYA_DISCOVERY_NEW, [device.id])
 
         device_manager = self.device_manager
+        decode_workers = device_manager.mq.decode_workers
         device_manager.mq.stop()
-        tuya_mq = TuyaOpenMQ(device_manager.api)
+        tuya_mq = TuyaMQ(device_manager.api)
+        tuya_mq.start_decode_workers(decode_workers)
         tuya_mq.start()
 
         device_manager.mq = tuya_mq
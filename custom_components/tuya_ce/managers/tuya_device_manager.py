@@ -0,0 +1,159 @@
+"""Support for Tuya Smart devices."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from requests import Response
+from tuya_iot import TuyaDeviceManager, TuyaOpenAPI, TuyaOpenMQ
+
+from ..helpers.const import UNKNOWN_CATEGORY
+from ..helpers.util import get_api_path
+from ..models.integration_counters import TuyaIntegrationCounters
+from ..models.status_history import TuyaStatusHistory
+
+if TYPE_CHECKING:
+    from .tuya_specification_loader import TuyaSpecificationLoader
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceManager(TuyaDeviceManager):
+    """Device manager applying only status changes of device reports and counting its hot paths."""
+
+    def __init__(self, api: TuyaOpenAPI, mq: TuyaOpenMQ) -> None:
+        super().__init__(api, mq)
+
+        self.counters = TuyaIntegrationCounters()
+
+        self._status_history: dict[str, dict[str, TuyaStatusHistory]] | None = None
+        self._status_history_size = 0
+
+        self.specification_loader: TuyaSpecificationLoader | None = None
+
+        api.session.hooks["response"].append(self._on_api_response)
+
+    @property
+    def is_status_history_enabled(self) -> bool:
+        return self._status_history is not None
+
+    def enable_status_history(self, size: int):
+        """Record the recent values of numeric DPs reported by devices."""
+        self._status_history = {}
+        self._status_history_size = size
+
+    def get_status_history(self, device_id: str, code: str) -> TuyaStatusHistory | None:
+        if self._status_history is None:
+            return None
+
+        return self._status_history.get(device_id, {}).get(code)
+
+    def get_device_status_history(self, device_id: str) -> dict[str, TuyaStatusHistory]:
+        if self._status_history is None:
+            return {}
+
+        return dict(self._status_history.get(device_id, {}))
+
+    def update_device_function_cache(self, devIds: list = []):
+        """Update the specifications of the devices, once per product when a loader is set."""
+        device_ids = set(devIds)
+
+        devices = [
+            device
+            for device in self.device_map.values()
+            if not device_ids or device.id in device_ids
+        ]
+
+        if self.specification_loader is None:
+            super().update_device_function_cache(devIds)
+
+        else:
+            self.specification_loader.load(self, devices)
+
+        # Called for loaded and added devices, their held values start the history
+        if self._status_history is not None:
+            self._seed_status_history(devices)
+
+    def on_message(self, msg: dict):
+        device = self.device_map.get(msg.get("data", {}).get("devId"))
+
+        self.counters.mq_messages[UNKNOWN_CATEGORY if device is None else device.category] += 1
+
+        super().on_message(msg)
+
+    def send_commands(self, device_id: str, commands: list[dict[str, Any]]) -> dict[str, Any]:
+        response = None
+
+        try:
+            response = super().send_commands(device_id, commands)
+
+        finally:
+            if response is not None and response.get("success", False):
+                self.counters.commands_sent += 1
+
+            else:
+                self.counters.commands_failed += 1
+
+        return response
+
+    def _on_api_response(self, response: Response, *args, **kwargs):
+        self.counters.api_calls[get_api_path(response.url)] += 1
+
+    def _on_device_report(self, device_id: str, status: list):
+        device = self.device_map.get(device_id)
+
+        if not device:
+            return
+
+        changed_status = [
+            item
+            for item in status
+            if "code" in item
+            and "value" in item
+            and (item["code"] not in device.status or device.status[item["code"]] != item["value"])
+        ]
+
+        if len(changed_status) == 0:
+            _LOGGER.debug(f"Ignoring report without changes, Device: {device_id}")
+            return
+
+        if self._status_history is not None:
+            self._add_status_history(device_id, changed_status)
+
+        super()._on_device_report(device_id, changed_status)
+
+    def _seed_status_history(self, devices: list):
+        """Start the history of numeric DPs without one from the current status of the devices."""
+        timestamp = time.time()
+
+        for device in devices:
+            device_status_history = self._status_history.setdefault(device.id, {})
+
+            for code, value in device.status.items():
+                if code not in device_status_history and self._is_numeric(value):
+                    self._get_status_history(device_status_history, code).append(timestamp, value)
+
+    def _add_status_history(self, device_id: str, status: list):
+        timestamp = time.time()
+        device_status_history = self._status_history.setdefault(device_id, {})
+
+        for item in status:
+            value = item["value"]
+
+            if self._is_numeric(value):
+                self._get_status_history(device_status_history, item["code"]).append(timestamp, value)
+
+    def _get_status_history(self, device_status_history: dict[str, TuyaStatusHistory], code: str) -> TuyaStatusHistory:
+        status_history = device_status_history.get(code)
+
+        if status_history is None:
+            status_history = TuyaStatusHistory(self._status_history_size)
+
+            device_status_history[code] = status_history
+
+        return status_history
+
+    @staticmethod
+    def _is_numeric(value) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -0,0 +1,169 @@
+"""Energy integration of the power DPs of all devices."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from json import JSONEncoder
+import logging
+import sys
+import time
+
+from tuya_iot import TuyaDevice, TuyaDeviceManager
+
+from homeassistant.components.tuya.const import DPType
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from ..helpers.const import (
+    DOMAIN,
+    ENERGY_CHECKPOINT_SAVE_DELAY,
+    ENERGY_CHECKPOINTS,
+    ENERGY_INTEGRATION_INTERVAL,
+    ENERGY_POWER_DPCODES,
+    STORAGE_VERSION,
+    TUYA_HA_SIGNAL_UPDATE_ENERGY,
+)
+from ..models.base import IntegerTypeData
+from ..models.energy_meter import TuyaEnergyMeter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaEnergyManager:
+    """Integrates the power DPs of all meters of a config entry into kWh, checkpoints are persisted."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, device_manager: TuyaDeviceManager):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._device_manager = device_manager
+
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}/{ENERGY_CHECKPOINTS}.{entry_id}.json", encoder=JSONEncoder
+        )
+
+        self._meters: dict[str, list[TuyaEnergyMeter]] = {}
+        self._remove_interval: Callable[[], None] | None = None
+
+    @property
+    def signal(self) -> str:
+        return f"{TUYA_HA_SIGNAL_UPDATE_ENERGY}_{self._entry_id}"
+
+    @property
+    def meters(self) -> list[TuyaEnergyMeter]:
+        return [meter for meters in self._meters.values() for meter in meters]
+
+    async def async_load(self):
+        """Create the meters of the power DPs, starting from the persisted energy."""
+        checkpoints = await self._store.async_load() or {}
+        timestamp = time.monotonic()
+
+        for device in self._device_manager.device_map.values():
+            meters = self._get_device_meters(device, checkpoints)
+
+            if meters:
+                self._meters[device.id] = meters
+
+                for meter in meters:
+                    meter.integrate(timestamp, self._get_power(device, meter))
+
+        _LOGGER.debug(f"Energy integration loaded, Meters: {len(self.meters)}")
+
+        self._remove_interval = async_track_time_interval(
+            self._hass, self._async_integrate_interval, ENERGY_INTEGRATION_INTERVAL
+        )
+
+    async def async_unload(self):
+        if self._remove_interval is not None:
+            self._remove_interval()
+
+            self._remove_interval = None
+
+        self._integrate(self._meters)
+
+        await self._store.async_save(self._get_checkpoints())
+
+    @callback
+    def async_update_devices(self, device_ids: set[str]):
+        """Integrate the meters of the updated devices, called once per state write window."""
+        device_meters = {
+            device_id: self._meters[device_id]
+            for device_id in device_ids
+            if device_id in self._meters
+        }
+
+        if device_meters:
+            self._integrate(device_meters)
+
+    @callback
+    def _async_integrate_interval(self, now: datetime):
+        """Integrate all meters, power is held since the last report of a device."""
+        self._integrate(self._meters)
+
+        self._store.async_delay_save(self._get_checkpoints, ENERGY_CHECKPOINT_SAVE_DELAY)
+
+        async_dispatcher_send(self._hass, self.signal)
+
+    def get_meter(self, device_id: str, code: str) -> TuyaEnergyMeter | None:
+        for meter in self._meters.get(device_id, []):
+            if meter.code == code:
+                return meter
+
+        return None
+
+    def _integrate(self, device_meters: dict[str, list[TuyaEnergyMeter]]):
+        timestamp = time.monotonic()
+        device_map = self._device_manager.device_map
+
+        for device_id, meters in device_meters.items():
+            device = device_map.get(device_id)
+
+            for meter in meters:
+                meter.integrate(timestamp, None if device is None else self._get_power(device, meter))
+
+    def _get_checkpoints(self) -> dict[str, float]:
+        return {meter.key: meter.energy for meter in self.meters}
+
+    @staticmethod
+    def _get_power(device: TuyaDevice, meter: TuyaEnergyMeter) -> float | None:
+        """Return the power of the meter in W, offline devices leave a gap."""
+        value = device.status.get(meter.code)
+
+        if not device.online or not isinstance(value, (int, float)) or isinstance(value, bool):
+            return None
+
+        return meter.get_power(value)
+
+    @staticmethod
+    def _get_device_meters(device: TuyaDevice, checkpoints: dict[str, float]) -> list[TuyaEnergyMeter]:
+        meters = []
+
+        for code in ENERGY_POWER_DPCODES:
+            status_range = device.status_range.get(code)
+
+            if status_range is None or status_range.type != DPType.INTEGER:
+                continue
+
+            try:
+                type_data = IntegerTypeData.from_json(code, status_range.values)
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(
+                    f"Failed to parse power DP, Device: {device.id}, DP: {code}, Error: {ex}, Line: {line_number}"
+                )
+
+                continue
+
+            if type_data is None:
+                continue
+
+            meter = TuyaEnergyMeter(device.id, code, type_data.scale, type_data.unit)
+            meter.energy = float(checkpoints.get(meter.key, 0.0))
+
+            meters.append(meter)
+
+        return meters
@@ -0,0 +1,203 @@
+"""Memory profiling of the integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..helpers.const import DOMAIN, MEMORY_SNAPSHOT_TOP_ENTRIES, MEMORY_SNAPSHOT_TRACEBACK_FRAMES
+from ..helpers.util import get_deep_size
+from ..models.ha_tuya_data import HomeAssistantTuyaData
+
+_LOGGER = logging.getLogger(__name__)
+
+INTEGRATION_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TuyaMemoryProfiler:
+    """Memory snapshots attributed to the modules and objects of the integration."""
+
+    def __init__(self, hass: HomeAssistant, configuration_manager):
+        self._hass = hass
+        self._configuration_manager = configuration_manager
+
+        self._lock = asyncio.Lock()
+        self._is_tracing = False
+        self._previous_modules: dict[str, dict[str, int]] | None = None
+        self._previous_objects: dict[str, dict[str, int]] | None = None
+
+    async def async_snapshot(self, duration: int, stop_tracing: bool = False) -> str | None:
+        """Trace allocations for the duration and write a report to the config directory, Returns its path."""
+        if self._lock.locked():
+            _LOGGER.warning("Memory snapshot is already in progress")
+            return None
+
+        async with self._lock:
+            # Allocations are traced only after tracing started, keep tracing started by others running
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(MEMORY_SNAPSHOT_TRACEBACK_FRAMES)
+
+                # Modules of a stopped tracing are not compared to those of a new one
+                self._is_tracing = True
+                self._previous_modules = None
+
+            _LOGGER.info(f"Memory snapshot started, Duration: {duration} seconds")
+
+            try:
+                await asyncio.sleep(duration)
+
+                devices = [
+                    device
+                    for integration_data in self._hass.data.get(DOMAIN, {}).values()
+                    if isinstance(integration_data, HomeAssistantTuyaData)
+                    for device in list(integration_data.device_manager.device_map.values())
+                ]
+
+                return await self._hass.async_add_executor_job(
+                    self._write_report, duration, devices, self._configuration_manager.entities
+                )
+
+            finally:
+                # Tracing keeps running between snapshots, blocks retained since the previous one show as growth
+                if stop_tracing and self._is_tracing:
+                    tracemalloc.stop()
+
+                    self._is_tracing = False
+
+    def _write_report(self, duration: int, devices: list, entities: list) -> str | None:
+        file_path = None
+
+        try:
+            objects = self._get_objects(devices, entities)
+
+            current, peak = tracemalloc.get_traced_memory()
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(True, os.path.join(INTEGRATION_PATH, "*"), all_frames=True),
+                    # Blocks of the reports themselves are not part of the integration memory
+                    tracemalloc.Filter(False, os.path.abspath(__file__), all_frames=True),
+                ]
+            )
+
+            modules = self._get_modules(snapshot)
+
+            report = {
+                "created": dt_util.utcnow().isoformat(),
+                "duration": duration,
+                "tracing_started_by_snapshot": self._is_tracing,
+                "traced_memory": {"current": current, "peak": peak},
+                "modules": [
+                    {"module": module, **statistic}
+                    for module, statistic in list(modules.items())[:MEMORY_SNAPSHOT_TOP_ENTRIES]
+                ],
+                "objects": objects,
+            }
+
+            if self._previous_modules is not None:
+                modules_diff = [
+                    {
+                        "module": module,
+                        "size_diff": modules.get(module, {}).get("size", 0) - previous.get("size", 0),
+                        "count_diff": modules.get(module, {}).get("count", 0) - previous.get("count", 0),
+                    }
+                    for module, previous in ({module: {} for module in modules} | self._previous_modules).items()
+                ]
+
+                modules_diff.sort(key=lambda statistic: abs(statistic["size_diff"]), reverse=True)
+
+                report["modules_diff"] = [
+                    statistic
+                    for statistic in modules_diff[:MEMORY_SNAPSHOT_TOP_ENTRIES]
+                    if statistic["size_diff"] != 0 or statistic["count_diff"] != 0
+                ]
+
+            if self._previous_objects is not None:
+                report["objects_diff"] = {
+                    object_type: {
+                        key: value - self._previous_objects.get(object_type, {}).get(key, 0)
+                        for key, value in object_data.items()
+                    }
+                    for object_type, object_data in objects.items()
+                }
+
+            self._previous_modules = modules
+            self._previous_objects = objects
+
+            timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+            file_path = self._hass.config.path(f"{DOMAIN}_memory_{timestamp}.json")
+
+            with open(file_path, "w") as file:
+                file.write(json.dumps(report, indent=4))
+
+            _LOGGER.info(f"Memory snapshot saved, Path: {file_path}")
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to create memory snapshot, Error: {ex}, Line: {line_number}")
+
+        return file_path
+
+    @classmethod
+    def _get_modules(cls, snapshot: tracemalloc.Snapshot) -> dict[str, dict[str, int]]:
+        """Return size and count per module, blocks allocated by libraries are attributed to the calling module."""
+        modules: dict[str, dict[str, int]] = {}
+
+        for statistic in snapshot.statistics("traceback"):
+            # Frames are ordered from the oldest, the last one of the integration made the allocation
+            frame = next(
+                frame
+                for frame in reversed(statistic.traceback)
+                if frame.filename.startswith(INTEGRATION_PATH)
+            )
+
+            module = modules.setdefault(cls._get_module(frame.filename), {"size": 0, "count": 0})
+            module["size"] += statistic.size
+            module["count"] += statistic.count
+
+        return dict(sorted(modules.items(), key=lambda item: item[1]["size"], reverse=True))
+
+    def _get_objects(self, devices: list, entities: list) -> dict[str, dict[str, int]]:
+        """Return count and size per object type, objects referenced by several types are counted once."""
+        manager = self._configuration_manager
+        seen: set[int] = set()
+
+        parsed_specs = [
+            type_data
+            for device_context in manager.device_contexts
+            for type_data in device_context.type_data
+        ]
+
+        objects = {
+            "catalog": {
+                "count": len(manager.configuration_data),
+                "size": get_deep_size(manager.configuration_data, seen),
+            },
+            "devices": {
+                "count": len(devices),
+                "size": get_deep_size(devices, seen),
+            },
+            "parsed_specs": {
+                "count": len(parsed_specs),
+                "size": get_deep_size(parsed_specs, seen),
+            },
+            "entities": {
+                "count": len(entities),
+                # Entities reference Home Assistant itself, only their own attributes are counted
+                "size": sum(sys.getsizeof(entity) + sys.getsizeof(entity.__dict__) for entity in entities),
+            },
+        }
+
+        return objects
+
+    @staticmethod
+    def _get_module(file_path: str) -> str:
+        return os.path.relpath(file_path, INTEGRATION_PATH)
@@ -0,0 +1,192 @@
+"""Tuya MQ with cached ciphers and optional decoding of messages on a worker pool."""
+from __future__ import annotations
+
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import sys
+import threading
+from typing import Any, NamedTuple
+
+from Crypto.Cipher import AES
+from paho.mqtt import client as mqtt
+from tuya_iot import AuthType, TuyaOpenAPI, TuyaOpenMQ
+from tuya_iot.openmq import GCM_TAG_LENGTH, TuyaMQConfig
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MQCipherCache(NamedTuple):
+    """Cipher objects derived from the MQ credentials."""
+
+    password: str
+    key: bytes
+    cipher: Any
+
+
+class TuyaMQ(TuyaOpenMQ):
+    """Tuya MQ, messages are decoded concurrently and handed to listeners in their arrival order."""
+
+    def __init__(self, api: TuyaOpenAPI) -> None:
+        super().__init__(api)
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._decode_workers = 0
+
+        self._sequence_lock = threading.Lock()
+        self._sequence = 0
+
+        self._lock = threading.Lock()
+        self._next_sequence = 0
+        self._decoded: dict[int, dict | None] = {}
+        self._is_sending = False
+
+        self._cipher_caches = threading.local()
+
+    @property
+    def decode_workers(self) -> int:
+        return self._decode_workers
+
+    def start_decode_workers(self, decode_workers: int):
+        """Decode messages using a worker pool instead of the MQ thread."""
+        if self._executor is None and decode_workers > 0:
+            _LOGGER.debug(f"Starting MQ decode workers, Workers: {decode_workers}")
+
+            self._decode_workers = decode_workers
+            self._executor = ThreadPoolExecutor(decode_workers, thread_name_prefix="tuya_ce_mq")
+
+    def stop(self):
+        super().stop()
+
+        executor = self._executor
+
+        if executor is not None:
+            self._executor = None
+
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_message(self, mqttc: mqtt.Client, user_data: Any, msg: mqtt.MQTTMessage):
+        executor = self._executor
+        mq_config = user_data["mqConfig"]
+
+        if executor is None:
+            message = self._decode_payload(msg.payload, mq_config)
+
+            if message is not None:
+                self._send_message(message)
+
+        else:
+            # Clients of a reconnect may receive messages at the same time, sequence is assigned in arrival order
+            with self._sequence_lock:
+                sequence = self._sequence
+                self._sequence += 1
+
+            executor.submit(self._decode_message, sequence, msg.payload, mq_config)
+
+    def _decode_message(self, sequence: int, payload: bytes, mq_config: TuyaMQConfig):
+        msg_dict = self._decode_payload(payload, mq_config)
+
+        with self._lock:
+            self._decoded[sequence] = msg_dict
+
+            # A single worker hands over the messages at a time, it picks up those decoded meanwhile
+            if self._is_sending:
+                return
+
+            self._is_sending = True
+
+        while True:
+            messages = []
+
+            with self._lock:
+                # All messages decoded so far without a gap, keeping the arrival order
+                while self._next_sequence in self._decoded:
+                    messages.append(self._decoded.pop(self._next_sequence))
+                    self._next_sequence += 1
+
+                if not messages:
+                    self._is_sending = False
+                    return
+
+            # Listeners run outside of the lock, other workers keep decoding and queueing messages
+            for message in messages:
+                if message is not None:
+                    self._send_message(message)
+
+    def _decode_payload(self, payload: bytes, mq_config: TuyaMQConfig) -> dict | None:
+        msg_dict = None
+
+        try:
+            msg_dict = json_loads(payload)
+
+            decrypted_data = self._decode_mq_message(
+                msg_dict["data"], mq_config.password, msg_dict.get("t", "")
+            )
+
+            if decrypted_data is None:
+                msg_dict = None
+
+            else:
+                msg_dict["data"] = decrypted_data
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to decode MQ message, Error: {ex}, Line: {line_number}")
+
+            msg_dict = None
+
+        return msg_dict
+
+    def _decode_mq_message(self, b64msg: str, password: str, t: str) -> dict[str, Any]:
+        cipher_cache = self._get_cipher_cache(password)
+        buffer = base64.b64decode(b64msg)
+
+        if self.api.auth_type == AuthType.SMART_HOME:
+            msg = cipher_cache.cipher.decrypt(buffer)
+            padding_bytes = msg[-1]
+            msg = msg[:-padding_bytes]
+
+        else:
+            iv_length = int.from_bytes(buffer[0:4], byteorder="big")
+            iv_buffer = buffer[4: iv_length + 4]
+            data_buffer = buffer[iv_length + 4: len(buffer) - GCM_TAG_LENGTH]
+            tag_buffer = buffer[len(buffer) - GCM_TAG_LENGTH:]
+
+            # GCM context is bound to the nonce of the message, only the key is reused
+            cipher = AES.new(cipher_cache.key, AES.MODE_GCM, nonce=iv_buffer)
+            cipher.update(str(t).encode("utf8"))
+            msg = cipher.decrypt_and_verify(data_buffer, tag_buffer)
+
+        return json_loads(msg)
+
+    def _get_cipher_cache(self, password: str) -> MQCipherCache:
+        """Return the cipher of the MQ credentials, kept per thread as cipher objects are not thread safe."""
+        cipher_cache: MQCipherCache | None = getattr(self._cipher_caches, "value", None)
+
+        if cipher_cache is None or cipher_cache.password != password:
+            key = password[8:24].encode("utf8")
+            cipher = AES.new(key, AES.MODE_ECB) if self.api.auth_type == AuthType.SMART_HOME else None
+
+            cipher_cache = MQCipherCache(password, key, cipher)
+
+            self._cipher_caches.value = cipher_cache
+
+        return cipher_cache
+
+    def _send_message(self, msg_dict: dict):
+        for listener in list(self.message_listeners):
+            try:
+                listener(msg_dict)
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(f"Failed to handle MQ message, Error: {ex}, Line: {line_number}")
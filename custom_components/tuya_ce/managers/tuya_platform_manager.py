@@ -3,35 +3,18 @@ from __future__ import annotations
 from collections.abc import Callable
 import logging
 import sys
-from typing import Any
-
-from tuya_iot import TuyaDeviceManager
-
-from homeassistant.components.alarm_control_panel import (
-    AlarmControlPanelEntityDescription,
-)
-from homeassistant.components.button import ButtonEntityDescription
-from homeassistant.components.climate import HVACMode
-from homeassistant.components.number import NumberEntityDescription
-from homeassistant.components.select import SelectEntityDescription
-from homeassistant.components.siren import SirenEntityDescription
-from homeassistant.components.switch import SwitchEntityDescription
-from homeassistant.components.tuya.binary_sensor import (
-    TuyaBinarySensorEntityDescription,
-)
-from homeassistant.components.tuya.climate import TuyaClimateEntityDescription
-from homeassistant.components.tuya.cover import TuyaCoverEntityDescription
-from homeassistant.components.tuya.humidifier import TuyaHumidifierEntityDescription
-from homeassistant.components.tuya.light import TuyaLightEntityDescription
-from homeassistant.components.tuya.sensor import TuyaSensorEntityDescription
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.const import Platform
 from homeassistant.helpers.entity import EntityDescription
 
-from .. import PLATFORMS
-from ..helpers.const import PLATFORM_FIELDS
+from ..helpers.const import PLATFORM_FIELDS, PLATFORMS
 from ..models.color_type_data import ColorTypes
 from ..models.platform_details import PlatformDetails
 
+if TYPE_CHECKING:
+    from tuya_iot import TuyaDeviceManager
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -155,6 +138,7 @@ class TuyaPlatformManager:
 
         return entity_description_defaults
 
+    # Entity descriptions are imported by their handler, modules of platforms without devices are not loaded
     def _get_platform_handlers(self) -> dict[str, Callable[[dict], EntityDescription]]:
         platforms = {
             Platform.ALARM_CONTROL_PANEL: self._get_alarm_control_panel_entity,
@@ -188,6 +172,10 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_alarm_control_panel_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.alarm_control_panel import (
+            AlarmControlPanelEntityDescription,
+        )
+
         entity_description = AlarmControlPanelEntityDescription(
             key=entity_config.get("key")
         )
@@ -200,6 +188,10 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_binary_sensor_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.tuya.binary_sensor import (
+            TuyaBinarySensorEntityDescription,
+        )
+
         entity_description = TuyaBinarySensorEntityDescription(
             key=entity_config.get("key")
         )
@@ -208,6 +200,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_button_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.button import ButtonEntityDescription
+
         entity_description = ButtonEntityDescription(
             key=entity_config.get("key")
         )
@@ -216,6 +210,9 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_climate_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.climate import HVACMode
+        from homeassistant.components.tuya.climate import TuyaClimateEntityDescription
+
         entity_description = TuyaClimateEntityDescription(
             key=entity_config.get("key"),
             switch_only_hvac_mode=HVACMode.OFF
@@ -225,6 +222,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_cover_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.tuya.cover import TuyaCoverEntityDescription
+
         entity_description = TuyaCoverEntityDescription(
             key=entity_config.get("key")
         )
@@ -233,6 +232,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_humidifier_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.tuya.humidifier import TuyaHumidifierEntityDescription
+
         entity_description = TuyaHumidifierEntityDescription(
             key=entity_config.get("key")
         )
@@ -241,6 +242,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_light_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.tuya.light import TuyaLightEntityDescription
+
         entity_description = TuyaLightEntityDescription(
             key=entity_config.get("key")
         )
@@ -249,6 +252,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_number_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.number import NumberEntityDescription
+
         entity_description = NumberEntityDescription(
             key=entity_config.get("key")
         )
@@ -257,6 +262,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_select_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.select import SelectEntityDescription
+
         entity_description = SelectEntityDescription(
             key=entity_config.get("key")
         )
@@ -265,6 +272,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_sensor_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.tuya.sensor import TuyaSensorEntityDescription
+
         entity_description = TuyaSensorEntityDescription(
             key=entity_config.get("key")
         )
@@ -273,6 +282,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_siren_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.siren import SirenEntityDescription
+
         entity_description = SirenEntityDescription(
             key=entity_config.get("key")
         )
@@ -281,6 +292,8 @@ class TuyaPlatformManager:
 
     @staticmethod
     def _get_switch_entity(entity_config: dict) -> EntityDescription:
+        from homeassistant.components.switch import SwitchEntityDescription
+
         entity_description = SwitchEntityDescription(
             key=entity_config.get("key")
         )
@@ -0,0 +1,168 @@
+"""Batched loading of Tuya device specifications."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from json import JSONEncoder
+import logging
+import sys
+import threading
+import time
+from typing import Any
+
+from tuya_iot import TuyaDevice, TuyaDeviceManager
+from tuya_iot.device import TuyaDeviceFunction, TuyaDeviceStatusRange
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ..helpers.const import (
+    DEVICE_SPECIFICATIONS,
+    DOMAIN,
+    SPECIFICATIONS_CACHE_TTL,
+    SPECIFICATIONS_REQUESTS_PER_SECOND,
+    SPECIFICATIONS_SAVE_DELAY,
+    SPECIFICATIONS_WORKERS,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaSpecificationLoader:
+    """Loads the specifications once per product, fetching concurrently at a limited rate, cached with a TTL."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._hass = hass
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}/{DEVICE_SPECIFICATIONS}.{entry_id}.json", encoder=JSONEncoder
+        )
+
+        self._specifications: dict[str, dict[str, Any]] = {}
+        # Guards the specifications and the rate limit, loads run in the executor and the MQ thread
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    async def async_load(self):
+        data = await self._store.async_load() or {}
+        expiration_time = time.time() - SPECIFICATIONS_CACHE_TTL.total_seconds()
+
+        self._specifications = {
+            product_id: specification
+            for product_id, specification in data.items()
+            if specification.get("timestamp", 0) >= expiration_time
+        }
+
+        _LOGGER.debug(
+            f"Device specifications loaded, "
+            f"Products: {len(self._specifications)}, "
+            f"Expired: {len(data) - len(self._specifications)}"
+        )
+
+    @callback
+    def async_schedule_save(self):
+        self._store.async_delay_save(self._get_snapshot, SPECIFICATIONS_SAVE_DELAY)
+
+    def _get_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the specifications to save, products are added by the executor and the MQ thread meanwhile."""
+        with self._lock:
+            return dict(self._specifications)
+
+    def load(self, device_manager: TuyaDeviceManager, devices: list[TuyaDevice]):
+        """Apply the specifications to the devices, fetching those of products not cached, runs in the executor."""
+        products: dict[str, list[TuyaDevice]] = {}
+
+        for device in devices:
+            # Devices without a product are loaded on their own
+            product_id = getattr(device, "product_id", None) or device.id
+
+            products.setdefault(product_id, []).append(device)
+
+        with self._lock:
+            missing_products = [
+                product_id
+                for product_id in products
+                if product_id not in self._specifications
+            ]
+
+        if missing_products:
+            with ThreadPoolExecutor(
+                max_workers=SPECIFICATIONS_WORKERS, thread_name_prefix=f"{DOMAIN}_specifications"
+            ) as executor:
+                results = executor.map(
+                    lambda product_id: self._fetch(device_manager, products[product_id]),
+                    missing_products,
+                )
+
+                fetched = 0
+
+                for product_id, result in zip(missing_products, results):
+                    if result is not None:
+                        with self._lock:
+                            self._specifications[product_id] = {"timestamp": time.time(), "result": result}
+
+                        fetched += 1
+
+            if fetched > 0:
+                self._hass.add_job(self.async_schedule_save)
+
+        with self._lock:
+            specifications = {product_id: self._specifications.get(product_id) for product_id in products}
+
+        for product_id, product_devices in products.items():
+            specification = specifications[product_id]
+
+            if specification is not None:
+                for device in product_devices:
+                    self._apply(device, specification["result"])
+
+        _LOGGER.debug(
+            f"Device specifications applied, "
+            f"Devices: {len(devices)}, "
+            f"Products: {len(products)}, "
+            f"Requested: {len(missing_products)}"
+        )
+
+    def _fetch(self, device_manager: TuyaDeviceManager, devices: list[TuyaDevice]) -> dict | None:
+        """Return the specification of the product, trying its devices until one succeeds."""
+        for device in devices:
+            try:
+                self._wait_for_rate_limit()
+
+                response = device_manager.get_device_specification(device.id)
+
+                if response.get("success"):
+                    return response.get("result", {})
+
+                _LOGGER.warning(f"Failed to get specification, Device: {device.id}, Response: {response}")
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(f"Failed to get specification, Device: {device.id}, Error: {ex}, Line: {line_number}")
+
+        return None
+
+    def _wait_for_rate_limit(self):
+        """Space the start of requests of all workers by the configured rate."""
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+
+            self._next_request_time = request_time + 1 / SPECIFICATIONS_REQUESTS_PER_SECOND
+
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    @staticmethod
+    def _apply(device: TuyaDevice, result: dict):
+        # Merged into the existing specifications, as the SDK does
+        device.function.update({
+            function["code"]: TuyaDeviceFunction(**function)
+            for function in result.get("functions", [])
+        })
+
+        device.status_range.update({
+            status["code"]: TuyaDeviceStatusRange(**status)
+            for status in result.get("status", [])
+        })
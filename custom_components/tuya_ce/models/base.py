@@ -2,26 +2,36 @@
 from __future__ import annotations
 
 import base64
+from collections.abc import Sequence
 from dataclasses import dataclass
 import json
 import logging
 import struct
-from typing import Any, Literal, overload
+import sys
+from typing import Any, Literal, NamedTuple, overload
 
 from tuya_iot import TuyaDevice, TuyaDeviceManager
 
 from homeassistant.components.tuya.const import DPCode, DPType
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.util import dt as dt_util
 
 from ..helpers.const import DEVICE_CONFIG_MANAGER, DOMAIN, TUYA_HA_SIGNAL_UPDATE_ENTITY
 from ..helpers.util import remap_value
+from .device_context import TuyaDeviceContext
 
 _LOGGER = logging.getLogger(__package__)
 
+ELECTRICITY_RAW_SIZE = 8
+ELECTRICITY_RECORD_FIELDS = [("voltage", ">u2"), ("electriccurrent", ">u4"), ("power", ">u4")]
 
-@dataclass
+# Dataclasses support slots starting Python 3.10
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class IntegerTypeData:
     """Integer Type Data."""
 
@@ -93,7 +103,7 @@ class IntegerTypeData:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnumTypeData:
     """Enum Type Data."""
 
@@ -108,7 +118,7 @@ class EnumTypeData:
         return cls(dpcode, **parsed)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ElectricityTypeData:
     """Electricity Type Data."""
 
@@ -132,6 +142,80 @@ class ElectricityTypeData:
             electriccurrent=str(electriccurrent), power=str(power), voltage=str(voltage)
         )
 
+    @classmethod
+    def from_raw_batch(cls, data: list[str]) -> ElectricityBatchData:
+        """Decode a list of base64 strings into voltage, current and power values, NaN for short payloads."""
+        try:
+            # Imported on first use, NumPy is optional and only vectorizes the decoding
+            import numpy as np
+
+        except ImportError:
+            return cls._from_raw_items(data)
+
+        record_dtype = np.dtype(ELECTRICITY_RECORD_FIELDS)
+        count = len(data)
+        payloads = [base64.b64decode(item)[:ELECTRICITY_RAW_SIZE] for item in data]
+
+        valid = np.fromiter(
+            (len(payload) == ELECTRICITY_RAW_SIZE for payload in payloads),
+            dtype=bool,
+            count=count,
+        )
+
+        buffer = b"".join(payload.ljust(ELECTRICITY_RAW_SIZE, b"\x00") for payload in payloads)
+        raw = np.frombuffer(buffer, dtype=np.uint8).reshape(count, ELECTRICITY_RAW_SIZE)
+
+        # Voltage is a 2 bytes big-endian value while current and power are 3 bytes,
+        # pad both to 4 bytes so the whole record can be viewed as a structured dtype
+        records = np.zeros((count, record_dtype.itemsize), dtype=np.uint8)
+        records[:, 0:2] = raw[:, 0:2]
+        records[:, 3:6] = raw[:, 2:5]
+        records[:, 7:10] = raw[:, 5:8]
+
+        values = records.view(record_dtype).reshape(count)
+
+        voltage = values["voltage"] / 10.0
+        electriccurrent = values["electriccurrent"] / 1000.0
+        power = values["power"] / 1000.0
+
+        for array in (voltage, electriccurrent, power):
+            array[~valid] = np.nan
+
+        return ElectricityBatchData(
+            electriccurrent=electriccurrent, power=power, voltage=voltage
+        )
+
+    @classmethod
+    def _from_raw_items(cls, data: list[str]) -> ElectricityBatchData:
+        """Decode the base64 strings one at a time, without NumPy."""
+        voltage: list[float] = []
+        electriccurrent: list[float] = []
+        power: list[float] = []
+
+        for item in data:
+            if len(base64.b64decode(item)) < ELECTRICITY_RAW_SIZE:
+                values = (float("nan"),) * 3
+
+            else:
+                item_data = cls.from_raw(item)
+                values = (float(item_data.voltage), float(item_data.electriccurrent), float(item_data.power))
+
+            voltage.append(values[0])
+            electriccurrent.append(values[1])
+            power.append(values[2])
+
+        return ElectricityBatchData(
+            electriccurrent=electriccurrent, power=power, voltage=voltage
+        )
+
+
+class ElectricityBatchData(NamedTuple):
+    """Electricity Batch Data, one item per decoded payload (NumPy arrays when installed)."""
+
+    electriccurrent: Sequence[float]
+    power: Sequence[float]
+    voltage: Sequence[float]
+
 
 class TuyaEntity(Entity):
     """Tuya base device."""
@@ -146,12 +230,27 @@ class TuyaEntity(Entity):
 
         """Init TuyaHaEntity."""
         self._attr_unique_id = f"tuya.{device.id}"
-        self.device = device
-        self.device_manager = device_manager
         self.hass = hass
 
         integration_data = self.hass.data[DOMAIN]
-        self.tuya_device_configuration_manager = integration_data.get(DEVICE_CONFIG_MANAGER)
+        configuration_manager = integration_data.get(DEVICE_CONFIG_MANAGER)
+
+        self.device_context: TuyaDeviceContext = configuration_manager.get_device_context(device, device_manager)
+
+    @property
+    def device(self) -> TuyaDevice:
+        """Return the Tuya device of the entity."""
+        return self.device_context.device
+
+    @property
+    def device_manager(self) -> TuyaDeviceManager:
+        """Return the Tuya device manager of the device."""
+        return self.device_context.device_manager
+
+    @property
+    def tuya_device_configuration_manager(self):
+        """Return the configuration manager of the integration."""
+        return self.device_context.configuration_manager
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -205,6 +304,8 @@ class TuyaEntity(Entity):
         dptype: DPType | None = None,
     ) -> DPCode | EnumTypeData | IntegerTypeData | None:
         """Find a matching DP code available on for this device."""
+        self.device_context.counters.find_dpcode_calls += 1
+
         if dpcodes is None:
             return None
 
@@ -213,6 +314,21 @@ class TuyaEntity(Entity):
         elif not isinstance(dpcodes, tuple):
             dpcodes = (dpcodes,)
 
+        if dptype in (DPType.ENUM, DPType.INTEGER):
+            # Parsed type data is shared by all entities of the device
+            return self.device_context.get_type_data(
+                (dpcodes, prefer_function, dptype),
+                lambda: self._find_dpcode(dpcodes, prefer_function, dptype),
+            )
+
+        return self._find_dpcode(dpcodes, prefer_function, dptype)
+
+    def _find_dpcode(
+        self,
+        dpcodes: tuple[DPCode, ...],
+        prefer_function: bool,
+        dptype: DPType | None,
+    ) -> DPCode | EnumTypeData | IntegerTypeData | None:
         order = ["status_range", "function"]
         if prefer_function:
             order = ["function", "status_range"]
@@ -277,11 +393,58 @@ class TuyaEntity(Entity):
             async_dispatcher_connect(
                 self.hass,
                 f"{TUYA_HA_SIGNAL_UPDATE_ENTITY}_{self.device.id}",
-                self.async_write_ha_state,
+                self._async_dispatch_device_update,
             )
         )
 
+    @callback
+    def _async_dispatch_device_update(self, context: Context | None = None) -> None:
+        # Looked up on each update, entities added before the CPU profiler starts are instrumented as well
+        self._async_handle_device_update(context)
+
+    @callback
+    def _async_handle_device_update(self, context: Context | None = None) -> None:
+        """Write the state of the entity, using the context shared by the entities updated together."""
+        if context is not None and not self._has_recent_service_context():
+            self.async_set_context(context)
+
+        self.device_context.counters.state_writes[self.platform.domain] += 1
+
+        self.async_write_ha_state()
+
+    def _has_recent_service_context(self) -> bool:
+        """Return whether the entity has a recent context of a service call (e.g. the one causing the report)."""
+        if self._context is None or self._context_set is None:
+            return False
+
+        if dt_util.utcnow() - self._context_set > self.context_recent_time:
+            return False
+
+        # Contexts of update windows are created without a user or a parent
+        return self._context.user_id is not None or self._context.parent_id is not None
+
+    @callback
+    def async_apply_configuration(self, entity: TuyaEntity) -> bool:
+        """Take the configuration of an entity created from an updated configuration, False to add it again."""
+        return False
+
+    @callback
+    def _async_apply_attributes(self, entity: TuyaEntity, keys: tuple[str, ...]) -> None:
+        """Take the attributes derived from the configuration and write the state."""
+        entity_data = vars(entity)
+
+        for key in keys:
+            if key in entity_data:
+                setattr(self, key, entity_data[key])
+
+            else:
+                # Not set by the new configuration, the class default applies
+                vars(self).pop(key, None)
+
+        if self.entity_id is not None and self.hass is not None:
+            self.async_write_ha_state()
+
     def _send_command(self, commands: list[dict[str, Any]]) -> None:
         """Send command to the device."""
         _LOGGER.debug("Sending commands for device %s: %s", self.device.id, commands)
-        self.device_manager.send_commands(self.device.id, commands)
+        self.device_context.send_commands(commands)
@@ -0,0 +1,66 @@
+"""Capability profile of a Tuya product schema."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# Marks a probe without a profile entry, None is a valid probe result
+MISSING = object()
+
+
+class TuyaCapabilityProfile:
+    """Type data probed from the specifications of a product schema, shared by all devices of the schema."""
+
+    __slots__ = ("schema_hash", "last_used", "_data", "_type_data", "_serializer", "_deserializer", "_on_change")
+
+    def __init__(
+        self,
+        schema_hash: str,
+        last_used: str,
+        data: dict[str, dict | None],
+        serializer: Callable[[Any], dict | None],
+        deserializer: Callable[[dict | None], Any],
+        on_change: Callable[[], None],
+    ):
+        self.schema_hash = schema_hash
+        self.last_used = last_used
+
+        self._data = data
+        self._type_data: dict[str, Any] = {}
+        self._serializer = serializer
+        self._deserializer = deserializer
+        self._on_change = on_change
+
+    @property
+    def data(self) -> dict[str, dict | None]:
+        """Return a copy of the serialized probe results."""
+        return dict(self._data)
+
+    def get(self, key: tuple) -> Any:
+        """Return the type data of the probe, MISSING when it was not probed yet."""
+        profile_key = self._get_profile_key(key)
+
+        type_data = self._type_data.get(profile_key, MISSING)
+
+        if type_data is MISSING and profile_key in self._data:
+            # Persisted probes are parsed once per schema
+            type_data = self._deserializer(self._data[profile_key])
+
+            if type_data is not MISSING:
+                self._type_data[profile_key] = type_data
+
+        return type_data
+
+    def set(self, key: tuple, type_data: Any):
+        profile_key = self._get_profile_key(key)
+
+        self._type_data[profile_key] = type_data
+        self._data[profile_key] = self._serializer(type_data)
+
+        self._on_change()
+
+    @staticmethod
+    def _get_profile_key(key: tuple) -> str:
+        dpcodes, prefer_function, dptype = key
+
+        return f"{'/'.join(dpcodes)}|{int(prefer_function)}|{dptype}"
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import cached_property
+import json
 
-from .color_type_data import ColorTypeData
+from .color_type_data import COLOR_DATA_CACHE_SIZE, ColorTypeData
 
 
 @dataclass
@@ -12,15 +16,44 @@ class ColorData:
     s_value: int
     v_value: int
 
-    @property
+    @classmethod
+    def from_json(cls, type_data: ColorTypeData, data: str) -> ColorData | None:
+        """Load JSON string and return a ColorData object, cached per raw string."""
+        cache = type_data.color_data_cache
+
+        if data in cache:
+            return cache[data]
+
+        color_data = None
+        if status := json.loads(data):
+            color_data = cls(
+                type_data=type_data,
+                h_value=status["h"],
+                s_value=status["s"],
+                v_value=status["v"],
+            )
+
+        if len(cache) >= COLOR_DATA_CACHE_SIZE:
+            cache.clear()
+
+        cache[data] = color_data
+
+        return color_data
+
+    @cached_property
     def hs_color(self) -> tuple[float, float]:
         """Get the HS value from this color data."""
+        h_factor, h_offset = self.type_data.h_to_hs
+        s_factor, s_offset = self.type_data.s_to_hs
+
         return (
-            self.type_data.h_type.remap_value_to(self.h_value, 0, 360),
-            self.type_data.s_type.remap_value_to(self.s_value, 0, 100),
+            self.h_value * h_factor + h_offset,
+            self.s_value * s_factor + s_offset,
         )
 
-    @property
+    @cached_property
     def brightness(self) -> int:
         """Get the brightness value from this color data."""
-        return round(self.type_data.v_type.remap_value_to(self.v_value, 0, 255))
+        v_factor, v_offset = self.type_data.v_to_brightness
+
+        return round(self.v_value * v_factor + v_offset)
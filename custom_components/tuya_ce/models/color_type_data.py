@@ -1,9 +1,16 @@
 from dataclasses import dataclass
+import json
 
 from homeassistant.components.tuya import DPCode
 
+from ..helpers.util import get_remap_coefficients
 from .base import IntegerTypeData
 
+COLOR_DATA_CACHE_SIZE = 256
+
+# Color types of device specifications by DP code and h/s/v ranges
+_color_types: dict[tuple[str, str], "ColorTypeData"] = {}
+
 
 @dataclass
 class ColorTypeData:
@@ -13,6 +20,61 @@ class ColorTypeData:
     s_type: IntegerTypeData
     v_type: IntegerTypeData
 
+    def __post_init__(self):
+        """Precompute the multiply-add constants of the HSV conversions."""
+        self.h_to_hs = get_remap_coefficients(self.h_type.min, self.h_type.max, 0, 360)
+        self.s_to_hs = get_remap_coefficients(self.s_type.min, self.s_type.max, 0, 100)
+        self.v_to_brightness = get_remap_coefficients(self.v_type.min, self.v_type.max, 0, 255)
+
+        self.h_from_hs = get_remap_coefficients(0, 360, self.h_type.min, self.h_type.max)
+        self.s_from_hs = get_remap_coefficients(0, 100, self.s_type.min, self.s_type.max)
+        self.v_from_brightness = get_remap_coefficients(0, 255, self.v_type.min, self.v_type.max)
+
+        # Parsed color data per raw status string, shared by all lights using this instance
+        self.color_data_cache = {}
+        self._color_json_cache: dict[tuple[int, int, int], str] = {}
+
+    @classmethod
+    def from_function_data(cls, dpcode: DPCode, function_data: dict) -> "ColorTypeData":
+        """Return the color type of the h/s/v ranges, lights of the same ranges share it and its caches."""
+        key = (dpcode, json.dumps([function_data["h"], function_data["s"], function_data["v"]], sort_keys=True))
+
+        color_type_data = _color_types.get(key)
+
+        if color_type_data is None:
+            color_type_data = cls(
+                h_type=IntegerTypeData(dpcode, **function_data["h"]),
+                s_type=IntegerTypeData(dpcode, **function_data["s"]),
+                v_type=IntegerTypeData(dpcode, **function_data["v"]),
+            )
+
+            _color_types[key] = color_type_data
+
+        return color_type_data
+
+    def to_json(self, hs_color: tuple[float, float], brightness: float) -> str:
+        """Return the color data JSON string of HS color and brightness."""
+        h_factor, h_offset = self.h_from_hs
+        s_factor, s_offset = self.s_from_hs
+        v_factor, v_offset = self.v_from_brightness
+
+        key = (
+            round(hs_color[0] * h_factor + h_offset),
+            round(hs_color[1] * s_factor + s_offset),
+            round(brightness * v_factor + v_offset),
+        )
+
+        if (data := self._color_json_cache.get(key)) is None:
+            h_value, s_value, v_value = key
+            data = json.dumps({"h": h_value, "s": s_value, "v": v_value})
+
+            if len(self._color_json_cache) >= COLOR_DATA_CACHE_SIZE:
+                self._color_json_cache.clear()
+
+            self._color_json_cache[key] = data
+
+        return data
+
 
 @dataclass
 class ColorTypes:
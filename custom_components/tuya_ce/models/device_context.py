@@ -0,0 +1,67 @@
+"""Tuya device context shared by the entities of a device."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from tuya_iot import TuyaDevice, TuyaDeviceManager
+
+from .capability_profile import MISSING, TuyaCapabilityProfile
+from .integration_counters import TuyaIntegrationCounters
+
+# Device managers of the SDK have no counters, their devices count into a detached instance
+DETACHED_COUNTERS = TuyaIntegrationCounters()
+
+
+class TuyaDeviceContext:
+    """Device, its parsed specifications and command sink, referenced by all entities of the device."""
+
+    __slots__ = ("device", "device_manager", "configuration_manager", "counters", "_type_data", "_profile")
+
+    def __init__(
+        self,
+        device: TuyaDevice,
+        device_manager: TuyaDeviceManager,
+        configuration_manager,
+        profile: TuyaCapabilityProfile | None = None,
+    ):
+        self.device = device
+        self.device_manager = device_manager
+        self.configuration_manager = configuration_manager
+
+        self.counters: TuyaIntegrationCounters = getattr(device_manager, "counters", DETACHED_COUNTERS)
+
+        self._type_data: dict[tuple, Any] = {}
+        self._profile = profile
+
+    @property
+    def type_data(self) -> list:
+        return list(self._type_data.values())
+
+    def get_type_data(self, key: tuple, parser: Callable[[], Any]) -> Any:
+        """Return parsed type data of the device specifications, probed once per product schema."""
+        if key in self._type_data:
+            self.counters.find_dpcode_cache_hits += 1
+
+            return self._type_data[key]
+
+        profile = self._profile
+        type_data = MISSING if profile is None else profile.get(key)
+
+        if type_data is MISSING:
+            self.counters.find_dpcode_cache_misses += 1
+
+            type_data = parser()
+
+            if profile is not None:
+                profile.set(key, type_data)
+
+        else:
+            self.counters.find_dpcode_cache_hits += 1
+
+        self._type_data[key] = type_data
+
+        return type_data
+
+    def send_commands(self, commands: list[dict[str, Any]]) -> None:
+        self.device_manager.send_commands(self.device.id, commands)
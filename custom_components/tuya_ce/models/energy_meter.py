@@ -0,0 +1,42 @@
+"""Energy integrated from the power DP of a Tuya device."""
+from __future__ import annotations
+
+# Watt seconds in a kilowatt hour
+WATT_SECONDS_PER_KWH = 3600 * 1000
+
+
+class TuyaEnergyMeter:
+    """Trapezoidal integration of the power samples of a DP into kWh."""
+
+    __slots__ = ("device_id", "code", "scale", "multiplier", "energy", "_power", "_timestamp")
+
+    def __init__(self, device_id: str, code: str, scale: float, unit: str | None):
+        self.device_id = device_id
+        self.code = code
+        self.scale = scale
+        self.multiplier = 1000 if unit is not None and unit.lower() == "kw" else 1
+        self.energy = 0.0
+
+        self._power: float | None = None
+        self._timestamp = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.device_id}_{self.code}"
+
+    @property
+    def power(self) -> float | None:
+        """Return the last power sample in W."""
+        return self._power
+
+    def get_power(self, value: float | int) -> float:
+        """Return the raw DP value in W."""
+        return value / (10 ** self.scale) * self.multiplier
+
+    def integrate(self, timestamp: float, power: float | None):
+        """Add the energy since the last sample, a sample of None skips the gap until the next one."""
+        if self._power is not None and power is not None and timestamp > self._timestamp:
+            self.energy += (self._power + power) / 2 * (timestamp - self._timestamp) / WATT_SECONDS_PER_KWH
+
+        self._power = power
+        self._timestamp = timestamp
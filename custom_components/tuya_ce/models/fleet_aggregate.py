@@ -0,0 +1,67 @@
+"""Aggregate of a DP across the devices of a config entry."""
+from __future__ import annotations
+
+from homeassistant.helpers.typing import StateType
+
+from ..helpers.const import AGGREGATE_FUNCTION_AVERAGE, AGGREGATE_FUNCTION_COUNT
+
+
+class TuyaFleetAggregate:
+    """Sum, count or average of a DP, updated by replacing the contribution of a single device."""
+
+    __slots__ = ("key", "name", "function", "unit", "_total", "_count", "_values")
+
+    def __init__(self, key: str, name: str, function: str, unit: str | None = None):
+        self.key = key
+        self.name = name
+        self.function = function
+        self.unit = unit
+
+        self._total = 0.0
+        self._count = 0
+        self._values: dict[str, float] = {}
+
+    @property
+    def value(self) -> StateType:
+        if self.function == AGGREGATE_FUNCTION_COUNT:
+            return self._count
+
+        if self.function == AGGREGATE_FUNCTION_AVERAGE:
+            return round(self._total / self._count, 3) if self._count > 0 else None
+
+        return round(self._total, 3)
+
+    @property
+    def devices(self) -> int:
+        """Return the number of contributing devices."""
+        return len(self._values)
+
+    @property
+    def values(self) -> dict[str, float]:
+        return dict(self._values)
+
+    def update(self, device_id: str, value: float | None) -> bool:
+        """Replace the contribution of the device, None removes it, Returns whether the aggregate changed."""
+        previous_value = self._values.get(device_id)
+
+        if previous_value == value:
+            return False
+
+        if previous_value is not None:
+            self._total -= previous_value
+            self._count -= 1
+
+        if value is None:
+            self._values.pop(device_id, None)
+
+        else:
+            self._total += value
+            self._count += 1
+
+            self._values[device_id] = value
+
+        # Float errors of the subtractions are not carried over once no device contributes
+        if self._count == 0:
+            self._total = 0.0
+
+        return True
@@ -1,7 +1,11 @@
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from tuya_iot import TuyaDeviceListener, TuyaDeviceManager, TuyaHomeManager
 
+if TYPE_CHECKING:
+    from ..managers.tuya_aggregate_manager import TuyaAggregateManager
+    from ..managers.tuya_energy_manager import TuyaEnergyManager
+
 
 class HomeAssistantTuyaData(NamedTuple):
     """Tuya data stored in the Home Assistant data object."""
@@ -9,3 +13,5 @@ class HomeAssistantTuyaData(NamedTuple):
     device_listener: TuyaDeviceListener
     device_manager: TuyaDeviceManager
     home_manager: TuyaHomeManager
+    energy_manager: Optional["TuyaEnergyManager"] = None
+    aggregate_manager: Optional["TuyaAggregateManager"] = None
@@ -0,0 +1,30 @@
+"""Hot path counters of a Tuya config entry."""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TuyaIntegrationCounters:
+    """Counters of the hot paths, increments are not locked as a rarely lost increment is acceptable."""
+
+    mq_messages: Counter[str] = field(default_factory=Counter)
+    dispatches: int = 0
+    state_writes: Counter[str] = field(default_factory=Counter)
+    find_dpcode_calls: int = 0
+    find_dpcode_cache_hits: int = 0
+    find_dpcode_cache_misses: int = 0
+    commands_sent: int = 0
+    commands_failed: int = 0
+    api_calls: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def find_dpcode_cache_hit_rate(self) -> float | None:
+        """Return the percentage of type data lookups served by the device context."""
+        lookups = self.find_dpcode_cache_hits + self.find_dpcode_cache_misses
+
+        if lookups == 0:
+            return None
+
+        return round(self.find_dpcode_cache_hits / lookups * 100, 1)
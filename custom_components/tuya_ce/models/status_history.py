@@ -0,0 +1,113 @@
+"""Recent values of a numeric Tuya DP."""
+from __future__ import annotations
+
+from array import array
+import threading
+
+
+class TuyaStatusHistory:
+    """Fixed capacity ring buffer of the recent values and timestamps of a numeric DP, memory is allocated once."""
+
+    __slots__ = ("_values", "_timestamps", "_capacity", "_index", "_count", "_lock")
+
+    def __init__(self, capacity: int):
+        self._values = array("d", bytes(8 * capacity))
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._index = 0
+        self._count = 0
+
+        # Reports are appended by the MQ threads while entities read in the event loop
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def minimum(self) -> float | None:
+        timestamps, values = self._get_snapshot()
+
+        return min(values) if values else None
+
+    @property
+    def maximum(self) -> float | None:
+        timestamps, values = self._get_snapshot()
+
+        return max(values) if values else None
+
+    def get_average(self, now: float) -> float | None:
+        """Return the time weighted average, each value is held until the next one and the last until now."""
+        timestamps, values = self._get_snapshot()
+
+        if not values:
+            return None
+
+        duration = now - timestamps[0]
+
+        if duration <= 0:
+            return values[-1]
+
+        total = sum(
+            value * (end - start)
+            for value, start, end in zip(values, timestamps, [*timestamps[1:], now])
+        )
+
+        return total / duration
+
+    def get_derivative(self, now: float) -> float | None:
+        """Return the change per second from the previous value to the last value held until now."""
+        timestamps, values = self._get_snapshot()
+
+        if len(values) < 2:
+            return None
+
+        return self._get_slope(timestamps, values, -2, now)
+
+    def get_rate_of_change(self, now: float) -> float | None:
+        """Return the change per second from the oldest value to the last value held until now."""
+        timestamps, values = self._get_snapshot()
+
+        if len(values) < 2:
+            return None
+
+        return self._get_slope(timestamps, values, 0, now)
+
+    def append(self, timestamp: float, value: float):
+        with self._lock:
+            index = self._index
+
+            self._values[index] = value
+            self._timestamps[index] = timestamp
+
+            self._index = (index + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+
+    def items(self) -> list[tuple[float, float]]:
+        """Return (timestamp, value) pairs, oldest first."""
+        timestamps, values = self._get_snapshot()
+
+        return list(zip(timestamps, values))
+
+    def _get_snapshot(self) -> tuple[array, array]:
+        """Return copies of the timestamps and values, oldest first, taken at a single position of the buffer."""
+        with self._lock:
+            index = self._index
+
+            if self._count < self._capacity:
+                return self._timestamps[:self._count], self._values[:self._count]
+
+            return (
+                self._timestamps[index:] + self._timestamps[:index],
+                self._values[index:] + self._values[:index],
+            )
+
+    @staticmethod
+    def _get_slope(timestamps: array, values: array, start: int, now: float) -> float | None:
+        # A value held since its report keeps lowering the slope until the next change
+        duration = max(now, timestamps[-1]) - timestamps[start]
+
+        if duration <= 0:
+            return None
+
+        return (values[-1] - values[start]) / duration
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from homeassistant.components.tuya.const import UnitOfMeasurement
@@ -15,52 +16,44 @@ from homeassistant.const import (
     UnitOfMass,
 )
 
+UNIT_CONVERSIONS: dict[tuple[str, str], Callable[[float], float]] = {
+    (CONCENTRATION_PARTS_PER_BILLION, CONCENTRATION_PARTS_PER_MILLION):
+        lambda x: x / 1000,
 
-@dataclass
-class ExtendedUnitOfMeasurement:
-    """Describes a unit of measurement."""
+    (ELECTRIC_CURRENT_MILLIAMPERE, ELECTRIC_CURRENT_AMPERE):
+        lambda x: x / 1000,
 
-    unit: str
-    device_classes: list[str]
+    (CONCENTRATION_MILLIGRAMS_PER_CUBIC_METER, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER):
+        lambda x: x * 1000,
 
-    aliases: list[str] | None = None
-    conversion_unit: str | None = None
+    (ELECTRIC_POTENTIAL_MILLIVOLT, ELECTRIC_POTENTIAL_VOLT):
+        lambda x: x / 1000,
 
-    def __init__(self,
-                 unit: str,
-                 device_classes: list[str],
-                 aliases: list[str] | None = None,
-                 conversion_unit: str | None = None):
+    (UnitOfMass.GRAMS, UnitOfMass.KILOGRAMS):
+        lambda x: x / 1000,
+}
 
-        self.unit = unit
-        self.device_classes = device_classes
-        self.aliases = aliases
-        self.conversion_unit = conversion_unit
 
-        self._conversion_fn_mapping = {
-            f"{CONCENTRATION_PARTS_PER_BILLION}_{CONCENTRATION_PARTS_PER_MILLION}":
-                lambda x: x / 1000,
-
-            f"{ELECTRIC_CURRENT_MILLIAMPERE}_{ELECTRIC_CURRENT_AMPERE}":
-                lambda x: x / 1000,
-
-            f"{CONCENTRATION_MILLIGRAMS_PER_CUBIC_METER}_{CONCENTRATION_MICROGRAMS_PER_CUBIC_METER}":
-                lambda x: x * 1000,
+@dataclass(frozen=True)
+class ExtendedUnitOfMeasurement:
+    """Describes a unit of measurement."""
 
-            f"{ELECTRIC_POTENTIAL_MILLIVOLT}_{ELECTRIC_POTENTIAL_VOLT}":
-                lambda x: x / 1000,
+    unit: str
+    device_classes: tuple[str, ...]
 
-            f"{UnitOfMass.GRAMS}_{UnitOfMass.KILOGRAMS}":
-                lambda x: x / 1000,
-        }
+    aliases: tuple[str, ...] | None = None
+    conversion_unit: str | None = None
 
     @staticmethod
     def from_dict(data: dict):
         unit: str = data.get("unit")
-        device_classes: list[str] = data.get("unit")
+        device_classes: tuple[str, ...] = tuple(data.get("device_classes", []))
         aliases: list[str] | None = data.get("aliases")
         conversion_unit: str | None = data.get("conversion_unit")
 
+        if aliases is not None:
+            aliases = tuple(aliases)
+
         instance = ExtendedUnitOfMeasurement(unit, device_classes, aliases, conversion_unit)
 
         return instance
@@ -68,8 +61,8 @@ class ExtendedUnitOfMeasurement:
     @staticmethod
     def from_ha_unit(data: UnitOfMeasurement):
         unit: str = data.unit
-        device_classes: list[str] = list(data.device_classes)
-        aliases: list[str] | None = list(data.aliases)
+        device_classes: tuple[str, ...] = tuple(data.device_classes)
+        aliases: tuple[str, ...] | None = tuple(data.aliases)
         conversion_unit: str | None = data.conversion_unit
 
         instance = ExtendedUnitOfMeasurement(unit, device_classes, aliases, conversion_unit)
@@ -77,10 +70,56 @@ class ExtendedUnitOfMeasurement:
         return instance
 
     def conversion_fn(self, value):
-        key = f"{self.unit}_{self.conversion_unit}"
-        conversion_func = self._conversion_fn_mapping.get(key)
+        conversion_func = UNIT_CONVERSIONS.get((self.unit, self.conversion_unit))
 
         if conversion_func is not None:
             value = conversion_func(value)
 
         return value
+
+    def reverse_conversion_fn(self, value):
+        """Return the value in the unit of the device, all conversions are linear."""
+        factor = self.conversion_fn(1)
+
+        return value / factor
+
+
+class UnitOfMeasurementIndex:
+    """Unit of measurement lookup compiled once from the units configuration."""
+
+    _units: dict[tuple[str, str], ExtendedUnitOfMeasurement]
+    _resolved: dict[tuple[str, str], ExtendedUnitOfMeasurement | None]
+
+    def __init__(self, data: dict | None):
+        self._units = {}
+        self._resolved = {}
+
+        # The configuration repeats the same unit per device class and alias,
+        # keep a single shared instance for each distinct unit
+        shared_units: dict[ExtendedUnitOfMeasurement, ExtendedUnitOfMeasurement] = {}
+
+        for device_class, device_class_units in (data or {}).items():
+            for unit_key, unit_data in device_class_units.items():
+                uom = ExtendedUnitOfMeasurement.from_dict(unit_data)
+                uom = shared_units.setdefault(uom, uom)
+
+                self._units[(device_class, unit_key)] = uom
+
+    def get(self, device_class: str, unit: str | None) -> ExtendedUnitOfMeasurement | None:
+        """Return the unit of measurement of a device class by its unit or alias."""
+        if unit is None:
+            return None
+
+        key = (device_class, unit)
+
+        if key in self._resolved:
+            return self._resolved[key]
+
+        uom = self._units.get(key)
+
+        if uom is None:
+            uom = self._units.get((device_class, unit.lower()))
+
+        self._resolved[key] = uom
+
+        return uom
@@ -9,12 +9,28 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.components.tuya.const import DPType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .helpers.const import DOMAIN
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
 from .models.base import IntegerTypeData, TuyaEntity
+from .models.unit_of_measurement import (
+    ExtendedUnitOfMeasurement,
+    UnitOfMeasurementIndex,
+)
+
+# Attributes of numbers derived from their description and unit, updated in place by configuration changes
+NUMBER_CONFIGURATION_ATTRIBUTES = (
+    "entity_description",
+    "_uom",
+    "_attr_native_unit_of_measurement",
+    "_attr_native_max_value",
+    "_attr_native_min_value",
+    "_attr_native_step",
+    "_attr_device_class",
+    "_attr_icon",
+)
 
 
 async def async_setup_entry(
@@ -32,6 +48,7 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity, ABC):
     """Tuya Number Entity."""
 
     _number: IntegerTypeData | None = None
+    _uom: ExtendedUnitOfMeasurement | None = None
 
     def __init__(
         self,
@@ -63,19 +80,11 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity, ABC):
 
             # We cannot have a device class, if the UOM isn't set or the
             # device class cannot be found in the validation mapping.
-            if (
-                self.native_unit_of_measurement is None
-                or self.device_class not in self.tuya_device_configuration_manager
-            ):
-                self._attr_device_class = None
-                return
-
-            uoms = self.tuya_device_configuration_manager[self.device_class]
-            self._uom = uoms.get(self.native_unit_of_measurement) or uoms.get(
-                self.native_unit_of_measurement.lower()
+            # Unknown unit of measurement, device class should not be used.
+            self._uom = self.units_index.get(
+                self.device_class, self.native_unit_of_measurement
             )
 
-            # Unknown unit of measurement, device class should not be used.
             if self._uom is None:
                 self._attr_device_class = None
                 return
@@ -90,6 +99,12 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity, ABC):
                 self._uom.conversion_unit or self._uom.unit
             )
 
+            # Range of the device unit is presented in the target conversion unit
+            if self._number is not None:
+                self._attr_native_max_value = self._uom.conversion_fn(self._number.max_scaled)
+                self._attr_native_min_value = self._uom.conversion_fn(self._number.min_scaled)
+                self._attr_native_step = self._uom.conversion_fn(self._number.step_scaled)
+
     @staticmethod
     def create_entity(hass: HomeAssistant,
                       device: TuyaDevice,
@@ -99,11 +114,21 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity, ABC):
 
         return instance
 
+    @callback
+    def async_apply_configuration(self, entity: TuyaEntity) -> bool:
+        """Take the description, unit and range of a number created from an updated configuration."""
+        if type(entity) is not type(self):
+            return False
+
+        self._async_apply_attributes(entity, NUMBER_CONFIGURATION_ATTRIBUTES)
+
+        return True
+
     @property
-    def device_classes(self) -> dict:
-        device_classes = self.tuya_device_configuration_manager.units
+    def units_index(self) -> UnitOfMeasurementIndex:
+        units_index = self.tuya_device_configuration_manager.units_index
 
-        return device_classes
+        return units_index
 
     @property
     def native_value(self) -> float | None:
@@ -116,13 +141,22 @@ class TuyaNumberEntity(TuyaEntity, NumberEntity, ABC):
         if not (value := self.device.status.get(self.entity_description.key)):
             return None
 
-        return self._number.scale_value(value)
+        scaled_value = self._number.scale_value(value)
+
+        if self._uom is not None:
+            return self._uom.conversion_fn(scaled_value)
+
+        return scaled_value
 
     def set_native_value(self, value: float) -> None:
         """Set new value."""
         if self._number is None:
             raise RuntimeError("Cannot set value, device doesn't provide type data")
 
+        if self._uom is not None:
+            # Rounded so the float error of the conversion does not truncate the raw value
+            value = round(self._uom.reverse_conversion_fn(value), 9)
+
         self._send_command(
             [
                 {
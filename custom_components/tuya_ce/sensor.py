@@ -1,22 +1,59 @@
 """Support for Tuya sensors."""
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import time
+from typing import Any
+
 from tuya_iot import TuyaDevice, TuyaDeviceManager
 from tuya_iot.device import TuyaDeviceStatusRange
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.components.tuya.const import DPCode, DPType
 from homeassistant.components.tuya.sensor import TuyaSensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, Platform, UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import StateType
 
-from .helpers.const import DOMAIN
+from .helpers.const import (
+    ATTR_AVERAGE,
+    ATTR_DEVICES,
+    ATTR_MAX,
+    ATTR_MIN,
+    CONF_COUNTER_SENSORS,
+    COUNTERS_UPDATE_INTERVAL,
+    DOMAIN,
+    INTEGRATION_DEVICE_NAME,
+    STATUS_HISTORY_DERIVATIVE,
+    STATUS_HISTORY_NAMES,
+    STATUS_HISTORY_RATE_OF_CHANGE,
+    STATUS_HISTORY_UPDATE_INTERVAL,
+)
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
 from .models.base import ElectricityTypeData, EnumTypeData, IntegerTypeData, TuyaEntity
-from .models.unit_of_measurement import ExtendedUnitOfMeasurement, UnitOfMeasurement
+from .models.energy_meter import TuyaEnergyMeter
+from .models.fleet_aggregate import TuyaFleetAggregate
+from .models.ha_tuya_data import HomeAssistantTuyaData
+from .models.integration_counters import TuyaIntegrationCounters
+from .models.status_history import TuyaStatusHistory
+from .models.unit_of_measurement import (
+    ExtendedUnitOfMeasurement,
+    UnitOfMeasurementIndex,
+)
 
 
 async def async_setup_entry(
@@ -29,6 +66,144 @@ async def async_setup_entry(
                                     async_add_entities,
                                     TuyaSensorEntity.create_entity)
 
+    hass_data: HomeAssistantTuyaData = hass.data[DOMAIN][entry.entry_id]
+
+    if entry.options.get(CONF_COUNTER_SENSORS, False):
+        counters = hass_data.device_manager.counters
+
+        async_add_entities(
+            [
+                TuyaCounterSensorEntity(entry, counters, description)
+                for description in COUNTER_SENSORS
+            ]
+        )
+
+    aggregate_manager = hass_data.aggregate_manager
+
+    if aggregate_manager is not None:
+        async_add_entities(
+            [
+                TuyaAggregateSensorEntity(entry, aggregate, aggregate_manager.get_signal(aggregate))
+                for aggregate in aggregate_manager.aggregates
+            ]
+        )
+
+    energy_manager = hass_data.energy_manager
+
+    if energy_manager is not None:
+        device_manager = hass_data.device_manager
+        device_map = device_manager.device_map
+
+        async_add_entities(
+            [
+                TuyaEnergySensorEntity(
+                    hass, device_map[meter.device_id], device_manager, meter, energy_manager.signal
+                )
+                for meter in energy_manager.meters
+                if meter.device_id in device_map
+            ]
+        )
+
+
+# Attributes of sensors derived from their description and unit, updated in place by configuration changes
+SENSOR_CONFIGURATION_ATTRIBUTES = (
+    "entity_description",
+    "_uom",
+    "_attr_native_unit_of_measurement",
+    "_attr_device_class",
+    "_attr_icon",
+)
+
+
+def _get_integration_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the virtual device of the config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        manufacturer="Tuya",
+        name=INTEGRATION_DEVICE_NAME,
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+
+def _get_total(counter: Counter[str]) -> int:
+    return sum(dict(counter).values())
+
+
+@dataclass
+class TuyaCounterSensorEntityDescription(SensorEntityDescription):
+    """Describes a hot path counter sensor."""
+
+    value_fn: Callable[[TuyaIntegrationCounters], StateType] = lambda counters: None
+    attributes_fn: Callable[[TuyaIntegrationCounters], dict[str, Any]] | None = None
+
+
+COUNTER_SENSORS: tuple[TuyaCounterSensorEntityDescription, ...] = (
+    TuyaCounterSensorEntityDescription(
+        key="mq_messages",
+        name="MQ messages",
+        icon="mdi:message-processing",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: _get_total(counters.mq_messages),
+        attributes_fn=lambda counters: dict(counters.mq_messages),
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="dispatches",
+        name="Dispatches",
+        icon="mdi:send",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: counters.dispatches,
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="state_writes",
+        name="State writes",
+        icon="mdi:database-edit",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: _get_total(counters.state_writes),
+        attributes_fn=lambda counters: dict(counters.state_writes),
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="find_dpcode_calls",
+        name="DP code lookups",
+        icon="mdi:magnify",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: counters.find_dpcode_calls,
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="find_dpcode_cache_hit_rate",
+        name="DP code cache hit rate",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters: counters.find_dpcode_cache_hit_rate,
+        attributes_fn=lambda counters: {
+            "hits": counters.find_dpcode_cache_hits,
+            "misses": counters.find_dpcode_cache_misses,
+        },
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="commands_sent",
+        name="Commands sent",
+        icon="mdi:remote",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: counters.commands_sent,
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="commands_failed",
+        name="Commands failed",
+        icon="mdi:remote-off",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: counters.commands_failed,
+    ),
+    TuyaCounterSensorEntityDescription(
+        key="api_calls",
+        name="API calls",
+        icon="mdi:api",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters: _get_total(counters.api_calls),
+        attributes_fn=lambda counters: dict(counters.api_calls),
+    ),
+)
+
 
 class TuyaSensorEntity(TuyaEntity, SensorEntity):
     """Tuya Sensor Entity."""
@@ -38,7 +213,7 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
     _status_range: TuyaDeviceStatusRange | None = None
     _type: DPType | None = None
     _type_data: IntegerTypeData | EnumTypeData | None = None
-    _uom: UnitOfMeasurement | None = None
+    _uom: ExtendedUnitOfMeasurement | None = None
 
     def __init__(
         self,
@@ -77,30 +252,14 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
         ):
             # We cannot have a device class, if the UOM isn't set or the
             # device class cannot be found in the validation mapping.
-            if (
-                self.native_unit_of_measurement is None
-                or self.device_class not in self.device_classes
-            ):
-                self._attr_device_class = None
-                return
-
-            uoms = self.device_classes[self.device_class]
-
-            native_uom = self.native_unit_of_measurement
-
-            uom = None
-            if native_uom in uoms:
-                uom = uoms.get(native_uom)
-            elif native_uom.lower() in uoms:
-                uom = uoms.get(native_uom.lower())
+            self._uom = self.units_index.get(
+                self.device_class, self.native_unit_of_measurement
+            )
 
-            if uom is None:
+            if self._uom is None:
                 self._attr_device_class = None
                 return
 
-            else:
-                self._uom = ExtendedUnitOfMeasurement.from_dict(uom)
-
             # If we still have a device class, we should not use an icon
             if self.device_class:
                 self._attr_icon = None
@@ -118,13 +277,80 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
                       description: TuyaSensorEntityDescription):
         instance = TuyaSensorEntity(hass, device, device_manager, description)
 
+        if device_manager.is_status_history_enabled and isinstance(instance.type_data, IntegerTypeData):
+            return [
+                instance,
+                TuyaStatusHistorySensorEntity(hass, device, device_manager, description, STATUS_HISTORY_DERIVATIVE),
+                TuyaStatusHistorySensorEntity(hass, device, device_manager, description, STATUS_HISTORY_RATE_OF_CHANGE),
+            ]
+
         return instance
 
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Statistics of held values change over time, without reports of the device
+        if self.device_manager.is_status_history_enabled and isinstance(self._type_data, IntegerTypeData):
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass, self._async_update_status_history, STATUS_HISTORY_UPDATE_INTERVAL
+                )
+            )
+
+    @callback
+    def _async_update_status_history(self, now: datetime) -> None:
+        if self.status_history is not None:
+            self.async_write_ha_state()
+
+    @callback
+    def async_apply_configuration(self, entity: TuyaEntity) -> bool:
+        """Take the description and unit of a sensor created from an updated configuration."""
+        if type(entity) is not type(self):
+            return False
+
+        self._async_apply_attributes(entity, SENSOR_CONFIGURATION_ATTRIBUTES)
+
+        return True
+
+    @property
+    def type_data(self) -> IntegerTypeData | EnumTypeData | None:
+        return self._type_data
+
+    @property
+    def status_history(self) -> TuyaStatusHistory | None:
+        return self.device_manager.get_status_history(self.device.id, self.entity_description.key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the minimum, maximum and time weighted average of the recent values of integer sensors."""
+        if not isinstance(self._type_data, IntegerTypeData) or self.entity_description.subkey is not None:
+            return None
+
+        status_history = self.status_history
+
+        if status_history is None or status_history.count == 0:
+            return None
+
+        attributes = {
+            ATTR_MIN: self._get_scaled_value(status_history.minimum),
+            ATTR_MAX: self._get_scaled_value(status_history.maximum),
+            ATTR_AVERAGE: round(self._get_scaled_value(status_history.get_average(time.time())), 3),
+        }
+
+        return attributes
+
+    def _get_scaled_value(self, value: float | int) -> float:
+        scaled_value: float = self._type_data.scale_value(value)
+        if self._uom and self._uom.conversion_fn is not None:
+            return self._uom.conversion_fn(scaled_value)
+        return scaled_value
+
     @property
-    def device_classes(self) -> dict:
-        device_classes = self.tuya_device_configuration_manager.units
+    def units_index(self) -> UnitOfMeasurementIndex:
+        units_index = self.tuya_device_configuration_manager.units_index
 
-        return device_classes
+        return units_index
 
     @property
     def native_value(self) -> StateType:
@@ -146,10 +372,7 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
 
         # Scale integer/float value
         if isinstance(self._type_data, IntegerTypeData):
-            scaled_value: float = self._type_data.scale_value(value)
-            if self._uom and self._uom.conversion_fn is not None:
-                return self._uom.conversion_fn(scaled_value)
-            return scaled_value
+            return self._get_scaled_value(value)
 
         # Unexpected enum value
         if (
@@ -173,3 +396,192 @@ class TuyaSensorEntity(TuyaEntity, SensorEntity):
 
         # Valid string or enum value
         return value
+
+
+class TuyaCounterSensorEntity(SensorEntity):
+    """Hot path counter of a config entry, updated on a slow interval."""
+
+    entity_description: TuyaCounterSensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        counters: TuyaIntegrationCounters,
+        description: TuyaCounterSensorEntityDescription,
+    ) -> None:
+        """Init Tuya counter sensor."""
+        self.entity_description = description
+        self._counters = counters
+
+        self._attr_unique_id = f"{entry.entry_id}_counter_{description.key}"
+        self._attr_device_info = _get_integration_device_info(entry)
+
+        self._update_counters()
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_update_counters, COUNTERS_UPDATE_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_update_counters(self, now: datetime) -> None:
+        self._update_counters()
+        self.async_write_ha_state()
+
+    def _update_counters(self) -> None:
+        description = self.entity_description
+
+        self._attr_native_value = description.value_fn(self._counters)
+
+        if description.attributes_fn is not None:
+            self._attr_extra_state_attributes = description.attributes_fn(self._counters)
+
+
+class TuyaAggregateSensorEntity(SensorEntity):
+    """Fleet aggregate of a config entry, written only when a contribution changes."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:sigma"
+
+    def __init__(self, entry: ConfigEntry, aggregate: TuyaFleetAggregate, signal: str) -> None:
+        """Init Tuya aggregate sensor."""
+        self._aggregate = aggregate
+        self._signal = signal
+
+        self._attr_name = aggregate.name
+        self._attr_unique_id = f"{entry.entry_id}_aggregate_{aggregate.key}"
+        self._attr_native_unit_of_measurement = aggregate.unit
+        self._attr_device_info = _get_integration_device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._signal, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        return self._aggregate.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return {ATTR_DEVICES: self._aggregate.devices}
+
+
+class TuyaStatusHistorySensorEntity(TuyaSensorEntity):
+    """Change over time of an integer sensor, calculated from the recent values of its DP."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: TuyaDevice,
+        device_manager: TuyaDeviceManager,
+        description: TuyaSensorEntityDescription,
+        kind: str,
+    ) -> None:
+        """Init Tuya status history sensor."""
+        super().__init__(hass, device, device_manager, description)
+
+        self._kind = kind
+
+        unit = self.native_unit_of_measurement
+        name = self.name
+
+        self._attr_unique_id = f"{self._attr_unique_id}_{kind}"
+        self._attr_name = STATUS_HISTORY_NAMES[kind].capitalize() if name is None else f"{name} {STATUS_HISTORY_NAMES[kind]}"
+        self._attr_native_unit_of_measurement = None if unit is None else f"{unit}/h"
+        self._attr_device_class = None
+        self._attr_icon = "mdi:chart-line"
+
+    @callback
+    def async_apply_configuration(self, entity: TuyaEntity) -> bool:
+        """Take the description, name and unit of a status history sensor created from an updated configuration."""
+        if type(entity) is not type(self):
+            return False
+
+        self._async_apply_attributes(entity, (*SENSOR_CONFIGURATION_ATTRIBUTES, "_attr_name"))
+
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the change per hour of the sensor value."""
+        status_history = self.status_history
+
+        if status_history is None:
+            return None
+
+        now = time.time()
+
+        if self._kind == STATUS_HISTORY_DERIVATIVE:
+            slope = status_history.get_derivative(now)
+        else:
+            slope = status_history.get_rate_of_change(now)
+
+        if slope is None:
+            return None
+
+        # Unit conversions are linear, the converted slope is the difference to the converted zero
+        slope_per_hour = (self._get_scaled_value(slope) - self._get_scaled_value(0)) * 3600
+
+        return round(slope_per_hour, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return None
+
+
+class TuyaEnergySensorEntity(TuyaEntity, SensorEntity):
+    """Energy integrated locally from the power DP of a device."""
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_name = "Calculated energy"
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: TuyaDevice,
+        device_manager: TuyaDeviceManager,
+        meter: TuyaEnergyMeter,
+        signal: str,
+    ) -> None:
+        """Init Tuya energy sensor."""
+        super().__init__(hass, device, device_manager)
+
+        self._meter = meter
+        self._signal = signal
+
+        self._attr_unique_id = f"{super().unique_id}{meter.code}_energy"
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Energy of devices without reports grows on the integration interval
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._signal, self._async_dispatch_device_update)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return available even while offline, the integrated energy is kept."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the integrated energy."""
+        return round(self._meter.energy, 3)
@@ -8,16 +8,48 @@ from tuya_iot import TuyaDevice, TuyaDeviceManager
 
 from homeassistant.components.tuya import DPCode
 from homeassistant.components.tuya.const import DPType
-from homeassistant.components.vacuum import StateVacuumEntity, VacuumEntityFeature
+from homeassistant.components.vacuum import (
+    STATE_CLEANING,
+    STATE_DOCKED,
+    STATE_RETURNING,
+    StateVacuumEntity,
+    VacuumEntityFeature,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_PAUSED, Platform
+from homeassistant.const import STATE_IDLE, STATE_PAUSED, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .helpers.const import TUYA_MODE_RETURN_HOME, TUYA_STATUS_TO_HA
 from .managers.tuya_configuration_manager import TuyaConfigurationManager
 from .models.base import EnumTypeData, IntegerTypeData, TuyaEntity
 
+TUYA_MODE_RETURN_HOME = "chargego"
+TUYA_STATUS_TO_HA = {
+    "charge_done": STATE_DOCKED,
+    "chargecompleted": STATE_DOCKED,
+    "chargego": STATE_DOCKED,
+    "charging": STATE_DOCKED,
+    "cleaning": STATE_CLEANING,
+    "docking": STATE_RETURNING,
+    "goto_charge": STATE_RETURNING,
+    "goto_pos": STATE_CLEANING,
+    "mop_clean": STATE_CLEANING,
+    "part_clean": STATE_CLEANING,
+    "paused": STATE_PAUSED,
+    "pick_zone_clean": STATE_CLEANING,
+    "pos_arrived": STATE_CLEANING,
+    "pos_unarrive": STATE_CLEANING,
+    "random": STATE_CLEANING,
+    "sleep": STATE_IDLE,
+    "smart_clean": STATE_CLEANING,
+    "smart": STATE_CLEANING,
+    "spot_clean": STATE_CLEANING,
+    "standby": STATE_IDLE,
+    "wall_clean": STATE_CLEANING,
+    "wall_follow": STATE_CLEANING,
+    "zone_clean": STATE_CLEANING,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
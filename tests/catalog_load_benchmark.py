@@ -0,0 +1,88 @@
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from custom_components.tuya_ce.helpers.catalog import decode_catalog
+from custom_components.tuya_ce.helpers.const import CATALOG_CONFIG, TUYA_CONFIGURATIONS
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+ITERATIONS = int(os.environ.get("ITERATIONS", 100))
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Test:
+    """Measure the load time and memory of the catalog against the configuration files."""
+
+    def __init__(self):
+        """Do initialization of test class instance, Returns None."""
+        self._catalog = self._read(CATALOG_CONFIG)
+        self._configurations = {config_file: self._read(config_file) for config_file in TUYA_CONFIGURATIONS}
+
+    def run(self):
+        assert self._load_catalog() == self._load_configurations()
+
+        for name, content_size, load in (
+            ("Configuration files", sum(len(content) for content in self._configurations.values()), self._load_configurations),
+            ("Catalog", len(self._catalog), self._load_catalog),
+        ):
+            duration, size = self._measure(load)
+
+            _LOGGER.info(
+                f"{name}, "
+                f"File size: {content_size / 1024:.0f} KB, "
+                f"Load time: {duration * 1000:.2f} ms, "
+                f"Memory: {size / 1024:.0f} KB"
+            )
+
+    def _load_catalog(self) -> dict:
+        return decode_catalog(json.loads(self._catalog))
+
+    def _load_configurations(self) -> dict:
+        return {config_file: json.loads(content) for config_file, content in self._configurations.items()}
+
+    @staticmethod
+    def _measure(load) -> tuple[float, int]:
+        started = time.perf_counter()
+
+        for _ in range(ITERATIONS):
+            load()
+
+        duration = (time.perf_counter() - started) / ITERATIONS
+
+        gc.collect()
+        tracemalloc.start()
+
+        data = load()
+
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        del data
+
+        return duration, size
+
+    @staticmethod
+    def _read(config_file: str) -> str:
+        with open(f"config/{config_file}.json") as file:
+            return file.read()
+
+
+instance = Test()
+instance.run()
@@ -0,0 +1,193 @@
+import asyncio
+from dataclasses import dataclass
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from tuya_iot import TuyaDevice
+from tuya_iot.device import TuyaDeviceFunction, TuyaDeviceStatusRange
+
+from custom_components.tuya_ce.helpers.const import DEVICE_CONFIG_MANAGER, DOMAIN
+from custom_components.tuya_ce.managers.tuya_configuration_manager import TuyaConfigurationManager
+from custom_components.tuya_ce.models.base import TuyaEntity
+from homeassistant.components.tuya.const import DPCode, DPType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+ENTITIES_PER_DEVICE = int(os.environ.get("ENTITIES_PER_DEVICE", 5))
+SCHEMAS = int(os.environ.get("SCHEMAS", 500))
+MODES = ["auto", "manual", "eco", "sleep", "boost", "away"]
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BenchmarkEntity(TuyaEntity):
+    """Entity parsing an integer and an enum specification, like number and select entities."""
+
+    def __init__(self, hass, device, device_manager, index: int):
+        super().__init__(hass, device, device_manager)
+
+        self._attr_unique_id = f"{super().unique_id}{index}"
+        self._integer_type = self.find_dpcode(DPCode.TEMP_SET, dptype=DPType.INTEGER, prefer_function=True)
+        self._enum_type = self.find_dpcode(DPCode.MODE, dptype=DPType.ENUM, prefer_function=True)
+
+
+@dataclass
+class LegacyIntegerTypeData:
+    """Integer type data of the previous layout, without slots."""
+
+    dpcode: DPCode
+    min: int
+    max: int
+    scale: float
+    step: float
+    unit: str | None = None
+    type: str | None = None
+
+
+@dataclass
+class LegacyEnumTypeData:
+    """Enum type data of the previous layout, without slots."""
+
+    dpcode: DPCode
+    range: list[str]
+
+
+class LegacyBenchmarkEntity(Entity):
+    """Entity of the previous layout, referencing the device and managers and parsing its own type data."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, hass, device, device_manager, index: int):
+        self._attr_unique_id = f"tuya.{device.id}{index}"
+        self.device = device
+        self.device_manager = device_manager
+        self.hass = hass
+
+        integration_data = self.hass.data[DOMAIN]
+        self.tuya_device_configuration_manager = integration_data.get(DEVICE_CONFIG_MANAGER)
+
+        integer_data = json.loads(device.function[DPCode.TEMP_SET].values)
+        enum_data = json.loads(device.function[DPCode.MODE].values)
+
+        self._integer_type = LegacyIntegerTypeData(
+            DPCode.TEMP_SET,
+            min=int(integer_data["min"]),
+            max=int(integer_data["max"]),
+            scale=float(integer_data["scale"]),
+            step=max(float(integer_data["step"]), 1),
+            unit=integer_data.get("unit"),
+        )
+        self._enum_type = LegacyEnumTypeData(DPCode.MODE, **enum_data)
+
+
+class Test:
+    """Measure the memory used by entities of the previous and the current layout."""
+
+    def __init__(self):
+        """Do initialization of test class instance, Returns None."""
+        self._hass: HomeAssistant | None = None
+
+    async def run(self):
+        with tempfile.TemporaryDirectory() as config_dir:
+            self._hass = HomeAssistant()
+            self._hass.config.config_dir = config_dir
+
+            for count in (10000, 50000):
+                devices = [self._get_device(index) for index in range(count // ENTITIES_PER_DEVICE)]
+
+                legacy_size = self._measure("Previous", LegacyBenchmarkEntity, devices)
+                size = self._measure("Current", BenchmarkEntity, devices)
+
+                _LOGGER.info(
+                    f"Entities: {count}, "
+                    f"Schemas: {min(SCHEMAS, len(devices))}, "
+                    f"Reduction: {(1 - size / legacy_size) * 100:.0f}%"
+                )
+
+            await self._hass.async_stop(force=True)
+
+    def _measure(self, layout: str, entity_class: type, devices: list[TuyaDevice]) -> int:
+        # Each layout starts without device contexts and capability profiles
+        self._hass.data[DOMAIN] = {DEVICE_CONFIG_MANAGER: TuyaConfigurationManager(self._hass)}
+
+        gc.collect()
+        tracemalloc.start()
+
+        entities = [
+            entity_class(self._hass, device, None, index)
+            for device in devices
+            for index in range(ENTITIES_PER_DEVICE)
+        ]
+
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        _LOGGER.info(
+            f"{layout} layout, "
+            f"Entities: {len(entities)}, "
+            f"Devices: {len(devices)}, "
+            f"Memory: {size / 1024 / 1024:.1f} MB, "
+            f"Per entity: {size / len(entities):.0f} bytes"
+        )
+
+        return size
+
+    @staticmethod
+    def _get_device(index: int) -> TuyaDevice:
+        # Devices are spread over product schemas differing by their ranges
+        schema = index % SCHEMAS
+
+        functions = {
+            DPCode.TEMP_SET: TuyaDeviceFunction(
+                code=DPCode.TEMP_SET,
+                type=DPType.INTEGER,
+                values=json.dumps({"unit": "℃", "min": 5, "max": 35 + schema, "scale": schema % 2, "step": 1}),
+            ),
+            DPCode.MODE: TuyaDeviceFunction(
+                code=DPCode.MODE,
+                type=DPType.ENUM,
+                values=json.dumps({"range": MODES[:3 + schema % 4]}),
+            ),
+        }
+
+        status_range = {
+            code: TuyaDeviceStatusRange(code=code, type=function.type, values=function.values)
+            for code, function in functions.items()
+        }
+
+        device = TuyaDevice(
+            id=f"device_{index}",
+            name=f"Device {index}",
+            category="wk",
+            product_id=f"product_{schema}",
+            product_name="Thermostat",
+            online=True,
+            status={DPCode.TEMP_SET: 20, DPCode.MODE: "auto"},
+            function=functions,
+            status_range=status_range,
+        )
+
+        return device
+
+
+instance = Test()
+asyncio.run(instance.run())
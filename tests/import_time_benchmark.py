@@ -0,0 +1,110 @@
+import logging
+import os
+import subprocess
+import sys
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+TOP_ENTRIES = int(os.environ.get("TOP_ENTRIES", 15))
+REPEATS = int(os.environ.get("REPEATS", 5))
+
+# Imported by Home Assistant before loading the integration, excluded from the measurement
+BASELINE_MODULES = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.aiohttp_client",
+]
+
+INTEGRATION_MODULES = [
+    "custom_components.tuya_ce",
+    "custom_components.tuya_ce.config_flow",
+    "custom_components.tuya_ce.switch",
+    "custom_components.tuya_ce.sensor",
+]
+
+BASELINE_MARKER = "baseline imported"
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Test:
+    """Measure the import time of the integration modules using -X importtime."""
+
+    def __init__(self):
+        """Do initialization of test class instance, Returns None."""
+        self._repository_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run(self):
+        for module in INTEGRATION_MODULES:
+            # Fastest run is the least disturbed by other processes
+            imports = min(
+                [self._get_imports(module) for _ in range(REPEATS)],
+                key=lambda items: sum(self_time for _, self_time in items)
+            )
+
+            total = sum(self_time for _, self_time in imports)
+
+            packages = {}
+
+            for name, self_time in imports:
+                package = name.strip().split(".")[0]
+                packages[package] = packages.get(package, 0) + self_time
+
+            _LOGGER.info(f"{module}, Modules: {len(imports)}, Import time: {total / 1000:.0f} ms")
+
+            for package, self_time in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:TOP_ENTRIES]:
+                _LOGGER.info(f"  {package}: {self_time / 1000:.1f} ms")
+
+            if DEBUG:
+                for name, self_time in sorted(imports, key=lambda item: item[1], reverse=True)[:TOP_ENTRIES]:
+                    _LOGGER.debug(f"  {name.strip()}: {self_time / 1000:.1f} ms")
+
+    def _get_imports(self, module: str) -> list[tuple[str, int]]:
+        """Return the modules imported by the module on top of the baseline, with their self time in us."""
+        code = "; ".join([
+            "import sys",
+            *[f"import {baseline_module}" for baseline_module in BASELINE_MODULES],
+            f"sys.stderr.write('{BASELINE_MARKER}\\n')",
+            f"import {module}",
+        ])
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=self._repository_path,
+            capture_output=True,
+            text=True,
+        )
+
+        if process.returncode != 0:
+            _LOGGER.error(f"Failed to import {module}, Error: {process.stderr.splitlines()[-1]}")
+
+        lines = process.stderr.splitlines()
+        lines = lines[lines.index(BASELINE_MARKER) + 1:] if BASELINE_MARKER in lines else []
+
+        imports = []
+
+        for line in lines:
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+
+            self_time, _, name = line.removeprefix("import time:").split("|")
+
+            imports.append((name, int(self_time)))
+
+        return imports
+
+
+instance = Test()
+instance.run()
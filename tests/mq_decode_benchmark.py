@@ -0,0 +1,161 @@
+import base64
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from types import SimpleNamespace
+
+from Crypto.Cipher import AES
+from Crypto.Random import get_random_bytes
+from tuya_iot import AuthType, TuyaOpenMQ
+from tuya_iot.openmq import GCM_TAG_LENGTH
+
+from custom_components.tuya_ce.managers.tuya_mq import TuyaMQ
+from custom_components.tuya_ce.models.base import ElectricityTypeData
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+MESSAGES = int(os.environ.get("MESSAGES", 20000))
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+PASSWORD = "0123456789abcdefghijklmnopqrstuv"
+
+class Test:
+    """Measure messages per second through the MQ decode path."""
+
+    def __init__(self):
+        """Do initialization of test class instance, Returns None."""
+        self._key = PASSWORD[8:24].encode("utf8")
+        self._mq_config = SimpleNamespace(password=PASSWORD)
+
+    def run(self):
+        for auth_type in (AuthType.SMART_HOME, AuthType.CUSTOM):
+            api = SimpleNamespace(auth_type=auth_type)
+            payloads = [self._get_payload(auth_type, index) for index in range(MESSAGES)]
+
+            sdk_mq = TuyaOpenMQ(api)
+            tuya_mq = TuyaMQ(api)
+
+            without_cache = self._measure(lambda payload: self._sdk_decode(sdk_mq, payload), payloads)
+            with_cache = self._measure(lambda payload: tuya_mq._decode_payload(payload, self._mq_config), payloads)
+
+            _LOGGER.info(
+                f"{auth_type.name}, "
+                f"Messages: {MESSAGES}, "
+                f"Without cache: {without_cache:.0f} msg/s, "
+                f"With cache: {with_cache:.0f} msg/s, "
+                f"Speedup: {with_cache / without_cache:.2f}x"
+            )
+
+            messages = [tuya_mq._decode_payload(payload, self._mq_config) for payload in payloads]
+
+            self._measure_raw_decode(auth_type, messages)
+
+    @staticmethod
+    def _measure_raw_decode(auth_type: AuthType, messages: list[dict]):
+        """Decode the RAW phase payloads of the messages one at a time and as a single batch."""
+        raw_values = [
+            status["value"]
+            for message in messages
+            for status in message["data"]["status"]
+            if status["code"] == "phase_a"
+        ]
+
+        # NumPy is imported on first use, keep it out of the measurement
+        ElectricityTypeData.from_raw_batch(raw_values[:1])
+
+        started = time.perf_counter()
+        single = [ElectricityTypeData.from_raw(raw_value) for raw_value in raw_values]
+        single_duration = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batch = ElectricityTypeData.from_raw_batch(raw_values)
+        batch_duration = time.perf_counter() - started
+
+        for index, values in enumerate(single):
+            assert float(values.voltage) == batch.voltage[index]
+            assert float(values.electriccurrent) == batch.electriccurrent[index]
+            assert float(values.power) == batch.power[index]
+
+        _LOGGER.info(
+            f"{auth_type.name}, "
+            f"RAW payloads: {len(raw_values)}, "
+            f"Single: {len(raw_values) / single_duration:.0f} payload/s, "
+            f"Batch: {len(raw_values) / batch_duration:.0f} payload/s, "
+            f"Speedup: {single_duration / batch_duration:.2f}x"
+        )
+
+    def _sdk_decode(self, sdk_mq: TuyaOpenMQ, payload: bytes) -> dict:
+        """Decode the same way TuyaOpenMQ._on_message does."""
+        msg_dict = json.loads(payload.decode("utf8"))
+        msg_dict["data"] = sdk_mq._decode_mq_message(msg_dict["data"], self._mq_config.password, msg_dict.get("t", ""))
+
+        return msg_dict
+
+    @staticmethod
+    def _measure(decode, payloads: list[bytes]) -> float:
+        started = time.perf_counter()
+
+        for payload in payloads:
+            decode(payload)
+
+        duration = time.perf_counter() - started
+
+        return len(payloads) / duration
+
+    def _get_payload(self, auth_type: AuthType, index: int) -> bytes:
+        t = int(time.time() * 1000)
+
+        # Voltage (2 bytes), current and power (3 bytes each) of an energy meter phase
+        phase = struct.pack(">H", 2200 + index % 100) + struct.pack(">L", index)[1:] + struct.pack(">L", index * 7)[1:]
+
+        data = json.dumps({
+            "devId": f"device_{index % 100}",
+            "productKey": "product",
+            "status": [
+                {"code": "switch_1", "value": index % 2 == 0, "t": t},
+                {"code": "cur_power", "value": index, "t": t},
+                {"code": "phase_a", "value": base64.b64encode(phase).decode("utf8"), "t": t},
+            ],
+        }).encode("utf8")
+
+        if auth_type == AuthType.SMART_HOME:
+            padding_bytes = 16 - len(data) % 16
+            data += bytes([padding_bytes]) * padding_bytes
+
+            buffer = AES.new(self._key, AES.MODE_ECB).encrypt(data)
+
+        else:
+            iv_buffer = get_random_bytes(12)
+
+            cipher = AES.new(self._key, AES.MODE_GCM, nonce=iv_buffer, mac_len=GCM_TAG_LENGTH)
+            cipher.update(str(t).encode("utf8"))
+            data_buffer, tag_buffer = cipher.encrypt_and_digest(data)
+
+            buffer = len(iv_buffer).to_bytes(4, byteorder="big") + iv_buffer + data_buffer + tag_buffer
+
+        payload = json.dumps({
+            "protocol": 4,
+            "pv": "2.0",
+            "t": t,
+            "data": base64.b64encode(buffer).decode("utf8"),
+        }).encode("utf8")
+
+        return payload
+
+
+instance = Test()
+instance.run()
@@ -0,0 +1,87 @@
+"""Tests of the contexts of entities written by update windows."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from tuya_iot import TuyaDevice
+
+from custom_components.tuya_ce.helpers.const import DEVICE_CONFIG_MANAGER, DOMAIN
+from custom_components.tuya_ce.models.base import TuyaEntity
+from custom_components.tuya_ce.models.device_context import TuyaDeviceContext
+from homeassistant.core import Context
+
+
+class RecordingEntity(TuyaEntity):
+    """Entity recording the context of each state write instead of writing to the state machine."""
+
+    def __init__(self, hass, device: TuyaDevice) -> None:
+        super().__init__(hass, device, None)
+
+        self.platform = SimpleNamespace(domain="switch")
+        self.written_contexts: list[Context | None] = []
+
+    def async_write_ha_state(self) -> None:
+        self.written_contexts.append(self._context)
+
+
+@pytest.fixture
+def hass() -> SimpleNamespace:
+    configuration_manager = SimpleNamespace(
+        get_device_context=lambda device, device_manager: TuyaDeviceContext(device, device_manager, None)
+    )
+
+    return SimpleNamespace(data={DOMAIN: {DEVICE_CONFIG_MANAGER: configuration_manager}})
+
+
+def _get_entity(hass, index: int) -> RecordingEntity:
+    device = TuyaDevice(
+        id=f"device_{index}",
+        name=f"Device {index}",
+        category="kg",
+        product_id="product",
+        product_name="Switch",
+        online=True,
+        status={},
+        function={},
+        status_range={},
+    )
+
+    return RecordingEntity(hass, device)
+
+
+def test_windows_within_recent_time_keep_their_context(hass):
+    entities = [_get_entity(hass, index) for index in range(2)]
+
+    first_context = Context()
+    second_context = Context()
+
+    # Both windows are written well within the recent time of a context (5 seconds)
+    for context in (first_context, second_context):
+        for entity in entities:
+            entity._async_handle_device_update(context)
+
+    for entity in entities:
+        assert entity.written_contexts == [first_context, second_context]
+
+
+def test_recent_service_call_context_is_kept(hass):
+    entity = _get_entity(hass, 0)
+
+    service_context = Context(user_id="user")
+    entity.async_set_context(service_context)
+
+    entity._async_handle_device_update(Context())
+
+    assert entity.written_contexts == [service_context]
+
+
+def test_automation_context_is_kept(hass):
+    entity = _get_entity(hass, 0)
+
+    automation_context = Context(parent_id="parent")
+    entity.async_set_context(automation_context)
+
+    entity._async_handle_device_update(Context())
+
+    assert entity.written_contexts == [automation_context]